@@ -0,0 +1,40 @@
+"""Lazy package exports (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a package's ``__getattr__`` and ``__dir__`` for lazily imported exports.
+
+    A submodule is imported the first time one of its exports is accessed,
+    so importing a package, or one of its lightweight submodules, does not
+    pull in pandas or pyarrow through its siblings.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> module that defines it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
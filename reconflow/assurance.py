@@ -0,0 +1,324 @@
+"""Assurance controls: rules over run metrics and result records."""
+
+from __future__ import annotations
+
+import ast
+import operator
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from reconflow.config import AssuranceControl
+from reconflow.report.summary import ARTIFACTS
+
+# Names a rule can use for the run's totals and metrics
+METRICS = (*ARTIFACTS, "total_source", "pool_match_pct")
+
+_COMPARE = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+def _nan_if_zero(divide: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """Division giving NaN rather than an error or infinity for a zero divisor."""
+
+    def safe(a: Any, b: Any) -> Any:
+        if isinstance(b, pd.Series):
+            return divide(a, b.where(b != 0))
+        return divide(a, np.nan if b == 0 else b)
+
+    return safe
+
+
+_BINARY = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: _nan_if_zero(operator.truediv),
+    ast.Mod: _nan_if_zero(operator.mod),
+}
+
+_UNARY = {
+    ast.Not: np.logical_not,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_FUNCTIONS = {"abs": abs}
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+class Rule:
+    """
+    A control rule, parsed and compiled once.
+
+    Rules are Python expressions restricted to comparisons, ``and``/``or``/
+    ``not``, arithmetic, ``in`` against a list of constants and ``abs()``.
+    A rule either uses run metrics by name (``pool_match_pct >= 99``,
+    ``missing_in_target == 0``) or columns of one result bucket as
+    ``bucket.column`` (``amount_mismatches._amt_diff < 5``). Column rules are
+    evaluated on whole columns at once and must hold for every record;
+    comparisons with missing values are false. Division by zero gives NaN,
+    so a rule dividing by a zero total fails rather than raising.
+
+    The syntax tree is checked against this whitelist and compiled into
+    nested closures, so evaluation never calls ``eval`` and cannot reach
+    attributes, subscripts or other functions.
+
+    Args:
+        text: Rule expression
+
+    Raises:
+        ValueError: If the rule is not valid or uses unsupported syntax
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.metrics: set[str] = set()
+        self.buckets: set[str] = set()
+
+        try:
+            tree = ast.parse(text, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid rule {text!r}: {e.msg}") from e
+
+        self._evaluate = self._compile(tree.body)
+        if not _is_boolean(tree.body):
+            raise ValueError(f"Rule {text!r} must be a comparison, 'in' test or and/or/not of them")
+
+        if len(self.buckets) > 1:
+            raise ValueError(f"Rule {text!r} uses columns of more than one bucket")
+        if self.buckets and self.metrics:
+            raise ValueError(f"Rule {text!r} mixes run metrics and record columns")
+
+    @property
+    def bucket(self) -> str | None:
+        """Bucket whose records the rule checks, or None for a metric rule."""
+        return next(iter(self.buckets), None)
+
+    def evaluate(self, values: Mapping[str, Any]) -> Any:
+        """
+        Evaluate the rule.
+
+        Args:
+            values: Metrics by name, or the bucket's records for a column rule
+
+        Returns:
+            bool for a metric rule, boolean Series for a column rule
+        """
+        return self._evaluate(values)
+
+    def _unsupported(self, node: ast.AST) -> ValueError:
+        return ValueError(f"Unsupported syntax in rule {self.text!r}: {type(node).__name__}")
+
+    def _compile(self, node: ast.AST) -> Evaluator:
+        if isinstance(node, ast.Constant) and isinstance(node.value, int | float | str | None):
+            value = node.value
+            return lambda values: value
+
+        if isinstance(node, ast.Name):
+            if node.id not in METRICS:
+                raise ValueError(f"Unknown metric in rule {self.text!r}: {node.id}")
+            self.metrics.add(node.id)
+            name = node.id
+            return lambda values: values[name]
+
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id not in ARTIFACTS:
+                raise ValueError(f"Unknown bucket in rule {self.text!r}: {node.value.id}")
+            self.buckets.add(node.value.id)
+            column = node.attr
+            return lambda values: values[column]
+
+        if isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            operands = [self._compile(value) for value in node.values]
+
+            def boolean(values: Mapping[str, Any]) -> Any:
+                result = operands[0](values)
+                for operand in operands[1:]:
+                    result = combine(result, operand(values))
+                return result
+
+            return boolean
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+            unary, operand = _UNARY[type(node.op)], self._compile(node.operand)
+            return lambda values: unary(operand(values))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+            binary = _BINARY[type(node.op)]
+            left, right = self._compile(node.left), self._compile(node.right)
+            return lambda values: binary(left(values), right(values))
+
+        if isinstance(node, ast.Compare):
+            return self._compile_compare(node)
+
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in _FUNCTIONS
+            and not node.keywords
+        ):
+            function = _FUNCTIONS[node.func.id]
+            args = [self._compile(arg) for arg in node.args]
+            return lambda values: function(*(arg(values) for arg in args))
+
+        raise self._unsupported(node)
+
+    def _compile_compare(self, node: ast.Compare) -> Evaluator:
+        left = self._compile(node.left)
+
+        if isinstance(node.ops[0], ast.In | ast.NotIn):
+            if len(node.ops) > 1:
+                raise ValueError(f"Rule {self.text!r}: 'in' cannot be chained")
+            members = self._constants(node.comparators[0])
+            negate = isinstance(node.ops[0], ast.NotIn)
+            return lambda values: _membership(left(values), members, negate)
+
+        if not all(type(op) in _COMPARE for op in node.ops):
+            raise self._unsupported(next(op for op in node.ops if type(op) not in _COMPARE))
+        checks = [_COMPARE[type(op)] for op in node.ops]
+        operands = [left, *(self._compile(comparator) for comparator in node.comparators)]
+
+        def compare(values: Mapping[str, Any]) -> Any:
+            evaluated = [operand(values) for operand in operands]
+            result = True
+            for check, a, b in zip(checks, evaluated, evaluated[1:], strict=False):
+                result = np.logical_and(result, _false_if_missing(check(a, b), a, b))
+            return result
+
+        return compare
+
+    def _constants(self, node: ast.AST) -> tuple[Any, ...]:
+        """Members of a constant list, tuple or set on the right of ``in``."""
+        if not isinstance(node, ast.List | ast.Tuple | ast.Set):
+            raise self._unsupported(node)
+        if not all(isinstance(element, ast.Constant) for element in node.elts):
+            raise ValueError(f"Rule {self.text!r}: 'in' needs a list of constants")
+        return tuple(element.value for element in node.elts)
+
+
+def _is_boolean(node: ast.AST) -> bool:
+    """Whether an expression gives a truth value: a comparison, or and/or/not of them."""
+    if isinstance(node, ast.Compare):
+        return True
+    if isinstance(node, ast.BoolOp):
+        return all(_is_boolean(value) for value in node.values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _is_boolean(node.operand)
+    return False
+
+
+def _membership(value: Any, members: tuple[Any, ...], negate: bool) -> Any:
+    """Whether a value, or each value of a column, is one of ``members``."""
+    found = value.isin(members) if isinstance(value, pd.Series) else value in members
+    return np.logical_not(found) if negate else found
+
+
+def _false_if_missing(result: Any, *operands: Any) -> Any:
+    """Comparison result as False where it or an operand is missing (NA or NaN)."""
+    missing = result is pd.NA
+    for operand in operands:
+        missing = np.logical_or(missing, pd.isna(operand))
+    if isinstance(result, pd.Series):
+        return result.fillna(False).astype(bool) & np.logical_not(missing)
+    return not missing and bool(result)
+
+
+class ControlSet:
+    """
+    Evaluate a pipeline's assurance controls over a run.
+
+    Column rules are evaluated on each batch of result records as it is
+    produced (e.g. one out-of-core partition), accumulating failing record
+    counts; metric rules are evaluated once the run's totals are known.
+
+    Args:
+        controls: Configured controls; their rules are compiled here
+
+    Raises:
+        ValueError: If a rule is invalid, naming the control
+    """
+
+    def __init__(self, controls: list[AssuranceControl]) -> None:
+        self.controls = controls
+        self.rules = []
+        for control in controls:
+            try:
+                self.rules.append(Rule(control.rule))
+            except ValueError as e:
+                raise ValueError(f"Control {control.id}: {e}") from e
+        self.failing_rows = [0] * len(controls)
+
+    def observe(self, frames: Mapping[str, pd.DataFrame]) -> None:
+        """
+        Evaluate the column rules on a batch of result records.
+
+        Args:
+            frames: Result records by bucket
+
+        Raises:
+            ValueError: If a rule names a missing column or cannot be evaluated
+                on its column types, naming the control
+        """
+        for i, (control, rule) in enumerate(zip(self.controls, self.rules, strict=True)):
+            frame = frames.get(rule.bucket) if rule.bucket else None
+            if frame is None or frame.empty:
+                continue
+            try:
+                passed = rule.evaluate(frame)
+            except KeyError as e:
+                raise ValueError(f"Control {control.id}: no column {e} in {rule.bucket}") from e
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Control {control.id}: rule {rule.text!r} failed: {e}") from e
+            self.failing_rows[i] += len(frame) - int(np.sum(passed))
+
+    def finish(self, metrics: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Evaluate the metric rules and collect every control's outcome.
+
+        Args:
+            metrics: Run totals and metrics by name
+
+        Returns:
+            Outcomes for ``summary.json``: one entry per control, plus the
+            number of failed and failed CRITICAL controls
+        """
+        # Artifacts of stages that did not run have no records
+        metrics = {**dict.fromkeys(ARTIFACTS, 0), **metrics}
+        outcomes = []
+        for control, rule, failing in zip(
+            self.controls, self.rules, self.failing_rows, strict=True
+        ):
+            if rule.bucket is None:
+                passed = bool(rule.evaluate(metrics))
+                failing_rows = None
+            else:
+                passed = failing == 0
+                failing_rows = failing
+            outcomes.append(
+                {
+                    "id": control.id,
+                    "name": control.name,
+                    "severity": control.severity,
+                    "rule": control.rule,
+                    "passed": passed,
+                    "failing_rows": failing_rows,
+                }
+            )
+
+        failed = [outcome for outcome in outcomes if not outcome["passed"]]
+        return {
+            "controls": outcomes,
+            "failed": len(failed),
+            "critical_failed": sum(outcome["severity"] == "CRITICAL" for outcome in failed),
+        }
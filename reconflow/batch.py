@@ -0,0 +1,296 @@
+"""Run many pipelines as one batch, sharing prepared sources."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from itertools import count
+from pathlib import Path
+
+from reconflow.cache import SourcePool
+from reconflow.config import ReconFlowConfig, load_config
+from reconflow.pipeline import load_prepared, run_pipeline, shares_sources, source_key
+from reconflow.profiling import peak_rss_mb
+
+# In-memory runs need roughly this many bytes per byte of input files
+_WORKING_SET_FACTOR = 4
+
+
+def _silent(message: str) -> None:
+    """Default progress callback."""
+
+
+@dataclass
+class BatchPipeline:
+    """
+    A pipeline of a batch and its place in the batch's DAG.
+
+    Attributes:
+        config_path: Path of the pipeline's configuration file
+        config: The loaded configuration
+        source_keys: ``SourcePool`` keys of its prepared product and CBA
+            sources, empty if it loads its own
+        after: Indexes of pipelines that must finish first: earlier
+            pipelines writing the same run directory and pipeline name
+        estimate_mb: Memory reserved against the batch's budget while it runs
+    """
+
+    config_path: str
+    config: ReconFlowConfig
+    source_keys: list[str] = field(default_factory=list)
+    after: list[int] = field(default_factory=list)
+    estimate_mb: float = 0.0
+
+
+@dataclass
+class BatchSummary:
+    """Summary of a batch of pipeline runs."""
+
+    batch_id: str
+    executed_at: str
+    wall_s: float
+    workers: int
+    memory_budget_mb: int | None
+    pipelines: list[dict]
+    sources: list[dict]
+    failed: int
+    critical_failed: int
+    peak_rss_mb: float | None
+    path: str = ""
+
+
+def _estimate_mb(config: ReconFlowConfig) -> float:
+    """Memory to reserve for a pipeline: its own budget, or a multiple of its inputs."""
+    if config.matching.memory_budget_mb is not None:
+        return float(config.matching.memory_budget_mb)
+    size = sum(
+        os.path.getsize(source.path)
+        for source in (config.product, config.cba)
+        if os.path.exists(source.path)
+    )
+    return _WORKING_SET_FACTOR * size / (1024 * 1024)
+
+
+def plan_batch(configs: list[tuple[str, ReconFlowConfig]], pool: SourcePool) -> list[BatchPipeline]:
+    """
+    Build the DAG of a batch.
+
+    Pipelines that can share prepared sources depend on the pool entries of
+    their product and CBA sources; pipelines with the same run directory
+    and name run one after the other, in the given order. Pipelines are
+    ordered so that those sharing sources run close together, letting the
+    pool free each source early.
+
+    Args:
+        configs: (path, configuration) of each pipeline
+        pool: Pool whose keys identify the prepared sources
+
+    Returns:
+        The batch's pipelines, in scheduling order
+    """
+    nodes = []
+    for path, config in configs:
+        keys = []
+        if shares_sources(config):
+            try:
+                keys = [
+                    source_key(source, config, pool, pool.digest(source.path))
+                    for source in (config.product, config.cba)
+                ]
+            except OSError:
+                # Unreadable sources fail the pipeline when it runs
+                keys = []
+        nodes.append(BatchPipeline(path, config, keys, estimate_mb=_estimate_mb(config)))
+
+    # Group pipelines by shared sources, most shared first
+    users = Counter(key for node in nodes for key in set(node.source_keys))
+    nodes.sort(key=lambda node: sorted((-users[key], key) for key in node.source_keys))
+
+    last: dict[tuple[str, str], int] = {}
+    for i, node in enumerate(nodes):
+        target = (str(Path(node.config.output.run_dir).resolve()), node.config.pipeline_name)
+        if target in last:
+            node.after.append(last[target])
+        last[target] = i
+    return nodes
+
+
+def _run_pipeline(
+    node: BatchPipeline,
+    pool: SourcePool,
+    sources: dict[str, dict],
+    log: Callable[[str], None],
+) -> dict:
+    """Load a pipeline's shared sources unless already pooled, then run it."""
+    config = node.config
+
+    def prefixed(message: str) -> None:
+        log(f"[{config.pipeline_name}] {message.strip()}")
+
+    start = time.perf_counter()
+    for source, key in zip((config.product, config.cba), node.source_keys, strict=False):
+        with pool.lock(key):
+            if pool.get(key) is not None:
+                continue
+            prefixed(f"Loading {source.path}...")
+            load_start = time.perf_counter()
+            frame = load_prepared(source, config, pool, digest=pool.digest(source.path))
+            sources[key].update(
+                rows=len(frame),
+                load_s=round(time.perf_counter() - load_start, 4),
+                memory_mb=round(frame.memory_usage(deep=True).sum() / (1024 * 1024), 1),
+            )
+
+    summary = run_pipeline(config, log=prefixed, sources=pool)
+    assurance = summary.details.get("assurance") or {}
+    return {
+        "status": "ok",
+        "run_id": summary.run_id,
+        "dir": summary.paths["dir"],
+        "wall_s": round(time.perf_counter() - start, 4),
+        "totals": summary.totals,
+        "metrics": summary.metrics,
+        "critical_failed": assurance.get("critical_failed", 0),
+    }
+
+
+def run_batch(
+    config_paths: list[str],
+    workers: int = 4,
+    memory_budget_mb: int | None = None,
+    batch_dir: str = ".reconflow/batches",
+    log: Callable[[str], None] = _silent,
+) -> BatchSummary:
+    """
+    Run pipelines concurrently, loading and preparing each distinct source once.
+
+    Pipelines run on a pool of ``workers`` threads. With a memory budget,
+    a pipeline only starts while the estimates of the running pipelines
+    (``matching.memory_budget_mb`` for out-of-core runs, otherwise a
+    multiple of the input file sizes) leave room for it; one pipeline
+    always runs, however large. Shared sources are dropped from memory once
+    their last pipeline finishes. A failing pipeline does not stop the
+    others.
+
+    Each pipeline writes its own run artifacts and ``summary.json``; the
+    batch summary is written to ``<batch_dir>/<batch_id>.json`` at the end,
+    batches started within the same second getting a numbered suffix.
+    Stage CPU times and peak memory of concurrent pipelines are process-wide.
+
+    Args:
+        config_paths: Paths of the pipelines' ``reconflow.yaml`` files
+        workers: Pipelines run at the same time
+        memory_budget_mb: Memory budget of the whole batch, in MB
+        batch_dir: Directory of batch summaries
+        log: Callback receiving progress messages
+
+    Returns:
+        BatchSummary of the batch
+
+    Raises:
+        ValueError: If a configuration file is listed more than once
+    """
+    listed = Counter(str(Path(path).resolve()) for path in config_paths)
+    duplicates = [path for path, times in listed.items() if times > 1]
+    if duplicates:
+        raise ValueError(f"Configuration listed more than once: {', '.join(duplicates)}")
+
+    started = time.perf_counter()
+    executed_at = dt.datetime.now(dt.UTC)
+    pool = SourcePool()
+
+    results: dict[str, dict] = {}
+    configs = []
+    for path in config_paths:
+        try:
+            configs.append((path, load_config(path)))
+        except Exception as e:
+            results[path] = {"config": path, "status": "failed", "error": str(e)}
+
+    nodes = plan_batch(configs, pool)
+    users = Counter(key for node in nodes for key in set(node.source_keys))
+    sources = {key: {"path": None, "pipelines": count} for key, count in users.items()}
+    for node in nodes:
+        for source, key in zip(
+            (node.config.product, node.config.cba), node.source_keys, strict=False
+        ):
+            sources[key]["path"] = source.path
+    log(f"{len(nodes)} pipelines share {len(sources)} prepared sources")
+
+    pending = list(range(len(nodes)))
+    running: dict[Future, int] = {}
+    finished: set[int] = set()
+    reserved = 0.0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending or running:
+            for i in list(pending):
+                node = nodes[i]
+                if len(running) >= workers:
+                    break
+                if any(j not in finished for j in node.after):
+                    continue
+                over_budget = (
+                    memory_budget_mb is not None and reserved + node.estimate_mb > memory_budget_mb
+                )
+                if running and over_budget:
+                    continue
+                pending.remove(i)
+                reserved += node.estimate_mb
+                log(f"Starting {node.config.pipeline_name} ({node.config_path})")
+                running[executor.submit(_run_pipeline, node, pool, sources, log)] = i
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                node = nodes[i]
+                finished.add(i)
+                reserved -= node.estimate_mb
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = {"status": "failed", "error": str(e)}
+                results[node.config_path] = {
+                    "config": node.config_path,
+                    "pipeline_name": node.config.pipeline_name,
+                    **outcome,
+                }
+                log(f"Finished {node.config.pipeline_name}: {outcome['status']}")
+                for key in set(node.source_keys):
+                    users[key] -= 1
+                    if users[key] == 0:
+                        pool.discard(key)
+
+    pipelines = [results[path] for path in config_paths if path in results]
+    summary = BatchSummary(
+        batch_id=executed_at.strftime("%Y%m%dT%H%M%SZ"),
+        executed_at=executed_at.isoformat(),
+        wall_s=round(time.perf_counter() - started, 4),
+        workers=workers,
+        memory_budget_mb=memory_budget_mb,
+        pipelines=pipelines,
+        sources=[{"key": key, **stats} for key, stats in sources.items()],
+        failed=sum(pipeline["status"] != "ok" for pipeline in pipelines),
+        critical_failed=sum(bool(pipeline.get("critical_failed")) for pipeline in pipelines),
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+    Path(batch_dir).mkdir(parents=True, exist_ok=True)
+    stamp = summary.batch_id
+    for attempt in count(1):
+        out = Path(batch_dir) / f"{summary.batch_id}.json"
+        try:
+            f = open(out, "x", encoding="utf-8")
+            break
+        except FileExistsError:
+            summary.batch_id = f"{stamp}-{attempt}"
+    summary.path = str(out)
+    with f:
+        f.write(json.dumps(asdict(summary), indent=2))
+    return summary
@@ -0,0 +1,30 @@
+"""Synthetic data and scaling benchmarks."""
+
+from typing import TYPE_CHECKING
+
+from reconflow._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from reconflow.bench.generate import DataMix, generate_pair
+    from reconflow.bench.suite import compare_to_baseline, load_results, run_benchmark, save_results
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DataMix": "reconflow.bench.generate",
+        "generate_pair": "reconflow.bench.generate",
+        "run_benchmark": "reconflow.bench.suite",
+        "save_results": "reconflow.bench.suite",
+        "load_results": "reconflow.bench.suite",
+        "compare_to_baseline": "reconflow.bench.suite",
+    },
+)
+
+__all__ = [
+    "DataMix",
+    "generate_pair",
+    "run_benchmark",
+    "save_results",
+    "load_results",
+    "compare_to_baseline",
+]
@@ -0,0 +1,135 @@
+"""Synthetic product/CBA pairs for benchmarking."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+_BANKS = ["MONIEPOINT", "ACCESS", "GTB", "ZENITH", "UBA", "FIRSTBANK", "KUDA", "OPAY"]
+
+_DAYS = 30
+
+
+@dataclass
+class DataMix:
+    """
+    Share of records affected by each kind of break.
+
+    Rates are fractions of the product records.
+
+    Attributes:
+        embedded: References embedded in free text and lower-cased on the product side
+        duplicates: Product records repeated with the same reference
+        rounding_drift: Product amounts with a third decimal that rounds to the CBA amount
+        amount_drift: CBA amounts off by more than the matching tolerance
+        missing_in_target: Product records with no CBA entry
+        missing_in_source: Extra CBA entries with no product record
+    """
+
+    embedded: float = 0.1
+    duplicates: float = 0.01
+    rounding_drift: float = 0.02
+    amount_drift: float = 0.01
+    missing_in_target: float = 0.01
+    missing_in_source: float = 0.01
+
+
+def _strings(values: np.ndarray) -> pd.Series:
+    """Integers as strings, converted by vectorized kernels rather than per value."""
+    return pd.Series(values).astype("str")
+
+
+def _references(ids: np.ndarray, banks: np.ndarray) -> pd.Series:
+    bank = pd.Series(pd.Categorical.from_codes(banks, _BANKS)).astype("str")
+    return "TRF|" + bank + "|" + _strings(ids).str.zfill(10) + "|NGN"
+
+
+def _amounts(minor: np.ndarray) -> pd.Series:
+    return _strings(minor // 100) + "." + _strings(minor % 100).str.zfill(2)
+
+
+def _dates(days: np.ndarray) -> pd.Categorical:
+    labels = pd.date_range("2026-01-01", periods=_DAYS).strftime("%Y-%m-%d")
+    return pd.Categorical.from_codes(days, labels)
+
+
+def generate_pair(
+    n_rows: int,
+    mix: DataMix | None = None,
+    seed: int = 0,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generate a product file and the CBA ledger it should reconcile against.
+
+    Every column is built with NumPy and vectorized string kernels, so tens
+    of millions of rows take seconds rather than minutes. References follow
+    the ``TRF|<bank>|<id>|NGN`` format of the quickstart data.
+
+    Args:
+        n_rows: Number of product records before duplicates are added
+        mix: Share of records affected by each kind of break
+        seed: Random seed; equal seeds give equal data
+
+    Returns:
+        Tuple of (product, cba) DataFrames with date, reference and amount columns
+    """
+    mix = mix or DataMix()
+    rng = np.random.default_rng(seed)
+
+    ids = np.arange(n_rows)
+    banks = rng.integers(0, len(_BANKS), n_rows)
+    days = rng.integers(0, _DAYS, n_rows)
+    minor = rng.integers(100, 10_000_000, n_rows)
+
+    references = _references(ids, banks)
+    cba_minor = minor.copy()
+
+    # Real mismatches move the CBA amount by 0.02 to 5.00
+    drift = rng.random(n_rows) < mix.amount_drift
+    cba_minor[drift] += rng.choice([-1, 1], drift.sum()) * rng.integers(2, 500, drift.sum())
+    cba_minor = np.abs(cba_minor)
+
+    product_amounts = _amounts(minor)
+    # A trailing 4 keeps the value's rounding at the CBA amount (e.g. 10.004 -> 10.00)
+    rounding = rng.random(n_rows) < mix.rounding_drift
+    product_amounts[rounding] = product_amounts[rounding] + "4"
+
+    product_references = references.copy()
+    embedded = rng.random(n_rows) < mix.embedded
+    product_references[embedded] = (
+        "Payment completed " + references[embedded].str.lower() + " via app"
+    )
+
+    product = pd.DataFrame(
+        {"date": _dates(days), "reference": product_references, "amount": product_amounts}
+    )
+    duplicates = np.flatnonzero(rng.random(n_rows) < mix.duplicates)
+    product = pd.concat([product, product.iloc[duplicates]], ignore_index=True)
+
+    keep = rng.random(n_rows) >= mix.missing_in_target
+    n_extra = int(n_rows * mix.missing_in_source)
+    extra_ids = np.arange(n_rows, n_rows + n_extra)
+    cba = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "date": _dates(days[keep]),
+                    "reference": references[keep].reset_index(drop=True),
+                    "amount": _amounts(cba_minor[keep]),
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "date": _dates(rng.integers(0, _DAYS, n_extra)),
+                    "reference": _references(extra_ids, rng.integers(0, len(_BANKS), n_extra)),
+                    "amount": _amounts(rng.integers(100, 10_000_000, n_extra)),
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+    cba = cba.iloc[rng.permutation(len(cba))].reset_index(drop=True)
+
+    return product, cba
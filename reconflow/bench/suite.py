@@ -0,0 +1,199 @@
+"""Scaling benchmarks for loading, matching and writing artifacts."""
+
+from __future__ import annotations
+
+import json
+import platform
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pandas as pd
+
+from reconflow import __version__
+from reconflow.bench.generate import DataMix, generate_pair
+from reconflow.io import coerce_amount, read_csv, write_csv
+from reconflow.matching import match_records
+from reconflow.profiling import StageTimer
+from reconflow.report.summary import write_run_artifacts
+
+# Stages compared against a baseline; data generation is reported but not compared
+STAGES = ("write_input", "read_input", "coerce_amount", "match", "write_artifacts")
+
+
+def _run_size(
+    n_rows: int,
+    workdir: Path,
+    mix: DataMix,
+    seed: int,
+    workers: int,
+    engine: str,
+    format: str,
+) -> list[dict]:
+    timer = StageTimer()
+
+    with timer.stage("generate", n_rows) as stage:
+        product, cba = generate_pair(n_rows, mix, seed)
+        stage.rows = len(product) + len(cba)
+    rows = len(product) + len(cba)
+
+    with timer.stage("write_input", rows):
+        write_csv(product, workdir / "product.csv")
+        write_csv(cba, workdir / "cba.csv")
+    del product, cba
+
+    with timer.stage("read_input", rows):
+        product = read_csv(workdir / "product.csv", engine=engine)
+        cba = read_csv(workdir / "cba.csv", engine=engine)
+
+    with timer.stage("coerce_amount", rows):
+        product["amount"] = coerce_amount(product["amount"])
+        cba["amount"] = coerce_amount(cba["amount"])
+
+    with timer.stage("match", rows):
+        result = match_records(product, cba, workers=workers)
+    del product, cba
+
+    with timer.stage("write_artifacts", rows):
+        write_run_artifacts(
+            str(workdir / "runs"),
+            "bench",
+            result.matched,
+            result.missing_in_target,
+            result.missing_in_source,
+            result.amount_mismatches,
+            format=format,
+        )
+
+    return timer.to_list()
+
+
+def run_benchmark(
+    sizes: list[int],
+    workdir: str | Path | None = None,
+    mix: DataMix | None = None,
+    seed: int = 0,
+    workers: int = 1,
+    engine: str = "c",
+    format: str = "csv",
+    log=None,
+) -> dict:
+    """
+    Time each stage of a reconciliation over synthetic data of several sizes.
+
+    Each size gets a fresh product/CBA pair that is written to CSV, read
+    back, coerced, matched and written out as run artifacts. Input files and
+    artifacts go under ``workdir`` (a temporary directory by default) and
+    are overwritten by the next size.
+
+    Args:
+        sizes: Product record counts to benchmark, e.g. ``[1_000_000, 10_000_000]``
+        workdir: Directory for generated inputs and artifacts
+        mix: Share of records affected by each kind of break
+        seed: Random seed for data generation
+        workers: Worker processes for matching
+        engine: CSV parser, ``c`` or ``pyarrow``
+        format: Artifact format, ``csv``, ``json`` or ``parquet``
+        log: Optional callable receiving progress messages
+
+    Returns:
+        Benchmark results: environment, settings and the stages of each size
+    """
+    mix = mix or DataMix()
+    results = {
+        "reconflow": __version__,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "settings": {
+            "seed": seed,
+            "workers": workers,
+            "engine": engine,
+            "format": format,
+            "mix": vars(mix),
+        },
+        "sizes": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="reconflow-bench-") as tmp:
+        base = Path(workdir) if workdir is not None else Path(tmp)
+        base.mkdir(parents=True, exist_ok=True)
+        for n_rows in sizes:
+            if log:
+                log(f"Benchmarking {n_rows:,} records")
+            results["sizes"][str(n_rows)] = _run_size(
+                n_rows, base, mix, seed, workers, engine, format
+            )
+
+    return results
+
+
+def save_results(results: dict, path: str | Path) -> None:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        results: Results from ``run_benchmark``
+        path: Output path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+def load_results(path: str | Path) -> dict:
+    """
+    Read benchmark results written by ``save_results``.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Benchmark results
+    """
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare_to_baseline(
+    results: dict,
+    baseline: dict,
+    threshold: float = 0.2,
+    min_seconds: float = 0.05,
+) -> list[dict]:
+    """
+    Find stages that got slower than a baseline run.
+
+    Only sizes and stages present in both runs are compared. A stage
+    regresses when its wall time grew by more than ``threshold`` and by
+    more than ``min_seconds``, so sub-second timing noise on small sizes is
+    not reported.
+
+    Args:
+        results: Results of the current run
+        baseline: Results of the baseline run
+        threshold: Allowed relative slowdown, e.g. 0.2 for 20%
+        min_seconds: Allowed absolute slowdown in seconds
+
+    Returns:
+        One dict per regression with size, stage, baseline_s, current_s and change
+    """
+    regressions = []
+    for size, stages in results["sizes"].items():
+        before = {stage["name"]: stage for stage in baseline.get("sizes", {}).get(size, [])}
+        for stage in stages:
+            if stage["name"] not in STAGES or stage["name"] not in before:
+                continue
+            baseline_s = before[stage["name"]]["wall_s"]
+            current_s = stage["wall_s"]
+            if current_s - baseline_s > max(threshold * baseline_s, min_seconds):
+                regressions.append(
+                    {
+                        "size": int(size),
+                        "stage": stage["name"],
+                        "baseline_s": baseline_s,
+                        "current_s": current_s,
+                        "change": round(current_s / baseline_s - 1, 3) if baseline_s else None,
+                    }
+                )
+    return regressions
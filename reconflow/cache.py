@@ -0,0 +1,203 @@
+"""Content-addressed cache of prepared sources."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from reconflow import __version__
+from reconflow.io.arrow import require_pyarrow
+
+# Bump when the layout of prepared frames changes, to orphan old entries
+_CACHE_VERSION = 3
+
+
+def file_digest(path: str | Path) -> str:
+    """Hash a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+def _copy_on_write() -> bool:
+    """Whether pandas copies shared data on write, making shallow copies independent."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+class PreparedSources(ABC):
+    """
+    Store of prepared (loaded, normalized and standardized) sources.
+
+    ``load_prepared`` reads and fills a store through ``key``, ``digest``,
+    ``get`` and ``put``. Entries are keyed by the input file's content hash
+    and the settings that shaped the prepared frame, so editing the file or
+    any of those settings misses the store while unrelated config changes
+    (tolerance, output format) hit it. Every store computes the same keys.
+    """
+
+    def key(self, path: str | Path, settings: dict[str, Any], digest: str | None = None) -> str:
+        """
+        Key for a file prepared with the given settings.
+
+        Args:
+            path: Input file
+            settings: JSON-serializable settings that affect the prepared frame
+            digest: The file's ``file_digest``, if already computed
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        payload = {
+            "cache_version": _CACHE_VERSION,
+            "reconflow": __version__,
+            "file": digest or self.digest(path),
+            "settings": settings,
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def digest(self, path: str | Path) -> str:
+        """Content hash of an input file."""
+        return file_digest(path)
+
+    @abstractmethod
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Prepared frame of an entry, or None on a miss."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, frame: pd.DataFrame) -> None:
+        """Store a prepared frame."""
+        raise NotImplementedError
+
+
+class PreparedCache(PreparedSources):
+    """
+    On-disk cache of prepared sources.
+
+    Entries are Parquet files, which keep the frames' dtypes and ``attrs``
+    and, unlike pickles, cannot run code when a tampered cache directory
+    is read. The least recently used are evicted once the cache grows
+    beyond ``max_size_mb``.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+
+    def __init__(self, directory: str | Path, max_size_mb: int = 1024) -> None:
+        require_pyarrow("The prepared-source cache")
+        self.directory = Path(directory)
+        self.max_bytes = max_size_mb * 1024 * 1024
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Load an entry, or None on a miss."""
+        path = self._path(key)
+        try:
+            frame = pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or written by an incompatible version; treat as a miss
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for eviction
+        os.utime(path)
+        return frame
+
+    def put(self, key: str, frame: pd.DataFrame) -> None:
+        """Store an entry, then evict the least recently used beyond the size limit."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            frame.to_parquet(tmp)
+            os.replace(tmp, self._path(key))
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class SourcePool(PreparedSources):
+    """
+    In-memory store of prepared sources shared by the pipelines of a batch.
+
+    Keys are those of ``PreparedCache``, so pipelines reading the same file
+    with the same settings share one prepared frame. Each ``get`` returns a
+    shallow copy under copy-on-write (always on from pandas 3), so changes a
+    pipeline makes to its copy never reach the shared frame; without it,
+    a deep copy. File hashes are computed once per file version.
+    """
+
+    def __init__(self) -> None:
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def digest(self, path: str | Path) -> str:
+        stat = os.stat(path)
+        version = (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._guard:
+            digest = self._digests.get(version)
+        if digest is None:
+            digest = file_digest(path)
+            with self._guard:
+                self._digests[version] = digest
+        return digest
+
+    def lock(self, key: str) -> threading.Lock:
+        """Lock held while an entry is loaded, so each entry is loaded once."""
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        with self._guard:
+            frame = self._frames.get(key)
+            return None if frame is None else frame.copy(deep=not _copy_on_write())
+
+    def put(self, key: str, frame: pd.DataFrame) -> None:
+        with self._guard:
+            self._frames[key] = frame
+
+    def discard(self, key: str) -> None:
+        """Drop an entry once no pipeline needs it."""
+        with self._guard:
+            self._frames.pop(key, None)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the pooled frames."""
+        with self._guard:
+            frames = list(self._frames.values())
+        return sum(int(frame.memory_usage(deep=True).sum()) for frame in frames)
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
+import cProfile
 import json
+import time
+from dataclasses import asdict
 from pathlib import Path
+from typing import Annotated
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from reconflow import __version__
-from reconflow.config import load_config
-from reconflow.io import coerce_amount, read_csv
-from reconflow.matching import match_records
-from reconflow.report import write_run_artifacts
 
 app = typer.Typer(
     name="reconflow",
@@ -21,13 +21,19 @@ app = typer.Typer(
     add_completion=False,
     no_args_is_help=True,
 )
+runs_app = typer.Typer(help="Query the run catalog", no_args_is_help=True)
+app.add_typer(runs_app, name="runs")
 console = Console()
 
+# Commands import pandas, pydantic and the engine on first use so that
+# version, explain and --help start without loading them.
+
+# cProfile dump written next to a run's artifacts by ``run --profile``
+PROFILE_FILE = "profile.pstats"
 
-def _print_summary(summary_path: Path) -> None:
-    """Print a run summary in a formatted table."""
-    data = json.loads(summary_path.read_text(encoding="utf-8"))
 
+def _print_summary(data: dict) -> None:
+    """Print a run summary in a formatted table."""
     table = Table(title=f"ReconFlow Run: {data['pipeline_name']} / {data['run_id']}")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", justify="right")
@@ -44,6 +50,118 @@ def _print_summary(summary_path: Path) -> None:
     console.print(f"\n[bold]Artifacts:[/bold] {data['paths']['dir']}")
 
 
+def _print_controls(assurance: dict) -> None:
+    """Print the outcome of each assurance control."""
+    for control in assurance["controls"]:
+        mark = "[green]✓[/green]" if control["passed"] else "[red]✗[/red]"
+        line = f"{mark} {control['id']} {control['name']} [{control['severity']}]"
+        if control["failing_rows"]:
+            line += f": {control['failing_rows']} failing records"
+        console.print(line)
+
+
+def _print_stages(stages: list[dict], title: str = "Stages") -> None:
+    """Print the time, throughput and memory of each stage of a run."""
+    table = Table(title=title)
+    table.add_column("Stage", style="cyan")
+    for column in ("Rows", "Wall s", "CPU s", "Rows/s", "Peak RSS MB"):
+        table.add_column(column, justify="right")
+
+    total = sum(stage["wall_s"] for stage in stages) or 1.0
+    for stage in stages:
+        table.add_row(
+            stage["name"],
+            str(stage["rows"]),
+            f"{stage['wall_s']:.3f} ({stage['wall_s'] / total:.0%})",
+            f"{stage['cpu_s']:.3f}",
+            f"{stage['rows_per_s']:,.0f}",
+            "-" if stage["peak_rss_mb"] is None else f"{stage['peak_rss_mb']:,.1f}",
+        )
+
+    console.print(table)
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _resolve_paths(data: dict, run_dir: str) -> dict[str, str]:
+    """
+    Paths of a run's directory and artifacts under ``run_dir``.
+
+    Summaries record paths as given when the run was written, which may be
+    relative to another working directory.
+    """
+    out_dir = Path(run_dir) / data["pipeline_name"] / data["run_id"]
+    return {
+        name: str(out_dir if name == "dir" else out_dir / Path(path).name)
+        for name, path in data["paths"].items()
+    }
+
+
+def _artifact_line(data: dict, bucket: str) -> str:
+    """Describe a bucket's artifact file, including its size when known."""
+    path = data["paths"][bucket]
+    file = data.get("files", {}).get(bucket)
+    if file is None:
+        # Summaries written before file stats were recorded
+        if not Path(path).exists():
+            return path
+        file = {"bytes": Path(path).stat().st_size}
+    return f"{path} ({_format_bytes(file['bytes'])})"
+
+
+# Matching helper columns still worth showing when printing records
+_SHOWN_INTERNAL_COLUMNS = ("_norm_ref", "_amt_diff")
+
+
+def _print_page(data: dict, bucket: str, page: int, page_size: int, filter: str | None) -> None:
+    """Print one page of a bucket's records."""
+    from reconflow.report.index import read_page
+
+    if bucket not in data["paths"] or bucket == "dir":
+        buckets = ", ".join(name for name in data["paths"] if name != "dir")
+        raise ValueError(f"Unknown bucket {bucket!r}; expected one of {buckets}")
+
+    ref = None
+    if filter is not None:
+        key, _, ref = filter.partition("=")
+        if key.strip() != "ref" or not ref:
+            raise ValueError(f"Invalid filter {filter!r}; expected ref=<reference>")
+
+    frame, total = read_page(data["paths"][bucket], page, page_size, ref)
+    shown = [
+        column
+        for column in frame.columns
+        if (not str(column).startswith("_") or column in _SHOWN_INTERNAL_COLUMNS)
+        and frame[column].notna().any()
+    ]
+
+    pages = max(1, -(-total // page_size))
+    first = (page - 1) * page_size
+    title = f"{bucket}" + (f" where reference = {ref}" if ref else "")
+    table = Table(title=title)
+    for column in shown:
+        table.add_column(str(column))
+    for row in frame[shown].itertuples(index=False):
+        table.add_row(*("" if value is None or value != value else str(value) for value in row))
+
+    console.print(table)
+    if len(shown) < len(frame.columns):
+        console.print(f"({len(frame.columns) - len(shown)} empty or internal columns hidden)")
+    if frame.empty:
+        console.print(f"No records on page {page} of {pages} ({total} records)")
+    else:
+        console.print(
+            f"Records {first + 1}-{first + len(frame)} of {total} (page {page} of {pages})"
+        )
+
+
 @app.command()
 def version() -> None:
     """Show ReconFlow version."""
@@ -55,6 +173,8 @@ def validate(
     config_path: str = typer.Argument(..., help="Path to reconflow.yaml"),
 ) -> None:
     """Validate a configuration file."""
+    from reconflow.config import load_config
+
     try:
         config = load_config(config_path)
 
@@ -71,7 +191,14 @@ def validate(
 
         console.print("[green]✓[/green] Configuration is valid")
         console.print(f"  Pipeline: {config.pipeline_name}")
+        console.print(f"  Product: {config.product.path} ({config.product.type})")
+        console.print(f"  CBA: {config.cba.path} ({config.cba.type})")
         console.print(f"  Strategy: {config.matching.strategy}")
+        if config.assurance.controls:
+            from reconflow.assurance import ControlSet
+
+            ControlSet(config.assurance.controls)
+            console.print(f"  Controls: {len(config.assurance.controls)} rules compiled")
 
     except Exception as e:
         console.print(f"[red]✗[/red] Validation failed: {e}")
@@ -81,54 +208,187 @@ def validate(
 @app.command()
 def run(
     config_path: str = typer.Argument(..., help="Path to reconflow.yaml"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Worker processes for matching (overrides matching.workers)",
+    ),
+    full_refresh: bool = typer.Option(
+        False,
+        "--full-refresh",
+        help="Discard incremental state and reconcile all records",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Write a cProfile dump of the run to profile.pstats in its artifacts",
+    ),
 ) -> None:
-    """Run a reconciliation pipeline."""
+    """
+    Run a reconciliation pipeline.
+
+    Exits with status 2 when a CRITICAL assurance control fails; the run's
+    artifacts are still written.
+    """
+    from reconflow.config import load_config
+    from reconflow.pipeline import run_pipeline
+
     try:
         config = load_config(config_path)
+        if workers is not None:
+            config.matching.workers = workers
         console.print(f"[cyan]Running pipeline:[/cyan] {config.pipeline_name}")
 
-        console.print("  Loading product data...")
-        product = read_csv(config.product.path)
-        console.print(f"    {len(product)} records")
-
-        console.print("  Loading CBA data...")
-        cba = read_csv(config.cba.path)
-        console.print(f"    {len(cba)} records")
-
-        product[config.product.amount_field] = coerce_amount(product[config.product.amount_field])
-        cba[config.cba.amount_field] = coerce_amount(cba[config.cba.amount_field])
-
-        console.print("  Matching records...")
-        result = match_records(
-            source=product,
-            target=cba,
-            strategy=config.matching.strategy,
-            source_ref_col=config.product.reference_field,
-            target_ref_col=config.cba.reference_field,
-            source_amt_col=config.product.amount_field,
-            target_amt_col=config.cba.amount_field,
-            tolerance=config.matching.amount_tolerance_abs,
-            normalize_refs=config.matching.normalize_reference,
-            decimal_precision=config.pricing.decimal_precision,
+        profiler = cProfile.Profile() if profile else None
+        if profiler is not None:
+            profiler.enable()
+        summary = run_pipeline(config, log=console.print, full_refresh=full_refresh)
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(Path(summary.paths["dir"]) / PROFILE_FILE)
+
+        console.print()
+        _print_summary(asdict(summary))
+        if profiler is not None:
+            profile_path = Path(summary.paths["dir"]) / PROFILE_FILE
+            console.print(f"[bold]Profile:[/bold] {profile_path} (python -m pstats {profile_path})")
+
+    except Exception as e:
+        console.print(f"[red]✗[/red] Run failed: {e}")
+        raise typer.Exit(1) from e
+
+    assurance = summary.details.get("assurance")
+    if assurance:
+        _print_controls(assurance)
+        if assurance["critical_failed"]:
+            raise typer.Exit(2)
+
+
+@app.command("run-batch")
+def run_batch(
+    config_paths: Annotated[list[str], typer.Argument(help="Paths to reconflow.yaml files")],
+    workers: int = typer.Option(4, "--workers", min=1, help="Pipelines run at the same time"),
+    memory_budget_mb: int | None = typer.Option(
+        None,
+        "--memory-budget-mb",
+        min=1,
+        help="Only start pipelines while their estimated memory fits this budget",
+    ),
+    batch_dir: str = typer.Option(".reconflow/batches", help="Directory of batch summaries"),
+) -> None:
+    """
+    Run several pipelines, loading each shared source once.
+
+    Pipelines reading the same file with the same settings share its parsed
+    and normalized form. Exits with status 1 when a pipeline fails and 2
+    when a CRITICAL assurance control fails; the other pipelines still run.
+    """
+    from reconflow.batch import run_batch as execute_batch
+
+    try:
+        summary = execute_batch(
+            config_paths,
+            workers=workers,
+            memory_budget_mb=memory_budget_mb,
+            batch_dir=batch_dir,
+            log=console.print,
         )
+    except Exception as e:
+        console.print(f"[red]✗[/red] Batch failed: {e}")
+        raise typer.Exit(1) from e
 
-        console.print("  Writing results...")
-        summary = write_run_artifacts(
-            run_dir=config.output.run_dir,
-            pipeline_name=config.pipeline_name,
-            matched=result.matched,
-            missing_in_target=result.missing_in_target,
-            missing_in_source=result.missing_in_source,
-            amount_mismatches=result.amount_mismatches,
+    table = Table(title=f"ReconFlow Batch: {summary.batch_id}")
+    table.add_column("Pipeline", style="cyan")
+    table.add_column("Config")
+    table.add_column("Status")
+    table.add_column("Run")
+    table.add_column("Match %", justify="right")
+    table.add_column("Wall s", justify="right")
+    for pipeline in summary.pipelines:
+        status = "[green]ok[/green]" if pipeline["status"] == "ok" else "[red]failed[/red]"
+        if pipeline.get("critical_failed"):
+            status = "[red]critical[/red]"
+        metrics = pipeline.get("metrics") or {}
+        table.add_row(
+            pipeline.get("pipeline_name", "-"),
+            pipeline["config"],
+            status,
+            pipeline.get("run_id", "-"),
+            f"{metrics['pool_match_pct']}%" if "pool_match_pct" in metrics else "-",
+            f"{pipeline['wall_s']:.2f}" if "wall_s" in pipeline else "-",
         )
+    console.print(table)
 
-        console.print()
-        _print_summary(Path(summary.paths["dir"]) / "summary.json")
+    for pipeline in summary.pipelines:
+        if pipeline.get("error"):
+            console.print(f"[red]✗[/red] {pipeline['config']}: {pipeline['error']}")
+    loaded = sum("rows" in source for source in summary.sources)
+    console.print(
+        f"\n[bold]Sources:[/bold] {loaded} loaded for {len(summary.pipelines)} pipelines "
+        f"in {summary.wall_s:.2f}s"
+    )
+    console.print(f"[bold]Batch summary:[/bold] {summary.path}")
+
+    if summary.failed:
+        raise typer.Exit(1)
+    if summary.critical_failed:
+        raise typer.Exit(2)
+
+
+@app.command()
+def watch(
+    config_path: str = typer.Argument(..., help="Path to reconflow.yaml"),
+    interval: float = typer.Option(5.0, "--interval", min=0.1, help="Seconds between polls"),
+    pattern: str | None = typer.Option(
+        None, "--pattern", help="Product files to pick up in a watched directory, e.g. 'drop_*.csv'"
+    ),
+    settle: float = typer.Option(
+        1.0, "--settle", min=0, help="Seconds a file must stay unmodified before it is read"
+    ),
+    backfill: bool = typer.Option(
+        False, "--backfill", help="Also reconcile product files present at start"
+    ),
+    once: bool = typer.Option(False, "--once", help="Poll once and exit"),
+) -> None:
+    """
+    Reconcile product files as they arrive, keeping the CBA side prepared in memory.
 
+    Point product.path at a directory to reconcile each new file in its own
+    run, or at a file to re-run whenever it changes. The CBA side is
+    prepared again only when its file changes. Stop with Ctrl+C.
+    """
+    from reconflow.config import load_config
+    from reconflow.watch import Watcher
+
+    try:
+        config = load_config(config_path)
+        watcher = Watcher(
+            config, log=console.print, pattern=pattern, settle_s=settle, backfill=backfill
+        )
     except Exception as e:
-        console.print(f"[red]✗[/red] Run failed: {e}")
+        console.print(f"[red]✗[/red] Watch failed: {e}")
         raise typer.Exit(1) from e
 
+    console.print(f"[cyan]Watching[/cyan] {config.product.path} for {config.pipeline_name}")
+    try:
+        while True:
+            for summary in watcher.poll_once():
+                line = (
+                    f"[green]✓[/green] {summary.run_id}: {summary.metrics['pool_match_pct']}% "
+                    f"matched, artifacts in {summary.paths['dir']}"
+                )
+                assurance = summary.details.get("assurance")
+                if assurance and assurance["critical_failed"]:
+                    line += " [red](CRITICAL control failed)[/red]"
+                console.print(line)
+            if once:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    console.print(f"Stopped after {watcher.runs} runs")
+
 
 @app.command()
 def explain(
@@ -140,33 +400,80 @@ def explain(
     run_id: str | None = typer.Option(None, "--run-id", help="Explain a specific run"),
     pipeline_name: str = typer.Option("quickstart", help="Pipeline name"),
     run_dir: str = typer.Option(".reconflow/runs", help="Runs directory"),
+    show: str | None = typer.Option(
+        None, "--show", help="Print the records of a bucket, e.g. missing_in_target"
+    ),
+    page: int = typer.Option(1, "--page", min=1, help="Page of records to print with --show"),
+    page_size: int = typer.Option(50, "--page-size", min=1, help="Records per page"),
+    filter: str | None = typer.Option(
+        None, "--filter", help="Only records with a reference, e.g. --filter ref=TRF|ABC|1"
+    ),
 ) -> None:
-    """Explain reconciliation results."""
-    try:
-        base = Path(run_dir) / pipeline_name
+    """
+    Explain reconciliation results.
 
-        if run_id is None:
-            if not latest:
-                console.print("[red]✗[/red] Provide --run-id or use --latest")
-                raise typer.Exit(1)
+    With --show, print one page of a bucket's records instead. Pages and
+    reference lookups read only the blocks of the artifact they need.
+    """
+    from reconflow.report.catalog import RunCatalog
 
-            latest_file = base / "latest.txt"
-            if not latest_file.exists():
-                console.print("[red]✗[/red] No runs found. Run: reconflow run <config>")
-                raise typer.Exit(1)
-
-            run_id = latest_file.read_text(encoding="utf-8").strip()
+    try:
+        if run_id is None and not latest:
+            console.print("[red]✗[/red] Provide --run-id or use --latest")
+            raise typer.Exit(1)
 
-        summary_path = base / run_id / "summary.json"
-        if not summary_path.exists():
-            console.print(f"[red]✗[/red] Run not found: {run_id}")
+        data = RunCatalog(run_dir).get(pipeline_name, run_id)
+        if data is None:
+            if run_id is None:
+                console.print(
+                    "[red]✗[/red] No runs found. Run: reconflow run <config> "
+                    "(or reconflow runs rebuild to index existing runs)"
+                )
+            else:
+                console.print(
+                    f"[red]✗[/red] Run not found: {run_id} "
+                    "(reconflow runs rebuild re-indexes the run directory)"
+                )
             raise typer.Exit(1)
 
-        data = json.loads(summary_path.read_text(encoding="utf-8"))
+        data["paths"] = _resolve_paths(data, run_dir)
+        summary_path = Path(data["paths"]["dir"]) / "summary.json"
+
+        if show is not None:
+            _print_page(data, show, page, page_size, filter)
+            return
 
         console.print("\n[bold]What happened?[/bold]")
         console.print("• Product records matched against CBA records by normalized reference")
         console.print("• Amounts matched if difference ≤ tolerance")
+        quality = data.get("details", {}).get("quality")
+        if quality:
+            checked = ", ".join(
+                f"{name} {report['rows']} rows / {report['duplicates']} duplicate references"
+                for name, report in quality.items()
+            )
+            console.print(f"• Quality checks passed: {checked}")
+        incremental = data.get("details", {}).get("incremental")
+        if incremental:
+            console.print(
+                f"• Incremental: {incremental['new_source']} new product records and "
+                f"{incremental['carried_source']} open items carried forward"
+            )
+        duplicates = data.get("details", {}).get("duplicates", {})
+        if any(duplicates.values()):
+            console.print(
+                f"• Repeated references paired in order: "
+                f"{duplicates['duplicate_source']} product / "
+                f"{duplicates['duplicate_target']} CBA records; "
+                f"empty references kept unmatched: {duplicates['quarantined_source']} product / "
+                f"{duplicates['quarantined_target']} CBA records"
+            )
+        pricing = data.get("details", {}).get("pricing")
+        if pricing:
+            console.print(
+                f"• Expected fees ({pricing['strategy']}): {pricing['total_expected_fee']} "
+                f"over {pricing['priced']} product records (_expected_fee)"
+            )
 
         console.print("\n[bold]Results breakdown:[/bold]")
         console.print(f"• [green]Matched:[/green] {data['totals']['matched']} records")
@@ -179,20 +486,239 @@ def explain(
         console.print(
             f"• [red]Amount mismatches:[/red] {data['totals']['amount_mismatches']} records"
         )
-
-        console.print("\n[bold]Where to look next:[/bold]")
-        console.print(f"• Matched: {data['paths']['matched']}")
-        console.print(f"• Missing in CBA: {data['paths']['missing_in_target']}")
-        console.print(f"• Missing in Product: {data['paths']['missing_in_source']}")
-        console.print(f"• Amount mismatches: {data['paths']['amount_mismatches']}")
+        if data["totals"].get("subset_matched"):
+            console.print(
+                f"• [green]Matched by subset sum:[/green] {data['totals']['subset_matched']} records"
+            )
+
+        assurance = data.get("details", {}).get("assurance")
+        if assurance:
+            console.print(f"\n[bold]Assurance controls[/bold] ({assurance['failed']} failed):")
+            _print_controls(assurance)
+
+        console.print(f"\n[bold]Where to look next[/bold] ({data.get('format', 'csv')}):")
+        console.print(f"• Matched: {_artifact_line(data, 'matched')}")
+        console.print(f"• Missing in CBA: {_artifact_line(data, 'missing_in_target')}")
+        console.print(f"• Missing in Product: {_artifact_line(data, 'missing_in_source')}")
+        console.print(f"• Amount mismatches: {_artifact_line(data, 'amount_mismatches')}")
+        if "subset_matched" in data["paths"]:
+            console.print(f"• Subset matches: {_artifact_line(data, 'subset_matched')}")
+        if data["totals"].get("fuzzy_candidates"):
+            console.print(
+                f"• Proposed fuzzy matches ({data['totals']['fuzzy_candidates']}): "
+                f"{_artifact_line(data, 'fuzzy_candidates')}"
+            )
+        profile_path = summary_path.parent / PROFILE_FILE
+        if profile_path.exists():
+            console.print(f"• Profile: {profile_path}")
+
+        if data.get("stages"):
+            console.print()
+            _print_stages(data["stages"])
 
         console.print()
-        _print_summary(summary_path)
+        _print_summary(data)
 
     except Exception as e:
         console.print(f"[red]✗[/red] Explain failed: {e}")
         raise typer.Exit(1) from e
 
 
+@app.command()
+def bench(
+    sizes: str = typer.Option(
+        "1000000",
+        "--sizes",
+        help="Comma-separated product record counts, e.g. 1000000,10000000,50000000",
+    ),
+    output: str = typer.Option("bench.json", "--output", "-o", help="Where to write results"),
+    baseline: str | None = typer.Option(
+        None, "--baseline", help="Earlier results to compare against"
+    ),
+    threshold: float = typer.Option(
+        0.2, "--threshold", min=0, help="Allowed slowdown against the baseline, e.g. 0.2 for 20%"
+    ),
+    workdir: str | None = typer.Option(
+        None, "--workdir", help="Directory for generated data (default: a temporary directory)"
+    ),
+    seed: int = typer.Option(0, "--seed", help="Random seed for data generation"),
+    workers: int = typer.Option(1, "--workers", min=1, help="Worker processes for matching"),
+    engine: str = typer.Option("c", "--engine", help="CSV parser, c or pyarrow"),
+    format: str = typer.Option("csv", "--format", help="Artifact format, csv, json or parquet"),
+) -> None:
+    """
+    Benchmark loading, matching and writing artifacts on synthetic data.
+
+    Exits with status 1 when a stage regressed against --baseline.
+    """
+    from reconflow.bench import compare_to_baseline, load_results, run_benchmark, save_results
+
+    try:
+        counts = [int(size.replace("_", "")) for size in sizes.split(",") if size.strip()]
+        previous = load_results(baseline) if baseline else None
+        results = run_benchmark(
+            counts,
+            workdir=workdir,
+            seed=seed,
+            workers=workers,
+            engine=engine,
+            format=format,
+            log=console.print,
+        )
+        save_results(results, output)
+
+        for size, stages in results["sizes"].items():
+            console.print()
+            _print_stages(stages, title=f"{int(size):,} records")
+        console.print(f"\n[bold]Results:[/bold] {output}")
+
+    except Exception as e:
+        console.print(f"[red]✗[/red] Benchmark failed: {e}")
+        raise typer.Exit(1) from e
+
+    if previous is not None:
+        regressions = compare_to_baseline(results, previous, threshold)
+        for regression in regressions:
+            console.print(
+                f"[red]✗[/red] {regression['stage']} at {regression['size']:,} records: "
+                f"{regression['baseline_s']:.3f}s -> {regression['current_s']:.3f}s"
+            )
+        if regressions:
+            raise typer.Exit(1)
+        console.print(f"[green]✓[/green] No regressions against {baseline}")
+
+
+def _print_runs(runs: list[dict], title: str) -> None:
+    """Print catalog rows, one run per line."""
+    table = Table(title=title)
+    table.add_column("Pipeline", style="cyan")
+    table.add_column("Run")
+    table.add_column("Executed at")
+    for column in ("Source", "Matched", "Missing CBA", "Missing Product", "Mismatches", "Match %"):
+        table.add_column(column, justify="right")
+
+    for run in runs:
+        table.add_row(
+            run["pipeline_name"],
+            run["run_id"],
+            run["executed_at"][:19],
+            *(
+                f"{run[column]:.0f}"
+                for column in (
+                    "total_source",
+                    "matched",
+                    "missing_in_target",
+                    "missing_in_source",
+                    "amount_mismatches",
+                )
+            ),
+            f"{run['pool_match_pct']}%",
+        )
+
+    console.print(table)
+
+
+@runs_app.command("list")
+def runs_list(
+    pipeline_name: str | None = typer.Option(None, help="Pipeline name (default: all)"),
+    run_dir: str = typer.Option(".reconflow/runs", help="Runs directory"),
+    limit: int = typer.Option(20, "--limit", min=1, help="Maximum number of runs"),
+) -> None:
+    """List the latest runs."""
+    from reconflow.report.catalog import RunCatalog
+
+    try:
+        runs = RunCatalog(run_dir).query(pipeline_name, limit=limit)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Listing runs failed: {e}")
+        raise typer.Exit(1) from e
+
+    _print_runs(runs, f"Runs ({len(runs)})")
+
+
+@runs_app.command("query")
+def runs_query(
+    where: Annotated[
+        list[str] | None,
+        typer.Option("--where", help="Condition such as 'missing_in_target > 100'; repeatable"),
+    ] = None,
+    pipeline_name: str | None = typer.Option(None, help="Pipeline name (default: all)"),
+    since: str | None = typer.Option(None, "--since", help="Only runs on or after this date"),
+    input_hash: str | None = typer.Option(
+        None, "--input-hash", help="Only runs that read an input with this blake2b hash"
+    ),
+    order_by: str = typer.Option("executed_at", "--order-by", help="Column to sort by"),
+    ascending: bool = typer.Option(False, "--ascending", help="Sort lowest or oldest first"),
+    limit: int = typer.Option(20, "--limit", min=1, help="Maximum number of runs"),
+    run_dir: str = typer.Option(".reconflow/runs", help="Runs directory"),
+    as_json: bool = typer.Option(False, "--json", help="Print runs as JSON"),
+) -> None:
+    """
+    Find runs by their totals and metrics.
+
+    For example, the runs with the most missing CBA records:
+    reconflow runs query --order-by missing_in_target --limit 5
+    """
+    from reconflow.report.catalog import RunCatalog
+
+    try:
+        runs = RunCatalog(run_dir).query(
+            pipeline_name, where, since, input_hash, order_by, not ascending, limit
+        )
+    except Exception as e:
+        console.print(f"[red]✗[/red] Query failed: {e}")
+        raise typer.Exit(1) from e
+
+    if as_json:
+        console.print_json(json.dumps(runs))
+    else:
+        _print_runs(runs, f"Matching runs ({len(runs)})")
+
+
+@runs_app.command("trend")
+def runs_trend(
+    pipeline_name: str = typer.Option("quickstart", help="Pipeline name"),
+    metric: str = typer.Option("pool_match_pct", "--metric", help="Total, metric or stage column"),
+    days: int = typer.Option(90, "--days", min=1, help="How far back to look"),
+    period: str = typer.Option("day", "--period", help="day, week or month"),
+    stage: str | None = typer.Option(
+        None, "--stage", help="Trend a stage's timings, e.g. --stage match --metric wall_s"
+    ),
+    run_dir: str = typer.Option(".reconflow/runs", help="Runs directory"),
+) -> None:
+    """Show how a metric moved over a pipeline's recent runs."""
+    from reconflow.report.catalog import RunCatalog
+
+    try:
+        rows = RunCatalog(run_dir).trend(pipeline_name, metric, days, period, stage)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Trend failed: {e}")
+        raise typer.Exit(1) from e
+
+    label = f"{stage}.{metric}" if stage else metric
+    table = Table(title=f"{pipeline_name}: {label}, last {days} days by {period}")
+    table.add_column("Period", style="cyan")
+    for column in ("Runs", "Min", "Avg", "Max"):
+        table.add_column(column, justify="right")
+    for row in rows:
+        table.add_row(
+            row["period"],
+            str(row["runs"]),
+            *("-" if row[key] is None else f"{row[key]:,.2f}" for key in ("min", "avg", "max")),
+        )
+    console.print(table)
+
+
+@runs_app.command("rebuild")
+def runs_rebuild(
+    run_dir: str = typer.Option(".reconflow/runs", help="Runs directory"),
+) -> None:
+    """Re-index the run catalog from every summary.json."""
+    from reconflow.report.catalog import RunCatalog
+
+    count = RunCatalog(run_dir).rebuild()
+    console.print(f"[green]✓[/green] Indexed {count} runs")
+
+
 if __name__ == "__main__":
     app()
@@ -2,16 +2,34 @@
 
 from reconflow.config.loader import load_config
 from reconflow.config.models import (
+    ArrowSource,
+    AssuranceControl,
+    CacheConfig,
     CSVSource,
+    DataSource,
     MatchingConfig,
     OutputConfig,
+    ParquetSource,
+    PricingConfig,
+    PricingTier,
+    QualityConfig,
     ReconFlowConfig,
+    Source,
 )
 
 __all__ = [
     "ReconFlowConfig",
+    "AssuranceControl",
+    "DataSource",
     "CSVSource",
+    "ParquetSource",
+    "ArrowSource",
+    "Source",
     "MatchingConfig",
     "OutputConfig",
+    "PricingConfig",
+    "PricingTier",
+    "QualityConfig",
+    "CacheConfig",
     "load_config",
 ]
@@ -2,29 +2,104 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Discriminator, Field, Tag, field_validator, model_validator
 
 
-class CSVSource(BaseModel):
-    """Configuration for a CSV data source."""
+class DataSource(BaseModel):
+    """Fields shared by every data source type."""
 
-    path: str = Field(..., description="Path to CSV file")
+    path: str = Field(..., description="Path to the data file")
     date_field: str = Field(default="date", description="Column name for date")
     reference_field: str = Field(default="reference", description="Column name for reference")
     amount_field: str = Field(default="amount", description="Column name for amount")
+    columns: list[str] | None = Field(
+        default=None,
+        description="Extra payload columns to load; None loads every column",
+    )
+
+    def selected_columns(self) -> list[str] | None:
+        """Columns to load: the mapped fields plus ``columns``, or None for all."""
+        if self.columns is None:
+            return None
+        fields = [self.date_field, self.reference_field, self.amount_field, *self.columns]
+        return list(dict.fromkeys(fields))
+
+
+class CSVSource(DataSource):
+    """Configuration for a CSV data source."""
+
+    type: Literal["csv"] = Field(default="csv", description="Source type")
+    engine: Literal["c", "pyarrow"] = Field(
+        default="c",
+        description="CSV parser: pandas C engine or multithreaded pyarrow",
+    )
+
+
+class ParquetSource(DataSource):
+    """Configuration for a Parquet data source."""
+
+    type: Literal["parquet"] = Field(..., description="Source type")
+    date_from: str | None = Field(
+        default=None,
+        description="Only load rows with date_field on or after this date (pushed down)",
+    )
+    date_to: str | None = Field(
+        default=None,
+        description="Only load rows with date_field on or before this date (pushed down)",
+    )
+
+
+class ArrowSource(DataSource):
+    """Configuration for an Arrow IPC (Feather v2) data source, read memory-mapped."""
+
+    type: Literal["arrow"] = Field(..., description="Source type")
+
+
+def _source_type(value: Any) -> str:
+    """Discriminator for sources; ``type`` defaults to csv for older configs."""
+    if isinstance(value, dict):
+        return value.get("type", "csv")
+    return getattr(value, "type", "csv")
+
+
+Source = Annotated[
+    Annotated[CSVSource, Tag("csv")]
+    | Annotated[ParquetSource, Tag("parquet")]
+    | Annotated[ArrowSource, Tag("arrow")],
+    Discriminator(_source_type),
+]
+
+
+class PricingTier(BaseModel):
+    """One band of tiered pricing, applying to amounts up to ``up_to``."""
+
+    up_to: float | None = Field(
+        default=None,
+        description="Upper bound of the band (inclusive); None for the last, open band",
+    )
+    rate: float = Field(default=0.0, ge=0, le=1, description="Rate applied to the whole amount")
+    flat_fee: float = Field(default=0.0, ge=0, description="Flat fee added in this band")
 
 
 class PricingConfig(BaseModel):
     """Configuration for pricing calculations."""
 
+    enabled: bool = Field(
+        default=False,
+        description="Add each product record's expected fee (_expected_fee) during runs",
+    )
     strategy: Literal["percentage", "flat", "tiered"] = Field(
         default="percentage",
         description="Pricing strategy to use",
     )
     rate: float = Field(default=0.0, description="Rate for percentage pricing")
     flat_fee: float = Field(default=0.0, description="Flat fee amount")
+    tiers: list[PricingTier] = Field(
+        default_factory=list,
+        description="Bands for tiered pricing, in increasing order of up_to",
+    )
     cap: float | None = Field(default=None, description="Maximum fee cap")
     decimal_precision: int = Field(default=2, description="Decimal places for amounts")
 
@@ -35,11 +110,77 @@ class PricingConfig(BaseModel):
             raise ValueError("Rate must be between 0 and 1")
         return v
 
+    @model_validator(mode="after")
+    def tiers_must_be_ordered(self) -> PricingConfig:
+        if self.strategy == "tiered" and not self.tiers:
+            raise ValueError("Tiered pricing needs at least one tier")
+        bounds = [tier.up_to for tier in self.tiers]
+        if None in bounds[:-1]:
+            raise ValueError("Only the last tier may omit up_to")
+        bounds = [bound for bound in bounds if bound is not None]
+        if any(low >= high for low, high in zip(bounds, bounds[1:], strict=False)):
+            raise ValueError("Tier up_to values must be strictly increasing")
+        return self
+
+
+class SubsetSumConfig(BaseModel):
+    """Configuration for subset-sum matching of residual breaks."""
+
+    enabled: bool = Field(
+        default=False, description="Match residual CBA entries to product subsets"
+    )
+    max_subset_size: int = Field(
+        default=3,
+        ge=2,
+        le=8,
+        description="Maximum product records summed into one CBA entry",
+    )
+    date_window_days: int = Field(
+        default=2,
+        ge=0,
+        description="Maximum days between a product record and the CBA entry",
+    )
+    counterparty_field: str | None = Field(
+        default=None,
+        description="Column both sides must agree on, e.g. a counterparty code",
+    )
+    max_candidates: int = Field(
+        default=24,
+        ge=2,
+        le=40,
+        description="Maximum product records searched per CBA entry (closest in date)",
+    )
+
+
+class FuzzyConfig(BaseModel):
+    """Configuration for fuzzy reference matching of residual breaks."""
+
+    enabled: bool = Field(
+        default=False, description="Propose residual pairs with similar references"
+    )
+    min_similarity: float = Field(
+        default=0.8,
+        gt=0,
+        le=1,
+        description="Minimum 1 - edit distance / longer reference length",
+    )
+    q: int = Field(default=3, ge=2, le=5, description="q-gram length of the candidate index")
+    date_window_days: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum days between the two records of a pair",
+    )
+    max_candidates: int = Field(
+        default=3,
+        ge=1,
+        description="Maximum proposals per product record",
+    )
+
 
 class MatchingConfig(BaseModel):
     """Configuration for matching logic."""
 
-    strategy: Literal["exact_reference", "group_sum"] = Field(
+    strategy: Literal["exact_reference", "group_sum", "date_amount_window"] = Field(
         default="exact_reference",
         description="Matching strategy to use",
     )
@@ -51,18 +192,59 @@ class MatchingConfig(BaseModel):
         default=True,
         description="Whether to normalize references before matching",
     )
+    date_window_days: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum days between paired records (date_amount_window strategy)",
+    )
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for in-memory matching (1 matches in-process)",
+    )
+    memory_budget_mb: int | None = Field(
+        default=None,
+        gt=0,
+        description="Match out-of-core in hash partitions within this memory budget (MB)",
+    )
+    spill_dir: str | None = Field(
+        default=None,
+        description="Directory for out-of-core partition files (default: system temp)",
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Match only new records plus open items carried forward from the last run",
+    )
+    subset_sum: SubsetSumConfig = Field(default_factory=SubsetSumConfig)
+    fuzzy: FuzzyConfig = Field(default_factory=FuzzyConfig)
 
 
 class QualityConfig(BaseModel):
     """Configuration for data quality checks."""
 
+    enabled: bool = Field(default=False, description="Check each source before matching")
     min_record_count: int = Field(default=0, description="Minimum expected records")
-    max_duplicate_pct: float = Field(default=0.01, description="Maximum duplicate percentage")
+    max_duplicate_pct: float = Field(
+        default=0.01,
+        description="Maximum fraction of records repeating an earlier reference (0.01 = 1%)",
+    )
+    max_invalid_pct: float = Field(
+        default=0.01,
+        description="Maximum fraction of missing or unparseable values per required field",
+    )
     required_fields: list[str] = Field(
         default_factory=lambda: ["date", "reference", "amount"],
-        description="Fields that must be present",
+        description="Fields that must be present; date, reference and amount map to each "
+        "source's configured columns",
     )
 
+    @field_validator("max_duplicate_pct", "max_invalid_pct")
+    @classmethod
+    def pct_must_be_fraction(cls, v: float) -> float:
+        if not 0 <= v <= 1:
+            raise ValueError(f"Must be a fraction between 0 and 1 (0.05 = 5%), got {v}")
+        return v
+
 
 class AssuranceControl(BaseModel):
     """Definition of an assurance control."""
@@ -83,7 +265,26 @@ class OutputConfig(BaseModel):
     """Configuration for output settings."""
 
     run_dir: str = Field(default=".reconflow/runs", description="Directory for run outputs")
-    format: Literal["csv", "json"] = Field(default="csv", description="Output format")
+    format: Literal["csv", "json", "parquet"] = Field(default="csv", description="Output format")
+    compression: Literal["snappy", "zstd", "gzip", "lz4", "brotli", "none"] = Field(
+        default="snappy", description="Compression codec for parquet output"
+    )
+    index: bool = Field(
+        default=True,
+        description="Index artifacts for paging and reference lookups (explain --show)",
+    )
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the cache of prepared sources."""
+
+    enabled: bool = Field(default=False, description="Reuse prepared sources across runs")
+    dir: str = Field(default=".reconflow/cache", description="Cache directory")
+    max_size_mb: int = Field(
+        default=1024,
+        gt=0,
+        description="Evict least recently used entries beyond this size (MB)",
+    )
 
 
 class ReconFlowConfig(BaseModel):
@@ -92,11 +293,12 @@ class ReconFlowConfig(BaseModel):
     version: str = Field(default="1", description="Config schema version")
     pipeline_name: str = Field(default="default", description="Pipeline name")
 
-    product: CSVSource = Field(..., description="Product data source")
-    cba: CSVSource = Field(..., description="CBA/ledger data source")
+    product: Source = Field(..., description="Product data source")
+    cba: Source = Field(..., description="CBA/ledger data source")
 
     pricing: PricingConfig = Field(default_factory=PricingConfig)
     matching: MatchingConfig = Field(default_factory=MatchingConfig)
     quality: QualityConfig = Field(default_factory=QualityConfig)
     assurance: AssuranceConfig = Field(default_factory=AssuranceConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
@@ -0,0 +1,137 @@
+"""Incremental reconciliation state: seen records and carried-forward open items."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from reconflow.io import read_parquet
+from reconflow.io.arrow import require_pyarrow
+
+SIDES = ("source", "target")
+
+
+def row_hashes(frame: pd.DataFrame) -> np.ndarray:
+    """Hash each record's values (not its index) to a uint64."""
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+
+
+def _isin_sorted(values: np.ndarray, sorted_values: np.ndarray) -> np.ndarray:
+    """Vectorized membership test against a sorted array."""
+    if len(sorted_values) == 0:
+        return np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(sorted_values, values).clip(max=len(sorted_values) - 1)
+    return sorted_values[pos] == values
+
+
+class IncrementalState:
+    """
+    Carry-forward state of an incremental pipeline.
+
+    For each side the state keeps the sorted hashes of every record already
+    reconciled (``seen_<side>.npy``) and the records still unmatched after
+    the last run, with their loaded dtypes (``open_<side>.parquet``). A run
+    then only matches records it has not seen before plus the open items,
+    so its cost follows the delta rather than the whole input window.
+
+    Each save writes these files to a new generation directory, then points
+    the ``CURRENT`` file at it with a single rename, so readers always see
+    the files of one run and a failed save leaves the previous state intact.
+    Saving needs pyarrow.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._pending: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def for_pipeline(cls, run_dir: str, pipeline_name: str) -> IncrementalState:
+        """State of a pipeline, stored under ``<run_dir>/<pipeline_name>/state``."""
+        return cls(Path(run_dir) / pipeline_name / "state")
+
+    def _generation(self) -> Path | None:
+        """Directory of the current state files, or None if nothing was saved."""
+        try:
+            name = (self.directory / "CURRENT").read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return self.directory / name
+
+    def reset(self) -> None:
+        """Forget all state, so the next run reconciles its inputs in full."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._pending.clear()
+
+    def seen(self, side: str) -> np.ndarray:
+        """Sorted hashes of the records reconciled so far on one side."""
+        generation = self._generation()
+        if generation is None:
+            return np.empty(0, dtype=np.uint64)
+        return np.load(generation / f"seen_{side}.npy")
+
+    def open_items(self, side: str) -> pd.DataFrame:
+        """Records of one side left unmatched by the last run."""
+        generation = self._generation()
+        if generation is None:
+            return pd.DataFrame()
+        require_pyarrow("Incremental matching")
+        return read_parquet(generation / f"open_{side}.parquet")
+
+    def delta(self, side: str, frame: pd.DataFrame) -> tuple[pd.DataFrame, int, int]:
+        """
+        Select the records of one side that this run has to match.
+
+        Args:
+            side: ``source`` or ``target``
+            frame: All records loaded for this side
+
+        Returns:
+            Tuple of (open items followed by unseen records, number of unseen
+            records, number of open items)
+        """
+        hashes = row_hashes(frame)
+        is_new = ~_isin_sorted(hashes, self.seen(side))
+        self._pending[side] = hashes[is_new]
+
+        carried = self.open_items(side)
+        new = frame[is_new]
+        if carried.empty:
+            return new.reset_index(drop=True), len(new), 0
+        return pd.concat([carried, new], ignore_index=True), len(new), len(carried)
+
+    def save(self, open_items: dict[str, pd.DataFrame]) -> None:
+        """
+        Record a finished run: its open items and the records it has seen.
+
+        Args:
+            open_items: Unmatched records by side, in their loaded form
+        """
+        require_pyarrow("Incremental matching")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        generation = Path(tempfile.mkdtemp(prefix="gen-", dir=self.directory))
+        try:
+            for side in SIDES:
+                pending = self._pending.pop(side, np.empty(0, np.uint64))
+                seen = np.union1d(self.seen(side), pending)
+                np.save(generation / f"seen_{side}.npy", seen.astype(np.uint64))
+                open_items[side].to_parquet(generation / f"open_{side}.parquet", index=False)
+
+            pointer = generation.with_suffix(".current")
+            pointer.write_text(generation.name, encoding="utf-8")
+            os.replace(pointer, self.directory / "CURRENT")
+        except BaseException:
+            shutil.rmtree(generation, ignore_errors=True)
+            raise
+
+        # Earlier generations, and any left by failed saves, are no longer read
+        for path in self.directory.glob("gen-*"):
+            if path.is_dir() and path != generation:
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.is_file():
+                path.unlink(missing_ok=True)
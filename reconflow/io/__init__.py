@@ -1,6 +1,34 @@
 """Input/output utilities."""
 
-from reconflow.io.coercion import coerce_amount, coerce_date
-from reconflow.io.csv import read_csv, write_csv
+from typing import TYPE_CHECKING
 
-__all__ = ["read_csv", "write_csv", "coerce_amount", "coerce_date"]
+from reconflow._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from reconflow.io.arrow import read_arrow
+    from reconflow.io.coercion import coerce_amount, coerce_date
+    from reconflow.io.csv import read_csv, read_csv_chunks, write_csv
+    from reconflow.io.parquet import read_parquet
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "read_csv": "reconflow.io.csv",
+        "read_csv_chunks": "reconflow.io.csv",
+        "read_parquet": "reconflow.io.parquet",
+        "read_arrow": "reconflow.io.arrow",
+        "write_csv": "reconflow.io.csv",
+        "coerce_amount": "reconflow.io.coercion",
+        "coerce_date": "reconflow.io.coercion",
+    },
+)
+
+__all__ = [
+    "read_csv",
+    "read_csv_chunks",
+    "read_parquet",
+    "read_arrow",
+    "write_csv",
+    "coerce_amount",
+    "coerce_date",
+]
@@ -0,0 +1,100 @@
+"""Arrow IPC reading and Arrow-to-pandas conversion."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def require_pyarrow(feature: str) -> None:
+    """Raise a helpful ImportError if pyarrow is not installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(f"{feature} requires pyarrow: pip install 'reconflow[arrow]'") from e
+
+
+def select_columns(names: list[str], columns: list[str] | None, path: str | Path) -> list[str]:
+    """
+    Resolve a column projection against the columns of a file.
+
+    Args:
+        names: Columns available in the file, in file order
+        columns: Requested columns, or None for all
+        path: File path, for the error message
+
+    Returns:
+        Requested columns in file order
+
+    Raises:
+        ValueError: If a requested column is not in the file
+    """
+    if columns is None:
+        return list(names)
+
+    missing = [column for column in columns if column not in names]
+    if missing:
+        raise ValueError(f"Columns not found in {path}: {missing}")
+    return [name for name in names if name in columns]
+
+
+def table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas, keeping strings Arrow-backed.
+
+    String columns become pandas' Arrow-backed string dtype with NaN for
+    missing values, the same dtype the CSV readers return.
+    """
+    import pyarrow as pa
+
+    dtype = _arrow_string_dtype()
+    mapping = {pa.string(): dtype, pa.large_string(): dtype}
+    return table.to_pandas(types_mapper=mapping.get)
+
+
+def _arrow_string_dtype() -> pd.StringDtype:
+    """Arrow-backed string dtype with NaN for missing values, like pandas' "str"."""
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pandas < 3
+        return pd.StringDtype("pyarrow_numpy")
+
+
+def read_arrow(path: str | Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Read an Arrow IPC file (Feather v2) or stream through a memory map.
+
+    The file is memory-mapped, so record batches are read without copying
+    them into Python-managed memory first.
+
+    Args:
+        path: Path to the Arrow IPC file
+        columns: Columns to load, in file order (default: all columns)
+
+    Returns:
+        DataFrame with the file's contents
+    """
+    path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Arrow file not found: {path}")
+
+    require_pyarrow("Arrow sources")
+    import pyarrow as pa
+
+    # The table's buffers keep the mapping alive, so it is not closed here
+    source = pa.memory_map(str(path), "r")
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        table = pa.ipc.open_stream(source).read_all()
+
+    table = table.select(select_columns(table.column_names, columns, path))
+    return table_to_pandas(table)
@@ -2,14 +2,43 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Literal
 
 import pandas as pd
 
+from reconflow.io.arrow import require_pyarrow, select_columns, table_to_pandas
+
+# pandas' default na_values, so both engines read the same cells as missing
+_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
 
 def read_csv(
     path: str | Path,
     dtype: dict | None = None,
+    columns: list[str] | None = None,
+    engine: Literal["c", "pyarrow"] = "c",
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -18,9 +47,15 @@ def read_csv(
     By default, reads all columns as strings to preserve data integrity
     (e.g., leading zeros in references).
 
+    The ``pyarrow`` engine parses with pyarrow's multithreaded CSV reader and
+    returns Arrow-backed string columns; it always reads strings, so it does
+    not accept ``dtype`` or extra pandas arguments.
+
     Args:
         path: Path to the CSV file
         dtype: Column data types (default: all strings)
+        columns: Columns to load, in file order (default: all columns)
+        engine: Parser to use, "c" (pandas) or "pyarrow"
         **kwargs: Additional arguments passed to pd.read_csv
 
     Returns:
@@ -28,13 +63,75 @@ def read_csv(
     """
     path = Path(path)
 
+    if not path.exists():
+        raise FileNotFoundError(f"CSV file not found: {path}")
+
+    if engine == "pyarrow":
+        if dtype is not None or kwargs:
+            raise ValueError("The pyarrow engine reads all columns as strings and takes no options")
+        return _read_csv_arrow(path, columns)
+
+    if dtype is None:
+        dtype = str
+
+    return pd.read_csv(path, dtype=dtype, usecols=columns, **kwargs)
+
+
+def _read_csv_arrow(path: Path, columns: list[str] | None) -> pd.DataFrame:
+    """Read a CSV with pyarrow into Arrow-backed string columns."""
+    require_pyarrow("engine='pyarrow'")
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    header = select_columns(list(pd.read_csv(path, nrows=0).columns), columns, path)
+
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=header,
+            column_types=dict.fromkeys(header, pa.string()),
+            null_values=_NULL_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+
+    return table_to_pandas(table)
+
+
+def read_csv_chunks(
+    path: str | Path,
+    chunksize: int,
+    dtype: dict | None = None,
+    columns: list[str] | None = None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV file as DataFrames of at most ``chunksize`` rows.
+
+    Uses the same defaults as :func:`read_csv`, so concatenating the chunks
+    gives the same frame as reading the file in one go.
+
+    Args:
+        path: Path to the CSV file
+        chunksize: Maximum number of rows per chunk
+        dtype: Column data types (default: all strings)
+        columns: Columns to load, in file order (default: all columns)
+        **kwargs: Additional arguments passed to pd.read_csv
+
+    Yields:
+        DataFrames with consecutive rows of the file
+    """
+    path = Path(path)
+
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
 
     if dtype is None:
         dtype = str
 
-    return pd.read_csv(path, dtype=dtype, **kwargs)
+    with pd.read_csv(path, dtype=dtype, usecols=columns, chunksize=chunksize, **kwargs) as reader:
+        yield from reader
 
 
 def write_csv(
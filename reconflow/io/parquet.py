@@ -0,0 +1,84 @@
+"""Parquet reading utilities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from reconflow.io.arrow import require_pyarrow, select_columns, table_to_pandas
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+_OPERATORS = {
+    "==": "__eq__",
+    "!=": "__ne__",
+    "<": "__lt__",
+    "<=": "__le__",
+    ">": "__gt__",
+    ">=": "__ge__",
+}
+
+
+def read_parquet(
+    path: str | Path,
+    columns: list[str] | None = None,
+    filters: list[tuple[str, str, Any]] | None = None,
+) -> pd.DataFrame:
+    """
+    Read a Parquet file with column projection and predicate pushdown.
+
+    Filters are combined with AND and pushed down to the reader, so row
+    groups whose statistics rule them out are never decoded. Filter values
+    are cast to the column's type, so ``("date", ">=", "2026-01-01")`` works
+    for string, date and timestamp columns alike.
+
+    Args:
+        path: Path to the Parquet file
+        columns: Columns to load, in file order (default: all columns)
+        filters: ``(column, operator, value)`` predicates, e.g. ``("date", ">=", "2026-01-01")``
+
+    Returns:
+        DataFrame with the selected rows and columns
+    """
+    path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Parquet file not found: {path}")
+
+    require_pyarrow("Parquet sources")
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path)
+    table = pq.read_table(
+        path,
+        columns=select_columns(schema.names, columns, path),
+        filters=_filter_expression(schema, filters or []),
+        memory_map=True,
+    )
+    return table_to_pandas(table)
+
+
+def _filter_expression(
+    schema: pa.Schema,
+    filters: list[tuple[str, str, Any]],
+) -> ds.Expression | None:
+    """Build a pyarrow expression from predicates, casting values to column types."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    expression = None
+    for column, op, value in filters:
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        if column not in schema.names:
+            raise ValueError(f"Filter column not found: {column}")
+
+        scalar = pa.scalar(value).cast(schema.field(column).type)
+        predicate = getattr(ds.field(column), _OPERATORS[op])(scalar)
+        expression = predicate if expression is None else expression & predicate
+
+    return expression
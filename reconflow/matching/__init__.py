@@ -1,6 +1,30 @@
 """Matching engine for reconciliation."""
 
-from reconflow.matching.engine import match_records
-from reconflow.matching.strategies import ExactReferenceStrategy
+from typing import TYPE_CHECKING
 
-__all__ = ["match_records", "ExactReferenceStrategy"]
+from reconflow._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from reconflow.matching.engine import match_records
+    from reconflow.matching.partitioned import match_out_of_core
+    from reconflow.matching.strategies import ExactReferenceStrategy, GroupSumStrategy
+    from reconflow.matching.window import DateAmountWindowStrategy
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "match_records": "reconflow.matching.engine",
+        "match_out_of_core": "reconflow.matching.partitioned",
+        "ExactReferenceStrategy": "reconflow.matching.strategies",
+        "GroupSumStrategy": "reconflow.matching.strategies",
+        "DateAmountWindowStrategy": "reconflow.matching.window",
+    },
+)
+
+__all__ = [
+    "match_records",
+    "match_out_of_core",
+    "ExactReferenceStrategy",
+    "GroupSumStrategy",
+    "DateAmountWindowStrategy",
+]
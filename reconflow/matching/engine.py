@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import pandas as pd
 
+from reconflow.matching.parallel import match_parallel
 from reconflow.matching.strategies import (
     ExactReferenceStrategy,
+    GroupSumStrategy,
+    KeyedStrategy,
     MatchingStrategy,
     MatchResult,
 )
+from reconflow.matching.window import DateAmountWindowStrategy
 
 _STRATEGIES: dict[str, MatchingStrategy] = {
     "exact_reference": ExactReferenceStrategy(),
+    "group_sum": GroupSumStrategy(),
+    "date_amount_window": DateAmountWindowStrategy(),
 }
 
 
@@ -33,6 +39,11 @@ def match_records(
     tolerance: float = 0.01,
     normalize_refs: bool = True,
     decimal_precision: int = 2,
+    workers: int = 1,
+    prepared: bool = False,
+    source_date_col: str = "date",
+    target_date_col: str = "date",
+    date_window_days: int = 0,
 ) -> MatchResult:
     """
     Match records between source and target DataFrames.
@@ -48,12 +59,47 @@ def match_records(
         tolerance: Amount tolerance
         normalize_refs: Whether to normalize references
         decimal_precision: Decimal precision
+        workers: Worker processes for keyed strategies (1 matches in-process)
+        prepared: Whether both frames were already prepared by the (keyed) strategy
+        source_date_col: Date column in source (date-based strategies)
+        target_date_col: Date column in target (date-based strategies)
+        date_window_days: Maximum days between paired records (date-based strategies)
 
     Returns:
         MatchResult with categorized records
     """
     matcher = get_strategy(strategy)
 
+    if prepared and not isinstance(matcher, KeyedStrategy):
+        raise ValueError(f"Strategy {strategy} does not accept prepared frames")
+
+    if workers > 1 and isinstance(matcher, KeyedStrategy):
+        return match_parallel(
+            matcher,
+            source=source,
+            target=target,
+            source_ref_col=source_ref_col,
+            target_ref_col=target_ref_col,
+            source_amt_col=source_amt_col,
+            target_amt_col=target_amt_col,
+            tolerance=tolerance,
+            normalize_refs=normalize_refs,
+            decimal_precision=decimal_precision,
+            workers=workers,
+            prepared=prepared,
+        )
+
+    if prepared:
+        return matcher.match_prepared(
+            source,
+            target,
+            source_ref_col=source_ref_col,
+            target_ref_col=target_ref_col,
+            tolerance=tolerance,
+            normalize_refs=normalize_refs,
+            decimal_precision=decimal_precision,
+        )
+
     return matcher.match(
         source=source,
         target=target,
@@ -64,4 +110,7 @@ def match_records(
         tolerance=tolerance,
         normalize_refs=normalize_refs,
         decimal_precision=decimal_precision,
+        source_date_col=source_date_col,
+        target_date_col=target_date_col,
+        date_window_days=date_window_days,
     )
@@ -0,0 +1,231 @@
+"""Fuzzy reference matching of residual breaks with a blocked q-gram index."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from reconflow.matching.residuals import NO_DAY, day_numbers, minor_units, side_column
+from reconflow.matching.strategies import MatchResult
+from reconflow.normalize.strings import to_string_series
+
+# Pads references so their first and last characters start and end q-grams
+_PAD = "\x00"
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance between two strings, capped at ``max_distance + 1``.
+
+    Uses Myers' bit-parallel algorithm: the column of the distance matrix is
+    kept as bit vectors over ``a``, so each character of ``b`` costs a few
+    integer operations instead of a loop over ``a``.
+    """
+    beyond = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return beyond
+    if not a or not b:
+        return min(len(a) + len(b), beyond)
+
+    peq: dict[str, int] = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    pv, mv, score = full, 0, len(a)
+
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv & full
+
+    return min(score, beyond)
+
+
+def _qgrams(keys: pd.Series, blocks: np.ndarray, q: int) -> pd.DataFrame:
+    """
+    Explode keys into their distinct padded q-grams.
+
+    Returns:
+        Frame of (row position, block, gram) with one row per distinct gram
+    """
+    padded = to_string_series(_PAD * (q - 1) + keys + _PAD * (q - 1))
+    lengths = padded.str.len().to_numpy()
+    positions = np.arange(len(keys))
+
+    parts = []
+    for start in range(int(lengths.max(initial=0)) - q + 1):
+        rows = lengths >= start + q
+        parts.append(
+            pd.DataFrame(
+                {
+                    "pos": positions[rows],
+                    "block": blocks[rows],
+                    "gram": padded[rows].str.slice(start, start + q).to_numpy(),
+                }
+            )
+        )
+
+    if not parts:
+        return pd.DataFrame({"pos": [], "block": [], "gram": []})
+    return pd.concat(parts, ignore_index=True).drop_duplicates()
+
+
+def _keys(frame: pd.DataFrame, ref_col: str, side: str, normalize_refs: bool) -> pd.Series:
+    """One side's matching keys in a result bucket."""
+    column = "_norm_ref" if normalize_refs else side_column(frame, ref_col, side)
+    return to_string_series(frame[column]).reset_index(drop=True)
+
+
+def match_fuzzy_references(
+    result: MatchResult,
+    source_ref_col: str,
+    target_ref_col: str,
+    source_date_col: str,
+    target_date_col: str,
+    normalize_refs: bool = True,
+    min_similarity: float = 0.8,
+    q: int = 3,
+    date_window_days: int = 0,
+    max_candidates: int = 3,
+) -> MatchResult:
+    """
+    Propose pairs of unmatched records whose references nearly agree.
+
+    Only records with the same standardized amount and a date within
+    ``date_window_days`` are compared. Inside each block an inverted q-gram
+    index yields candidate pairs, and pairs sharing too few q-grams to reach
+    ``min_similarity`` are discarded before the edit distance is computed.
+    Each edit destroys at most ``q`` of a key's distinct padded q-grams, so
+    keys within ``d`` edits share at least ``max(grams) - d * q`` of them.
+
+    Records stay in their buckets; proposals are returned in
+    ``fuzzy_candidates`` for review.
+
+    Args:
+        result: Result of a matching strategy
+        source_ref_col: Reference column of the source records
+        target_ref_col: Reference column of the target records
+        source_date_col: Date column of the source records
+        target_date_col: Date column of the target records
+        normalize_refs: Whether keys are normalized references (``_norm_ref``)
+        min_similarity: Minimum ``1 - distance / longer key length``
+        q: q-gram length
+        date_window_days: Maximum days between the two records
+        max_candidates: Maximum proposals per source record, best first
+
+    Returns:
+        MatchResult with ``fuzzy_candidates``: one row per proposed pair, the
+        source record with the target record's columns filled in, plus
+        ``_source_key``, ``_target_key``, ``_edit_distance`` and ``_similarity``
+    """
+    sources = result.missing_in_target
+    targets = result.missing_in_source
+    if sources.empty or targets.empty:
+        return result
+
+    src_keys = _keys(sources, source_ref_col, "source", normalize_refs)
+    tgt_keys = _keys(targets, target_ref_col, "target", normalize_refs)
+
+    # Block on (amount, day); targets are repeated once per day in the window
+    src_amt = minor_units(sources, "source")
+    tgt_amt = minor_units(targets, "target")
+    src_day = day_numbers(sources[side_column(sources, source_date_col, "source")])
+    tgt_day = day_numbers(targets[side_column(targets, target_date_col, "target")])
+
+    offsets = np.arange(-date_window_days, date_window_days + 1)
+    tgt_rows = np.repeat(np.arange(len(targets)), len(offsets))
+    tgt_block_day = tgt_day[tgt_rows] + np.tile(offsets, len(targets))
+
+    blocks = pd.DataFrame(
+        {
+            "amount": np.concatenate([src_amt, tgt_amt[tgt_rows]]),
+            "day": np.concatenate([src_day, tgt_block_day]),
+        }
+    )
+    codes = blocks.groupby(["amount", "day"], sort=False).ngroup().to_numpy()
+    src_block, tgt_block = codes[: len(sources)], codes[len(sources) :]
+
+    src_ok = (src_keys.str.len() > 0).to_numpy() & (src_day != NO_DAY)
+    tgt_ok = (tgt_keys.str.len() > 0).to_numpy()[tgt_rows] & (tgt_day[tgt_rows] != NO_DAY)
+
+    src_grams = _qgrams(src_keys[src_ok], src_block[src_ok], q)
+    src_grams["pos"] = np.flatnonzero(src_ok)[src_grams["pos"].to_numpy(dtype=np.int64)]
+    tgt_grams = _qgrams(tgt_keys.iloc[tgt_rows[tgt_ok]], tgt_block[tgt_ok], q)
+    tgt_grams["pos"] = tgt_rows[tgt_ok][tgt_grams["pos"].to_numpy(dtype=np.int64)]
+    tgt_grams = tgt_grams.drop_duplicates()
+
+    shared = (
+        src_grams.merge(tgt_grams, on=["block", "gram"], suffixes=("_source", "_target"))
+        .groupby(["pos_source", "pos_target"], sort=False)
+        .size()
+        .rename("shared")
+        .reset_index()
+    )
+
+    src_len = src_keys.str.len().to_numpy()
+    tgt_len = tgt_keys.str.len().to_numpy()
+    src_count = np.bincount(src_grams["pos"], minlength=len(sources))
+    tgt_count = np.bincount(
+        tgt_grams.drop_duplicates(["pos", "gram"])["pos"], minlength=len(targets)
+    )
+
+    pair_src = shared["pos_source"].to_numpy(dtype=np.int64)
+    pair_tgt = shared["pos_target"].to_numpy(dtype=np.int64)
+    longest = np.maximum(src_len[pair_src], tgt_len[pair_tgt])
+    max_distance = np.floor((1 - min_similarity) * longest + 1e-9).astype(np.int64)
+    needed = np.maximum(src_count[pair_src], tgt_count[pair_tgt]) - max_distance * q
+
+    keep = shared["shared"].to_numpy() >= needed
+    pair_src, pair_tgt = pair_src[keep], pair_tgt[keep]
+    longest, max_distance = longest[keep], max_distance[keep]
+
+    src_list, tgt_list = src_keys.tolist(), tgt_keys.tolist()
+    distances = np.array(
+        [
+            edit_distance(src_list[s], tgt_list[t], int(d))
+            for s, t, d in zip(pair_src, pair_tgt, max_distance, strict=True)
+        ],
+        dtype=np.int64,
+    )
+    similarity = 1 - distances / np.maximum(longest, 1)
+
+    pairs = pd.DataFrame(
+        {
+            "src": pair_src,
+            "tgt": pair_tgt,
+            "distance": distances,
+            "similarity": similarity,
+        }
+    )
+    pairs = pairs[(distances > 0) & (distances <= max_distance) & (similarity >= min_similarity)]
+    pairs = (
+        pairs.sort_values(["src", "similarity", "tgt"], ascending=[True, False, True])
+        .groupby("src", sort=False)
+        .head(max_candidates)
+    )
+
+    src_pos = pairs["src"].to_numpy()
+    tgt_pos = pairs["tgt"].to_numpy()
+    candidates = (
+        sources.iloc[src_pos]
+        .reset_index(drop=True)
+        .fillna(targets.iloc[tgt_pos].reset_index(drop=True))
+    )
+    candidates["_source_key"] = src_keys.to_numpy()[src_pos]
+    candidates["_target_key"] = tgt_keys.to_numpy()[tgt_pos]
+    candidates["_edit_distance"] = pairs["distance"].to_numpy()
+    candidates["_similarity"] = pairs["similarity"].round(4).to_numpy()
+
+    return result.replace(fuzzy_candidates=candidates)
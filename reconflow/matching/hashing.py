@@ -0,0 +1,27 @@
+"""Hash partitioning of matching keys."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def partition_ids(keys: pd.Series, n_partitions: int) -> np.ndarray:
+    """
+    Assign each key to a partition by a stable hash of its value.
+
+    Equal keys always land in the same partition, whichever frame they come
+    from, so matching partition ``i`` of both sides sees every candidate pair.
+
+    Args:
+        keys: Series of matching keys (e.g. normalized references)
+        n_partitions: Number of partitions
+
+    Returns:
+        Array of partition numbers in ``range(n_partitions)``
+    """
+    if n_partitions <= 1:
+        return np.zeros(len(keys), dtype=np.int64)
+
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return (hashes % np.uint64(n_partitions)).astype(np.int64)
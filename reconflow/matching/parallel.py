@@ -0,0 +1,168 @@
+"""Multi-core matching for keyed strategies."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from reconflow.matching.hashing import partition_ids
+from reconflow.matching.strategies import KeyedStrategy, MatchResult
+
+# Shards per worker; more shards even out skewed keys at some pickling cost
+_SHARDS_PER_WORKER = 2
+
+
+def _row_chunks(frame: pd.DataFrame, n_chunks: int) -> list[pd.DataFrame]:
+    """Split a frame into contiguous row ranges."""
+    bounds = np.linspace(0, len(frame), n_chunks + 1, dtype=np.int64)
+    return [frame.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:], strict=True)]
+
+
+def _shards(frame: pd.DataFrame, key: str, n_shards: int) -> list[pd.DataFrame]:
+    """Split a frame by key hash, keeping the original row order in each shard."""
+    ids = partition_ids(frame[key], n_shards)
+    return [frame[ids == shard] for shard in range(n_shards)]
+
+
+def _prepare_chunk(
+    matcher: KeyedStrategy,
+    frame: pd.DataFrame,
+    ref_col: str,
+    amt_col: str,
+    normalize_refs: bool,
+    decimal_precision: int,
+) -> pd.DataFrame:
+    """Prepare a chunk and return only the derived columns, to keep pickling small."""
+    prepared = matcher.prepare(frame, ref_col, amt_col, normalize_refs, decimal_precision)
+    return prepared.drop(columns=frame.columns)
+
+
+def _with_derived(frame: pd.DataFrame, derived: list[pd.DataFrame]) -> pd.DataFrame:
+    """Attach prepared columns computed by the workers to a copy of ``frame``."""
+    return pd.concat([frame, pd.concat(derived)], axis=1)
+
+
+def _prepare_parallel(
+    pool: ProcessPoolExecutor,
+    matcher: KeyedStrategy,
+    frame: pd.DataFrame,
+    ref_col: str,
+    amt_col: str,
+    normalize_refs: bool,
+    decimal_precision: int,
+    workers: int,
+) -> pd.DataFrame:
+    """Prepare a frame in row chunks across the pool."""
+    derived = pool.map(
+        _prepare_chunk,
+        [matcher] * workers,
+        _row_chunks(frame, workers),
+        [ref_col] * workers,
+        [amt_col] * workers,
+        [normalize_refs] * workers,
+        [decimal_precision] * workers,
+    )
+    return _with_derived(frame, list(derived))
+
+
+def _join_shard(
+    matcher: KeyedStrategy,
+    src: pd.DataFrame,
+    tgt: pd.DataFrame,
+    src_key: str,
+    tgt_key: str,
+) -> pd.DataFrame:
+    return matcher.join(src, tgt, src_key, tgt_key)
+
+
+def match_parallel(
+    matcher: KeyedStrategy,
+    source: pd.DataFrame,
+    target: pd.DataFrame,
+    source_ref_col: str,
+    target_ref_col: str,
+    source_amt_col: str,
+    target_amt_col: str,
+    tolerance: float = 0.01,
+    normalize_refs: bool = True,
+    decimal_precision: int = 2,
+    workers: int = 2,
+    prepared: bool = False,
+) -> MatchResult:
+    """
+    Match with a keyed strategy across a pool of worker processes.
+
+    Both sides are prepared (normalized and standardized) in row chunks, then
+    split into shards by key hash and joined shard by shard. The joined shards
+    are concatenated in key order before classification, so the result is
+    identical to ``matcher.match`` on the full frames.
+
+    Args:
+        matcher: Keyed matching strategy
+        source: Source DataFrame
+        target: Target DataFrame
+        source_ref_col: Reference column in source
+        target_ref_col: Reference column in target
+        source_amt_col: Amount column in source
+        target_amt_col: Amount column in target
+        tolerance: Amount tolerance
+        normalize_refs: Whether to normalize references
+        decimal_precision: Decimal precision
+        workers: Number of worker processes
+        prepared: Whether both frames already went through ``matcher.prepare``
+
+    Returns:
+        MatchResult with categorized records
+    """
+    src_key, tgt_key = matcher.key_columns(source_ref_col, target_ref_col, normalize_refs)
+    n_shards = workers * _SHARDS_PER_WORKER
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if prepared:
+            src, tgt = source, target
+        else:
+            src = _prepare_parallel(
+                pool,
+                matcher,
+                source,
+                source_ref_col,
+                source_amt_col,
+                normalize_refs,
+                decimal_precision,
+                workers,
+            )
+            tgt = _prepare_parallel(
+                pool,
+                matcher,
+                target,
+                target_ref_col,
+                target_amt_col,
+                normalize_refs,
+                decimal_precision,
+                workers,
+            )
+
+        # Workers only join the slim frames; the result points into src and tgt
+        joined = pool.map(
+            _join_shard,
+            [matcher] * n_shards,
+            _shards(matcher.slim(src, src_key), src_key, n_shards),
+            _shards(matcher.slim(tgt, tgt_key), tgt_key, n_shards),
+            [src_key] * n_shards,
+            [tgt_key] * n_shards,
+        )
+        merged = pd.concat(list(joined), ignore_index=True)
+
+    # Each shard is sorted by key and holds disjoint keys, so a stable sort on
+    # the key restores the row order of a single join over all records.
+    key = merged[src_key]
+    if tgt_key != src_key:
+        key = key.combine_first(merged[tgt_key])
+    order = key.sort_values(kind="stable", na_position="last").index
+    merged = merged.loc[order].reset_index(drop=True)
+
+    return matcher.classify(
+        merged, tolerance, decimal_precision, matcher.sides(src, tgt, src_key, tgt_key)
+    )
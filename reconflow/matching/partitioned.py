@@ -0,0 +1,216 @@
+"""Out-of-core matching over hash partitions of the reference key."""
+
+from __future__ import annotations
+
+import math
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from reconflow.io import coerce_amount, read_csv, read_csv_chunks
+from reconflow.matching.engine import get_strategy, match_records
+from reconflow.matching.hashing import partition_ids
+from reconflow.matching.strategies import KeyedStrategy
+from reconflow.normalize import normalize_reference_series
+from reconflow.report.summary import BUCKETS, RunArtifactWriter
+
+# Peak memory of loading and matching a partition, as a multiple of its CSV size
+# (string columns, normalized copies and the outer-merged frame).
+_WORKING_SET_FACTOR = 8
+
+_SAMPLE_BYTES = 64 * 1024
+
+_MIN_CHUNK_ROWS = 1_000
+
+
+def plan_partitions(paths: list[str | Path], memory_budget_mb: int) -> tuple[int, int]:
+    """
+    Choose a partition count and read chunk size for a memory budget.
+
+    Args:
+        paths: Input CSV files
+        memory_budget_mb: Peak memory budget in megabytes
+
+    Returns:
+        Tuple of (number of partitions, rows per read chunk)
+    """
+    if memory_budget_mb <= 0:
+        raise ValueError("memory_budget_mb must be positive")
+
+    budget = memory_budget_mb * 1024 * 1024
+    input_bytes = sum(Path(path).stat().st_size for path in paths)
+    n_partitions = max(1, math.ceil(input_bytes * _WORKING_SET_FACTOR / budget))
+
+    row_bytes = max(_estimate_row_bytes(path) for path in paths)
+    chunk_rows = max(_MIN_CHUNK_ROWS, budget // (_WORKING_SET_FACTOR * row_bytes))
+
+    return n_partitions, chunk_rows
+
+
+def _estimate_row_bytes(path: str | Path) -> int:
+    """Estimate the average size of a CSV line from the start of the file."""
+    with open(path, "rb") as f:
+        sample = f.read(_SAMPLE_BYTES)
+    return max(1, len(sample) // max(1, sample.count(b"\n")))
+
+
+class _PartitionSpill:
+    """On-disk partitions of one input, written chunk by chunk."""
+
+    def __init__(self, directory: Path, columns: list[str]) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.columns = columns
+
+    def _path(self, partition: int) -> Path:
+        return self.directory / f"part-{partition:05d}.csv"
+
+    def write(self, chunk: pd.DataFrame, ids: np.ndarray) -> None:
+        for partition, part in chunk.groupby(ids, sort=False):
+            path = self._path(int(partition))
+            part.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+    def read(self, partition: int) -> pd.DataFrame:
+        path = self._path(partition)
+        if not path.exists():
+            return pd.DataFrame({column: pd.Series(dtype=str) for column in self.columns})
+        return read_csv(path)
+
+
+def _spill(
+    path: str,
+    directory: Path,
+    ref_col: str,
+    normalize_refs: bool,
+    n_partitions: int,
+    chunk_rows: int,
+    columns: list[str] | None,
+    on_chunk: Callable[[pd.DataFrame], None] | None = None,
+) -> _PartitionSpill:
+    """Stream a CSV into hash partitions of its matching key."""
+    header = list(read_csv(path, columns=columns, nrows=0).columns)
+    spill = _PartitionSpill(directory, header)
+
+    for chunk in read_csv_chunks(path, chunk_rows, columns=columns):
+        if on_chunk is not None:
+            on_chunk(chunk)
+        keys = normalize_reference_series(chunk[ref_col]) if normalize_refs else chunk[ref_col]
+        spill.write(chunk, partition_ids(keys, n_partitions))
+
+    return spill
+
+
+def match_out_of_core(
+    source_path: str,
+    target_path: str,
+    writer: RunArtifactWriter,
+    memory_budget_mb: int,
+    strategy: str = "exact_reference",
+    source_ref_col: str = "reference",
+    target_ref_col: str = "reference",
+    source_amt_col: str = "amount",
+    target_amt_col: str = "amount",
+    tolerance: float = 0.01,
+    normalize_refs: bool = True,
+    decimal_precision: int = 2,
+    spill_dir: str | None = None,
+    source_columns: list[str] | None = None,
+    target_columns: list[str] | None = None,
+    on_source_chunk: Callable[[pd.DataFrame], None] | None = None,
+    on_target_chunk: Callable[[pd.DataFrame], None] | None = None,
+    on_result: Callable[[dict[str, pd.DataFrame]], None] | None = None,
+) -> int:
+    """
+    Match two CSV files that may not fit in memory.
+
+    Both files are streamed in chunks and spilled to on-disk partitions by a
+    hash of the matching key. Each partition pair is then loaded, matched with
+    the configured strategy and appended to the run artifacts, so peak memory
+    follows ``memory_budget_mb`` rather than the input size. A single very
+    frequent key still lands in one partition and can exceed the budget.
+
+    Args:
+        source_path: Source CSV (e.g. product transactions)
+        target_path: Target CSV (e.g. CBA ledger)
+        writer: Artifact writer that receives each partition's results
+        memory_budget_mb: Peak memory budget in megabytes
+        strategy: Matching strategy name
+        source_ref_col: Reference column in source
+        target_ref_col: Reference column in target
+        source_amt_col: Amount column in source
+        target_amt_col: Amount column in target
+        tolerance: Amount tolerance
+        normalize_refs: Whether to normalize references
+        decimal_precision: Decimal precision
+        spill_dir: Parent directory for partition files (default: system temp)
+        source_columns: Source columns to load (default: all columns)
+        target_columns: Target columns to load (default: all columns)
+        on_source_chunk: Called with each source chunk as it is read, before
+            any matching (e.g. quality checks that may raise to stop the run)
+        on_target_chunk: Called with each target chunk as it is read
+        on_result: Called with each partition's result buckets before they
+            are written (e.g. assurance controls over result records)
+
+    Returns:
+        Number of partitions used
+    """
+    if not isinstance(get_strategy(strategy), KeyedStrategy):
+        raise ValueError(f"Out-of-core matching needs a keyed strategy, got {strategy}")
+
+    n_partitions, chunk_rows = plan_partitions([source_path, target_path], memory_budget_mb)
+
+    with tempfile.TemporaryDirectory(prefix="reconflow-spill-", dir=spill_dir) as tmp:
+        source_spill = _spill(
+            source_path,
+            Path(tmp) / "source",
+            source_ref_col,
+            normalize_refs,
+            n_partitions,
+            chunk_rows,
+            source_columns,
+            on_source_chunk,
+        )
+        target_spill = _spill(
+            target_path,
+            Path(tmp) / "target",
+            target_ref_col,
+            normalize_refs,
+            n_partitions,
+            chunk_rows,
+            target_columns,
+            on_target_chunk,
+        )
+
+        for partition in range(n_partitions):
+            source = source_spill.read(partition)
+            target = target_spill.read(partition)
+
+            source[source_amt_col] = coerce_amount(source[source_amt_col])
+            target[target_amt_col] = coerce_amount(target[target_amt_col])
+
+            result = match_records(
+                source=source,
+                target=target,
+                strategy=strategy,
+                source_ref_col=source_ref_col,
+                target_ref_col=target_ref_col,
+                source_amt_col=source_amt_col,
+                target_amt_col=target_amt_col,
+                tolerance=tolerance,
+                normalize_refs=normalize_refs,
+                decimal_precision=decimal_precision,
+            )
+
+            frames = {bucket: getattr(result, bucket) for bucket in BUCKETS}
+            if on_result is not None:
+                on_result(frames)
+            writer.write(frames)
+
+            duplicates = writer.details.setdefault("duplicates", {})
+            for name, count in result.stats.items():
+                duplicates[name] = duplicates.get(name, 0) + count
+
+    return n_partitions
@@ -0,0 +1,54 @@
+"""Helpers for stages that re-match residual (unmatched) records."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from reconflow.io import coerce_date
+
+# Day number given to missing or unparseable dates
+NO_DAY = np.iinfo(np.int64).min
+
+
+def side_column(frame: pd.DataFrame, column: str, side: str) -> str:
+    """
+    Name of one side's column in a joined frame.
+
+    Columns present on both sides carry a ``_source``/``_target`` suffix after
+    the join; the others keep their name.
+
+    Args:
+        frame: Joined records (e.g. a result bucket)
+        column: Column name in the original source or target
+        side: ``source`` or ``target``
+
+    Returns:
+        Column name in ``frame``
+    """
+    suffixed = f"{column}_{side}"
+    if suffixed in frame.columns:
+        return suffixed
+    if column in frame.columns:
+        return column
+    raise KeyError(f"Column not found in {side} records: {column}")
+
+
+def day_numbers(values: pd.Series) -> np.ndarray:
+    """
+    Parse dates to day numbers since the epoch (UTC).
+
+    Args:
+        values: Date strings or datetimes
+
+    Returns:
+        int64 array of days, with ``NO_DAY`` where the date is missing or invalid
+    """
+    dates = coerce_date(values)
+    days = dates.dt.tz_localize(None).to_numpy(dtype="datetime64[D]").astype(np.int64)
+    return np.where(dates.isna().to_numpy(), NO_DAY, days)
+
+
+def minor_units(frame: pd.DataFrame, side: str) -> np.ndarray:
+    """One side's standardized amounts in minor units, with 0 where missing."""
+    return frame[f"_std_minor_{side}"].fillna(0).to_numpy(dtype=np.int64)
@@ -3,31 +3,261 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
-from reconflow.normalize import normalize_reference, standardize_decimal
+from reconflow.normalize import (
+    normalize_reference_series,
+    standardize_decimal_series,
+    tolerance_to_minor_units,
+)
+from reconflow.normalize.strings import to_string_series
+
+# Buckets of a keyed join's pairs, in the order of their status codes
+PAIR_BUCKETS = ("matched", "amount_mismatches", "missing_in_target", "missing_in_source")
+
+BUCKETS = (
+    "matched",
+    "missing_in_target",
+    "missing_in_source",
+    "amount_mismatches",
+    "subset_matched",
+    "fuzzy_candidates",
+)
 
 
 @dataclass
+class JoinSides:
+    """Prepared frames that a join of ``KeyedStrategy.slim`` frames points into."""
+
+    source: pd.DataFrame
+    target: pd.DataFrame
+    # Columns of the join of the full frames, in order
+    columns: pd.Index
+
+
+def _take(values: pd.Series, positions: np.ndarray, fill: bool) -> pd.api.extensions.ExtensionArray:
+    """Values at row positions (missing at -1), in the dtype an outer merge gives them."""
+    array = values.array
+    if not fill:
+        return array.take(positions)
+    taken = array.take(positions, allow_fill=True)
+    # An outer merge upcasts a side with any missing record, e.g. int64 to float64
+    dtype = array[:0].take(np.array([-1]), allow_fill=True).dtype
+    return taken if taken.dtype == dtype else taken.astype(dtype)
+
+
+class PairIndex:
+    """
+    Outer join of two frames, held as row positions instead of copied columns.
+
+    ``merged`` is the join of slim frames (keys, compared amounts and each
+    record's ``_pos``); the other columns of the wide join are taken from
+    the prepared frames of ``sides`` by position when a bucket is built.
+    Without ``sides``, ``merged`` is the full join. Each pair's bucket and
+    amount difference are kept as compact arrays.
+    """
+
+    def __init__(
+        self,
+        merged: pd.DataFrame,
+        status: np.ndarray,
+        amt_diff: np.ndarray,
+        sides: JoinSides | None = None,
+    ) -> None:
+        self.status = status
+        self.amt_diff = amt_diff
+        self.sides = sides
+        # Pairs holding a source record; target-only group members do not
+        self.sourced = (merged["_merge"] != "right_only").to_numpy(dtype=bool)
+        self.columns = merged.columns if sides is None else sides.columns
+        self.source_rows = self.target_rows = None
+        self._origins: dict[str, tuple[int, str]] = {}
+        if sides is not None:
+            self.source_rows = merged["_pos_source"].fillna(-1).to_numpy(dtype=np.int64)
+            self.target_rows = merged["_pos_target"].fillna(-1).to_numpy(dtype=np.int64)
+            merged = merged.drop(columns=["_pos_source", "_pos_target"])
+            for column in self.columns.difference(merged.columns, sort=False):
+                self._origins[column] = self._origin(column, sides)
+        self.merged = merged
+
+    @staticmethod
+    def _origin(column: str, sides: JoinSides) -> tuple[int, str]:
+        """Side (0 source, 1 target) and column name a wide join column comes from."""
+        for side, (frame, suffix) in enumerate(
+            ((sides.source, "_source"), (sides.target, "_target"))
+        ):
+            base = column.removesuffix(suffix)
+            if base != column and base in frame.columns:
+                return side, base
+        return (0 if column in sides.source.columns else 1), column
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def rows(self, bucket: str) -> np.ndarray:
+        """Positions of the pairs in a bucket of ``PAIR_BUCKETS``."""
+        return np.flatnonzero(self.status == PAIR_BUCKETS.index(bucket))
+
+    def count(self, bucket: str, sourced: bool = False) -> int:
+        """Number of pairs in a bucket of ``PAIR_BUCKETS``, or of those holding a source record."""
+        in_bucket = self.status == PAIR_BUCKETS.index(bucket)
+        return int(np.count_nonzero(in_bucket & self.sourced if sourced else in_bucket))
+
+    def take(self, rows: np.ndarray) -> pd.DataFrame:
+        """
+        Wide records of pairs, as the rows of the full join plus ``_amt_diff``.
+
+        Args:
+            rows: Pair positions
+
+        Returns:
+            DataFrame indexed by pair position
+        """
+        merged = self.merged.iloc[rows]
+        data = {}
+        for column in self.columns:
+            if column in self._origins:
+                side, name = self._origins[column]
+                frame = self.sides.source if side == 0 else self.sides.target
+                positions = self.source_rows if side == 0 else self.target_rows
+                data[column] = _take(frame[name], positions[rows], bool((positions < 0).any()))
+            else:
+                data[column] = merged[column].array
+        frame = pd.DataFrame(data, index=pd.Index(rows), copy=False)
+        frame["_amt_diff"] = self.amt_diff[rows]
+        return frame
+
+    def frame(self, bucket: str) -> pd.DataFrame:
+        """Wide records of a bucket of ``PAIR_BUCKETS``."""
+        return self.take(self.rows(bucket))
+
+
+def source_records(frame: pd.DataFrame) -> int:
+    """Records of a result frame holding a source record (not joined as ``right_only``)."""
+    if "_merge" not in frame.columns:
+        return len(frame)
+    return int((frame["_merge"] != "right_only").sum())
+
+
+class _Bucket:
+    """Record bucket of a ``MatchResult``, built from its pairs when first read."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, result: MatchResult | None, owner: type | None = None):
+        if result is None:
+            return self
+        return result.bucket(self.name)
+
+
 class MatchResult:
-    """Result of a matching operation."""
+    """
+    Result of a matching operation.
 
-    matched: pd.DataFrame = field(default_factory=pd.DataFrame)
-    missing_in_target: pd.DataFrame = field(default_factory=pd.DataFrame)
-    missing_in_source: pd.DataFrame = field(default_factory=pd.DataFrame)
-    amount_mismatches: pd.DataFrame = field(default_factory=pd.DataFrame)
+    Keyed strategies return their pairs as a ``PairIndex`` rather than as
+    copied frames: a bucket's wide frame is built when first read (e.g. by
+    the artifact writer) and then kept. ``count``, ``total_source`` and
+    ``pool_match_pct`` read the pairs without building any bucket.
+    """
+
+    matched = _Bucket()
+    missing_in_target = _Bucket()
+    missing_in_source = _Bucket()
+    amount_mismatches = _Bucket()
+    subset_matched = _Bucket()
+    # Proposed pairs for review; their records stay in the buckets above
+    fuzzy_candidates = _Bucket()
+
+    def __init__(
+        self,
+        matched: pd.DataFrame | None = None,
+        missing_in_target: pd.DataFrame | None = None,
+        missing_in_source: pd.DataFrame | None = None,
+        amount_mismatches: pd.DataFrame | None = None,
+        subset_matched: pd.DataFrame | None = None,
+        fuzzy_candidates: pd.DataFrame | None = None,
+        stats: dict[str, int] | None = None,
+        pairs: PairIndex | None = None,
+    ) -> None:
+        frames = (
+            matched,
+            missing_in_target,
+            missing_in_source,
+            amount_mismatches,
+            subset_matched,
+            fuzzy_candidates,
+        )
+        self._frames = {
+            name: frame for name, frame in zip(BUCKETS, frames, strict=True) if frame is not None
+        }
+        self.pairs = pairs
+        # Counts of repeated and quarantined (empty) keys seen by the join
+        self.stats = stats if stats is not None else {}
+
+    def bucket(self, name: str) -> pd.DataFrame:
+        """Records of a bucket, built from the pairs on first access."""
+        if name not in BUCKETS:
+            raise ValueError(f"Unknown bucket {name!r}; expected one of {', '.join(BUCKETS)}")
+        frame = self._frames.get(name)
+        if frame is None:
+            if self.pairs is not None and name in PAIR_BUCKETS:
+                frame = self.pairs.frame(name)
+            else:
+                frame = pd.DataFrame()
+            self._frames[name] = frame
+        return frame
+
+    def count(self, name: str) -> int:
+        """Number of records in a bucket, without building it."""
+        if name in self._frames:
+            return len(self._frames[name])
+        if self.pairs is not None and name in PAIR_BUCKETS:
+            return self.pairs.count(name)
+        return 0
+
+    def source_count(self, name: str) -> int:
+        """Number of records in a bucket that hold a source record, without building it."""
+        if name in self._frames:
+            return source_records(self._frames[name])
+        if self.pairs is not None and name in PAIR_BUCKETS:
+            return self.pairs.count(name, sourced=True)
+        return 0
+
+    def replace(self, **buckets: pd.DataFrame) -> MatchResult:
+        """
+        Copy of the result with some buckets replaced; the others stay unbuilt.
+
+        Args:
+            **buckets: New frames by bucket name
+
+        Returns:
+            New MatchResult sharing this result's pairs and stats
+        """
+        unknown = set(buckets) - set(BUCKETS)
+        if unknown:
+            raise ValueError(f"Unknown buckets: {', '.join(sorted(unknown))}")
+        result = MatchResult(stats=self.stats, pairs=self.pairs)
+        result._frames = {**self._frames, **buckets}
+        return result
 
     @property
     def total_source(self) -> int:
-        return len(self.matched) + len(self.missing_in_target) + len(self.amount_mismatches)
+        return (
+            self.source_count("matched")
+            + self.source_count("missing_in_target")
+            + self.source_count("amount_mismatches")
+            + self.source_count("subset_matched")
+        )
 
     @property
     def pool_match_pct(self) -> float:
         if self.total_source == 0:
             return 0.0
-        return (len(self.matched) / self.total_source) * 100
+        return (self.count("matched") / self.total_source) * 100
 
 
 class MatchingStrategy(ABC):
@@ -47,21 +277,26 @@ class MatchingStrategy(ABC):
         tolerance: float = 0.01,
         normalize_refs: bool = True,
         decimal_precision: int = 2,
+        source_date_col: str = "date",
+        target_date_col: str = "date",
+        date_window_days: int = 0,
     ) -> MatchResult:
         """Execute matching logic."""
         raise NotImplementedError
 
 
-class ExactReferenceStrategy(MatchingStrategy):
+class KeyedStrategy(MatchingStrategy):
     """
-    Exact reference matching strategy (1:1).
+    Base class for strategies that only pair records with equal keys.
 
-    Matches records where:
-    1. Normalized references are identical
-    2. Standardized amounts are within tolerance
+    Matching is split into three steps so the work can be divided by key
+    (see :mod:`reconflow.matching.parallel`): ``prepare`` derives the key and
+    standardized amount for each side, ``join`` pairs the prepared frames on
+    the key, and ``classify`` sorts the joined records into result buckets.
     """
 
-    name: str = "exact_reference"
+    # Prepared columns besides the key that ``join`` and ``classify`` read
+    _join_columns: tuple[str, ...] = ()
 
     def match(
         self,
@@ -74,70 +309,363 @@ class ExactReferenceStrategy(MatchingStrategy):
         tolerance: float = 0.01,
         normalize_refs: bool = True,
         decimal_precision: int = 2,
+        source_date_col: str = "date",
+        target_date_col: str = "date",
+        date_window_days: int = 0,
+    ) -> MatchResult:
+        """
+        Prepare both sides, join them on the key and classify the result.
+
+        Keyed strategies do not use dates; the date arguments are accepted for
+        a uniform interface.
+        """
+        src = self.prepare(
+            source, source_ref_col, source_amt_col, normalize_refs, decimal_precision
+        )
+        tgt = self.prepare(
+            target, target_ref_col, target_amt_col, normalize_refs, decimal_precision
+        )
+        return self.match_prepared(
+            src, tgt, source_ref_col, target_ref_col, tolerance, normalize_refs, decimal_precision
+        )
+
+    def match_prepared(
+        self,
+        src: pd.DataFrame,
+        tgt: pd.DataFrame,
+        source_ref_col: str,
+        target_ref_col: str,
+        tolerance: float = 0.01,
+        normalize_refs: bool = True,
+        decimal_precision: int = 2,
     ) -> MatchResult:
         """
-        Match source to target using exact reference matching.
+        Join and classify frames that were already passed through ``prepare``.
+
+        Only the columns the join reads are joined; the result points into
+        ``src`` and ``tgt`` for the rest.
+        """
+        src_key, tgt_key = self.key_columns(source_ref_col, target_ref_col, normalize_refs)
+        merged = self.join(self.slim(src, src_key), self.slim(tgt, tgt_key), src_key, tgt_key)
+        return self.classify(
+            merged, tolerance, decimal_precision, self.sides(src, tgt, src_key, tgt_key)
+        )
+
+    def key_columns(
+        self,
+        source_ref_col: str,
+        target_ref_col: str,
+        normalize_refs: bool,
+    ) -> tuple[str, str]:
+        """Names of the join key columns in the prepared source and target."""
+        if normalize_refs:
+            return "_norm_ref", "_norm_ref"
+        return source_ref_col, target_ref_col
+
+    def slim(self, frame: pd.DataFrame, key: str) -> pd.DataFrame:
+        """The key and ``_join_columns`` of a prepared frame, with each record's ``_pos``."""
+        columns = list(dict.fromkeys([key, *self._join_columns]))
+        return frame[columns].assign(_pos=np.arange(len(frame)))
+
+    def sides(self, src: pd.DataFrame, tgt: pd.DataFrame, src_key: str, tgt_key: str) -> JoinSides:
+        """Prepared frames that a join of their ``slim`` frames points into."""
+        columns = self.join(src.iloc[:0], tgt.iloc[:0], src_key, tgt_key).columns
+        return JoinSides(src, tgt, columns)
+
+    @abstractmethod
+    def prepare(
+        self,
+        frame: pd.DataFrame,
+        ref_col: str,
+        amt_col: str,
+        normalize_refs: bool = True,
+        decimal_precision: int = 2,
+    ) -> pd.DataFrame:
+        """Return a copy of one side with its key and standardized amount columns."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def join(
+        self,
+        src: pd.DataFrame,
+        tgt: pd.DataFrame,
+        src_key: str,
+        tgt_key: str,
+    ) -> pd.DataFrame:
+        """Join prepared frames on their keys, sorted by key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def classify(
+        self,
+        merged: pd.DataFrame,
+        tolerance: float = 0.01,
+        decimal_precision: int = 2,
+        sides: JoinSides | None = None,
+    ) -> MatchResult:
+        """Split joined records (of ``slim`` frames, with ``sides``) into result buckets."""
+        raise NotImplementedError
+
+
+class ExactReferenceStrategy(KeyedStrategy):
+    """
+    Exact reference matching strategy (1:1).
+
+    Matches records where:
+    1. Normalized references are identical
+    2. Standardized amounts are within tolerance
+    """
+
+    name: str = "exact_reference"
+
+    # Standardized amount column compared between the two sides
+    _compare_column: str = "_std_minor"
+
+    _join_columns: tuple[str, ...] = ("_std_minor",)
+
+    def prepare(
+        self,
+        frame: pd.DataFrame,
+        ref_col: str,
+        amt_col: str,
+        normalize_refs: bool = True,
+        decimal_precision: int = 2,
+    ) -> pd.DataFrame:
+        """
+        Add the normalized reference and standardized amount to one side.
 
         Args:
-            source: Source DataFrame (e.g., product transactions)
-            target: Target DataFrame (e.g., CBA ledger)
-            source_ref_col: Reference column name in source
-            target_ref_col: Reference column name in target
-            source_amt_col: Amount column name in source
-            target_amt_col: Amount column name in target
-            tolerance: Amount tolerance for matching
+            frame: Source or target DataFrame
+            ref_col: Reference column name
+            amt_col: Amount column name
             normalize_refs: Whether to normalize references
             decimal_precision: Decimal places for amount standardization
 
         Returns:
-            MatchResult with matched and unmatched records
+            Copy of ``frame`` with ``_norm_ref`` (if normalizing), ``_std_minor``
+            and ``_std_amt`` columns
         """
-        src = source.copy()
-        tgt = target.copy()
+        # Only columns are added, so the copy can share the records' data
+        prepared = frame.copy(deep=False)
 
         if normalize_refs:
-            src["_norm_ref"] = src[source_ref_col].apply(normalize_reference)
-            tgt["_norm_ref"] = tgt[target_ref_col].apply(normalize_reference)
-            merge_col_src = "_norm_ref"
-            merge_col_tgt = "_norm_ref"
-        else:
-            merge_col_src = source_ref_col
-            merge_col_tgt = target_ref_col
-
-        src["_std_amt"] = src[source_amt_col].apply(
-            lambda x: standardize_decimal(x, decimal_precision)
-        )
-        tgt["_std_amt"] = tgt[target_amt_col].apply(
-            lambda x: standardize_decimal(x, decimal_precision)
-        )
+            prepared["_norm_ref"] = normalize_reference_series(prepared[ref_col])
+
+        prepared["_std_minor"] = standardize_decimal_series(prepared[amt_col], decimal_precision)
+        prepared["_std_amt"] = prepared["_std_minor"].astype("float64") / 10**decimal_precision
+
+        return prepared
+
+    def occurrences(self, frame: pd.DataFrame, key: str) -> np.ndarray:
+        """Rank of each record among the records sharing its key (0, 1, ...)."""
+        return frame.groupby(key, dropna=False, sort=False).cumcount().to_numpy()
+
+    def join(
+        self,
+        src: pd.DataFrame,
+        tgt: pd.DataFrame,
+        src_key: str,
+        tgt_key: str,
+    ) -> pd.DataFrame:
+        """
+        Outer-join prepared frames on their keys and occurrence ranks.
+
+        The k-th record with a key pairs with the k-th record with that key on
+        the other side, so repeated keys never multiply into a cartesian
+        product. Records with an empty key are quarantined: each gets a unique
+        negative rank and so never joins. The result has at most
+        ``len(src) + len(tgt)`` rows.
+        """
+        src = src.assign(_occ=self.occurrences(src, src_key))
+        tgt = tgt.assign(_occ=self.occurrences(tgt, tgt_key))
+
+        src_empty = _empty_keys(src[src_key])
+        tgt_empty = _empty_keys(tgt[tgt_key])
+        n_src_empty = int(src_empty.sum())
+        src.loc[src_empty, "_occ"] = -1 - np.arange(n_src_empty)
+        tgt.loc[tgt_empty, "_occ"] = -1 - n_src_empty - np.arange(int(tgt_empty.sum()))
+
+        if src.empty and tgt.empty:
+            # pandas cannot factorize two empty Arrow key columns in a multi-key merge
+            return src.merge(
+                tgt.drop(columns="_occ"),
+                left_on=src_key,
+                right_on=tgt_key,
+                how="outer",
+                suffixes=("_source", "_target"),
+                indicator=True,
+            )
 
-        merged = src.merge(
+        return src.merge(
             tgt,
-            left_on=merge_col_src,
-            right_on=merge_col_tgt,
+            left_on=[src_key, "_occ"],
+            right_on=[tgt_key, "_occ"],
             how="outer",
             suffixes=("_source", "_target"),
             indicator=True,
         )
 
-        merged["_amt_diff"] = abs(
-            merged["_std_amt_source"].fillna(0) - merged["_std_amt_target"].fillna(0)
-        )
+    def classify(
+        self,
+        merged: pd.DataFrame,
+        tolerance: float = 0.01,
+        decimal_precision: int = 2,
+        sides: JoinSides | None = None,
+    ) -> MatchResult:
+        """
+        Split joined records by presence on each side and amount difference.
+
+        Args:
+            merged: Output of ``join``
+            tolerance: Amount tolerance for matching
+            decimal_precision: Decimal places used for standardization
+            sides: Prepared frames ``merged`` points into, if it joined ``slim`` frames
+
+        Returns:
+            MatchResult with matched and unmatched records
+        """
+        # Compare in integer minor units so the tolerance check has no float drift
+        source_minor = merged[f"{self._compare_column}_source"].fillna(0)
+        target_minor = merged[f"{self._compare_column}_target"].fillna(0)
+        diff_minor = (source_minor - target_minor).abs().to_numpy(dtype="int64")
+
+        both_mask = self._paired(merged)
+        left_only_mask = (merged["_merge"] == "left_only").to_numpy(dtype=bool)
+        right_only_mask = (merged["_merge"] == "right_only").to_numpy(dtype=bool)
+
+        amount_match_mask = diff_minor <= tolerance_to_minor_units(tolerance, decimal_precision)
+
+        # Bucket of each pair, as its position in PAIR_BUCKETS
+        status = np.full(len(merged), PAIR_BUCKETS.index("missing_in_source"), dtype=np.int8)
+        status[left_only_mask] = PAIR_BUCKETS.index("missing_in_target")
+        status[both_mask & amount_match_mask] = PAIR_BUCKETS.index("matched")
+        status[both_mask & ~amount_match_mask] = PAIR_BUCKETS.index("amount_mismatches")
+
+        occ = merged["_occ"].to_numpy()
+        stats = {
+            "duplicate_source": int(((occ > 0) & ~right_only_mask).sum()),
+            "duplicate_target": int(((occ > 0) & ~left_only_mask).sum()),
+            "quarantined_source": int(((occ < 0) & left_only_mask).sum()),
+            "quarantined_target": int(((occ < 0) & right_only_mask).sum()),
+        }
+
+        pairs = PairIndex(merged, status, diff_minor / 10**decimal_precision, sides)
+        return MatchResult(stats=stats, pairs=pairs)
+
+    def _paired(self, merged: pd.DataFrame) -> np.ndarray:
+        """Mask of joined records whose amounts are compared with the other side."""
+        return (merged["_merge"] == "both").to_numpy(dtype=bool)
+
+
+def _empty_keys(keys: pd.Series) -> np.ndarray:
+    """Mask of missing or blank keys."""
+    return (to_string_series(keys).str.strip() == "").to_numpy(dtype=bool)
 
-        both_mask = merged["_merge"] == "both"
-        left_only_mask = merged["_merge"] == "left_only"
-        right_only_mask = merged["_merge"] == "right_only"
 
-        amount_match_mask = merged["_amt_diff"] <= tolerance
+def _isin_keys(values: pd.Series, keys: pd.Series) -> np.ndarray:
+    """
+    Membership test of ``values`` in ``keys``, treating missing keys as equal.
+
+    Factorizes both together instead of ``Series.isin``, which iterates in
+    Python over Arrow-backed strings.
+    """
+    codes, _ = pd.factorize(pd.concat([keys, values], ignore_index=True), use_na_sentinel=False)
+    return np.isin(codes[len(keys) :], codes[: len(keys)])
+
+
+def _with_group_totals(frame: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Add each record's group total (``_group_minor``) and size (``_group_size``)."""
+    groups = frame.groupby(key, dropna=False, sort=False)["_std_minor"]
+    return frame.assign(
+        _group_minor=groups.transform("sum"),
+        _group_size=groups.transform("size"),
+    )
+
+
+class GroupSumStrategy(ExactReferenceStrategy):
+    """
+    Group-sum matching strategy (many-to-one).
+
+    Records sharing a key form a group on each side, e.g. several product legs
+    settled as one CBA entry. Groups match when their summed standardized
+    amounts are within tolerance. Every source record is reported in its
+    group's bucket next to the first target record of the group and the
+    target group's total. The group's other target records are reported in
+    the same bucket on their own, joined as ``right_only`` so they do not
+    count as source records; target records of keys with no source records
+    are missing in source.
+    """
+
+    name: str = "group_sum"
 
-        matched = merged[both_mask & amount_match_mask].copy()
-        amount_mismatches = merged[both_mask & ~amount_match_mask].copy()
-        missing_in_target = merged[left_only_mask].copy()
-        missing_in_source = merged[right_only_mask].copy()
+    _compare_column: str = "_group_minor"
 
-        return MatchResult(
-            matched=matched,
-            missing_in_target=missing_in_target,
-            missing_in_source=missing_in_source,
-            amount_mismatches=amount_mismatches,
+    def join(
+        self,
+        src: pd.DataFrame,
+        tgt: pd.DataFrame,
+        src_key: str,
+        tgt_key: str,
+    ) -> pd.DataFrame:
+        """Outer-join source records to one representative per target group, then add the rest."""
+        src = _with_group_totals(src, src_key)
+        tgt = _with_group_totals(tgt, tgt_key)
+
+        # Join one target record per shared key so source records are not repeated
+        shared = _isin_keys(tgt[tgt_key], src[src_key]) & ~_empty_keys(tgt[tgt_key])
+        rest = shared & tgt.duplicated(tgt_key).to_numpy()
+        merged = super().join(src, tgt[~rest], src_key, tgt_key)
+        if not rest.any():
+            return merged
+
+        members = self._group_members(src, tgt, rest, src_key, tgt_key, merged)
+        joined = pd.concat([merged, members], ignore_index=True)
+        key = joined[src_key] if src_key == tgt_key else joined[src_key].fillna(joined[tgt_key])
+        order = (
+            pd.DataFrame({"key": key, "occ": joined["_occ"]})
+            .sort_values(["key", "occ"], na_position="last", kind="stable")
+            .index
+        )
+        return joined.loc[order].reset_index(drop=True)
+
+    @staticmethod
+    def _group_members(
+        src: pd.DataFrame,
+        tgt: pd.DataFrame,
+        rest: np.ndarray,
+        src_key: str,
+        tgt_key: str,
+        merged: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """Join rows of non-representative target records, with their source group's totals."""
+        members = tgt[rest]
+        groups = src.drop_duplicates(src_key).set_index(src_key)
+        positions = groups.index.get_indexer(members[tgt_key])
+
+        # Columns of both sides get the target suffix, as in the outer join
+        joined_on = {"_occ", src_key} if src_key == tgt_key else {"_occ"}
+        members = members.assign(
+            _occ=tgt.groupby(tgt_key, dropna=False, sort=False).cumcount()[rest]
+        )
+        members = members.rename(
+            columns={
+                column: f"{column}_target"
+                for column in tgt.columns
+                if column in src.columns and column not in joined_on
+            }
+        )
+        for column in ("_group_minor", "_group_size"):
+            members[f"{column}_source"] = groups[column].array.take(positions)
+        members["_merge"] = pd.Categorical(
+            ["right_only"] * len(members), categories=merged["_merge"].cat.categories
         )
+        return members.reindex(columns=merged.columns)
+
+    def occurrences(self, frame: pd.DataFrame, key: str) -> np.ndarray:
+        """Every record joins its group's representative, so all ranks are 0."""
+        return np.zeros(len(frame), dtype=np.int64)
+
+    def _paired(self, merged: pd.DataFrame) -> np.ndarray:
+        """Joined records, plus target group members compared through their group's totals."""
+        members = (merged["_merge"] == "right_only") & merged["_group_minor_source"].notna()
+        return super()._paired(merged) | members.to_numpy(dtype=bool)
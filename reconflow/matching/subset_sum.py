@@ -0,0 +1,226 @@
+"""Subset-sum matching of residual breaks (one target entry to N source records)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from reconflow.matching.residuals import NO_DAY, day_numbers, minor_units, side_column
+from reconflow.matching.strategies import MatchResult
+from reconflow.normalize import tolerance_to_minor_units
+
+# Block keys combine a counterparty code with a day number
+_BLOCK_STRIDE = 1 << 32
+
+
+def _subset_sums(values: np.ndarray, goal: int, max_size: int) -> tuple[np.ndarray, ...]:
+    """
+    Enumerate the subsets of ``values`` with at most ``max_size`` members.
+
+    Values are non-negative, so subsets whose sum already exceeds ``goal``
+    are pruned as they are built.
+
+    Returns:
+        Tuple of (sums, member counts, member bitmasks)
+    """
+    sums = np.zeros(1, dtype=np.int64)
+    counts = np.zeros(1, dtype=np.int64)
+    masks = np.zeros(1, dtype=np.int64)
+
+    for i, value in enumerate(values):
+        grow = (counts < max_size) & (sums + value <= goal)
+        sums = np.concatenate([sums, sums[grow] + value])
+        counts = np.concatenate([counts, counts[grow] + 1])
+        masks = np.concatenate([masks, masks[grow] | (1 << i)])
+
+    return sums, counts, masks
+
+
+def find_subset(values: np.ndarray, goal: int, tolerance: int, max_size: int) -> np.ndarray | None:
+    """
+    Find 2 to ``max_size`` values that sum to ``goal`` within ``tolerance``.
+
+    Meet-in-the-middle: the subset sums of each half are enumerated, one side
+    is sorted, and each sum of the other side looks up its complement by
+    binary search. Smaller subsets are preferred.
+
+    Args:
+        values: Non-negative amounts in minor units (at most ~40)
+        goal: Target amount in minor units
+        tolerance: Allowed difference in minor units
+        max_size: Maximum number of values in the subset
+
+    Returns:
+        Positions in ``values`` of the subset, or None
+    """
+    half = len(values) // 2
+    left_sums, left_counts, left_masks = _subset_sums(values[:half], goal + tolerance, max_size)
+    right_sums, right_counts, right_masks = _subset_sums(values[half:], goal + tolerance, max_size)
+
+    order = np.argsort(right_sums, kind="stable")
+    right_sums, right_counts, right_masks = (
+        right_sums[order],
+        right_counts[order],
+        right_masks[order],
+    )
+
+    need = goal - left_sums
+    lo = np.searchsorted(right_sums, need - tolerance, side="left")
+    hi = np.searchsorted(right_sums, need + tolerance, side="right")
+
+    best: tuple[int, int, int] | None = None
+    for i in np.flatnonzero(lo < hi):
+        sizes = left_counts[i] + right_counts[lo[i] : hi[i]]
+        ok = np.flatnonzero((sizes >= 2) & (sizes <= max_size))
+        if len(ok):
+            k = ok[np.argmin(sizes[ok])]
+            if best is None or sizes[k] < best[0]:
+                best = (int(sizes[k]), int(i), int(lo[i] + k))
+                if best[0] == 2:
+                    break
+
+    if best is None:
+        return None
+
+    _, i, j = best
+    left = [bit for bit in range(half) if left_masks[i] >> bit & 1]
+    right = [half + bit for bit in range(len(values) - half) if right_masks[j] >> bit & 1]
+    return np.array(left + right, dtype=np.int64)
+
+
+def _block_keys(
+    sources: pd.DataFrame,
+    targets: pd.DataFrame,
+    counterparty_col: str | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Counterparty codes of both sides, shared so equal values get equal codes."""
+    if counterparty_col is None:
+        return np.zeros(len(sources), dtype=np.int64), np.zeros(len(targets), dtype=np.int64)
+
+    values = pd.concat(
+        [
+            sources[side_column(sources, counterparty_col, "source")],
+            targets[side_column(targets, counterparty_col, "target")],
+        ],
+        ignore_index=True,
+    )
+    codes, _ = pd.factorize(values, use_na_sentinel=False)
+    return codes[: len(sources)], codes[len(sources) :]
+
+
+def match_subset_sums(
+    result: MatchResult,
+    source_date_col: str,
+    target_date_col: str,
+    tolerance: float = 0.01,
+    decimal_precision: int = 2,
+    max_subset_size: int = 3,
+    date_window_days: int = 2,
+    counterparty_col: str | None = None,
+    max_candidates: int = 24,
+) -> MatchResult:
+    """
+    Match unmatched target entries to sets of unmatched source records.
+
+    Bulk settlements often equal the sum of several source records that share
+    no reference. For each unmatched target entry, candidate source records
+    are those of the same sign and counterparty, no larger in amount, dated
+    within ``date_window_days``; at most ``max_candidates`` of the closest in
+    date are searched for a subset summing to the target amount. Entries are
+    taken in date order and each source record is used at most once.
+
+    Args:
+        result: Result of a matching strategy
+        source_date_col: Date column of the source records
+        target_date_col: Date column of the target records
+        tolerance: Allowed difference between the subset sum and the target amount
+        decimal_precision: Decimal places used for standardization
+        max_subset_size: Maximum number of source records in a subset
+        date_window_days: Maximum days between a source record and the target entry
+        counterparty_col: Column both sides must agree on (default: no blocking)
+        max_candidates: Maximum source records searched per target entry
+
+    Returns:
+        MatchResult with accepted subsets moved from ``missing_in_target`` and
+        ``missing_in_source`` to ``subset_matched``: one row per source record,
+        with the target entry's columns filled in and a ``_subset_id``
+    """
+    sources = result.missing_in_target
+    targets = result.missing_in_source
+    if sources.empty or targets.empty:
+        return result
+
+    tol = tolerance_to_minor_units(tolerance, decimal_precision)
+
+    src_amt = minor_units(sources, "source")
+    tgt_amt = minor_units(targets, "target")
+    src_day = day_numbers(sources[side_column(sources, source_date_col, "source")])
+    tgt_day = day_numbers(targets[side_column(targets, target_date_col, "target")])
+    src_block, tgt_block = _block_keys(sources, targets, counterparty_col)
+
+    # Index usable source records by (block, day) for the window lookups
+    usable = np.flatnonzero((src_amt != 0) & (src_day != NO_DAY))
+    src_key = src_block[usable] * _BLOCK_STRIDE + src_day[usable]
+    order = np.argsort(src_key, kind="stable")
+    usable, src_key = usable[order], src_key[order]
+
+    tgt_key = tgt_block * _BLOCK_STRIDE + tgt_day
+    lo = np.searchsorted(src_key, tgt_key - date_window_days, side="left")
+    hi = np.searchsorted(src_key, tgt_key + date_window_days, side="right")
+
+    used = np.zeros(len(sources), dtype=bool)
+    member_pos: list[np.ndarray] = []
+    target_pos: list[int] = []
+
+    eligible = (tgt_amt != 0) & (tgt_day != NO_DAY) & (hi - lo >= 2)
+    for t in np.flatnonzero(eligible)[np.argsort(tgt_day[eligible], kind="stable")]:
+        goal = tgt_amt[t]
+        candidates = usable[lo[t] : hi[t]]
+        amounts = src_amt[candidates]
+        keep = ~used[candidates] & (np.sign(amounts) == np.sign(goal))
+        keep &= np.abs(amounts) <= abs(goal) + tol
+        candidates = candidates[keep]
+        if len(candidates) < 2:
+            continue
+
+        if len(candidates) > max_candidates:
+            closest = np.argsort(np.abs(src_day[candidates] - tgt_day[t]), kind="stable")
+            candidates = candidates[closest[:max_candidates]]
+
+        subset = find_subset(np.abs(src_amt[candidates]), abs(goal), tol, max_subset_size)
+        if subset is None:
+            continue
+
+        members = candidates[subset]
+        used[members] = True
+        member_pos.append(members)
+        target_pos.append(t)
+
+    if not member_pos:
+        return result
+
+    sizes = np.array([len(members) for members in member_pos])
+    members = np.concatenate(member_pos)
+    owners = np.repeat(np.array(target_pos), sizes)
+
+    subset_matched = (
+        sources.iloc[members]
+        .reset_index(drop=True)
+        .fillna(targets.iloc[owners].reset_index(drop=True))
+    )
+    subset_ids = np.repeat(np.arange(len(sizes)), sizes)
+    subset_sums = np.bincount(subset_ids, weights=src_amt[members]).astype(np.int64)
+    subset_matched["_amt_diff"] = (
+        np.abs(subset_sums - tgt_amt[target_pos])[subset_ids] / 10**decimal_precision
+    )
+    subset_matched["_subset_id"] = subset_ids
+    subset_matched["_subset_size"] = sizes[subset_ids]
+
+    matched_targets = np.zeros(len(targets), dtype=bool)
+    matched_targets[target_pos] = True
+
+    return result.replace(
+        missing_in_target=sources[~used].copy(),
+        missing_in_source=targets[~matched_targets].copy(),
+        subset_matched=pd.concat([result.subset_matched, subset_matched], ignore_index=True),
+    )
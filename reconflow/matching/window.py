@@ -0,0 +1,188 @@
+"""Date- and amount-window matching for records without usable references."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from reconflow.matching.residuals import NO_DAY, day_numbers
+from reconflow.matching.strategies import ExactReferenceStrategy, MatchingStrategy, MatchResult
+
+_EXACT = ExactReferenceStrategy()
+
+
+def pair_within_window(
+    source_amounts: np.ndarray,
+    source_days: np.ndarray,
+    target_amounts: np.ndarray,
+    target_days: np.ndarray,
+    window_days: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pair records one-to-one on equal amount and dates within a window.
+
+    Both sides are sorted by amount and day. Within an amount, pairing the
+    k-th source with the k-th target record is already a maximum matching
+    when every such pair falls within the window, which is the usual case
+    for a ledger that reconciles; this is one vectorized join. Amounts with
+    a pair outside the window are paired in one greedy sweep: each source
+    record takes the earliest remaining target record of its amount that is
+    no more than ``window_days`` before it, if that target is also no more
+    than ``window_days`` after it. As every window has the same width, the
+    sweep pairs as many records as possible, in O(n) after the O(n log n)
+    sort. Same-day records get no priority: with a one-day window, sources
+    on days 1 and 2 pair with targets on days 2 and 3, not just day 2 with 2.
+
+    Args:
+        source_amounts: Source amounts in minor units (int64)
+        source_days: Source day numbers, ``NO_DAY`` where missing
+        target_amounts: Target amounts in minor units (int64)
+        target_days: Target day numbers, ``NO_DAY`` where missing
+        window_days: Maximum days between paired records
+
+    Returns:
+        Tuple of (source positions, target positions) of the pairs
+    """
+    src = pd.DataFrame({"amount": source_amounts, "day": source_days})
+    tgt = pd.DataFrame({"amount": target_amounts, "day": target_days})
+    src["pos"] = np.arange(len(src))
+    tgt["pos"] = np.arange(len(tgt))
+    src = src[src["day"] != NO_DAY].sort_values(["amount", "day", "pos"])
+    tgt = tgt[tgt["day"] != NO_DAY].sort_values(["amount", "day", "pos"])
+
+    # Pair by rank within each amount, keeping the amounts where every pair fits
+    src["rank"] = src.groupby("amount").cumcount()
+    tgt["rank"] = tgt.groupby("amount").cumcount()
+    ranked = src.merge(tgt, on=["amount", "rank"], suffixes=("_source", "_target"))
+    outside = (ranked["day_source"] - ranked["day_target"]).abs() > window_days
+    swept = ranked.loc[outside, "amount"].unique()
+    ranked = ranked[~ranked["amount"].isin(swept)]
+
+    src = src[src["amount"].isin(swept)]
+    tgt = tgt[tgt["amount"].isin(swept)]
+    src_pos, tgt_pos = _sweep(
+        src["amount"].tolist(),
+        src["day"].tolist(),
+        tgt["amount"].tolist(),
+        tgt["day"].tolist(),
+        window_days,
+    )
+
+    src_pairs = np.concatenate([ranked["pos_source"].to_numpy(), src["pos"].to_numpy()[src_pos]])
+    tgt_pairs = np.concatenate([ranked["pos_target"].to_numpy(), tgt["pos"].to_numpy()[tgt_pos]])
+    return src_pairs.astype(np.int64), tgt_pairs.astype(np.int64)
+
+
+def _sweep(
+    src_amounts: list[int],
+    src_days: list[int],
+    tgt_amounts: list[int],
+    tgt_days: list[int],
+    window_days: int,
+) -> tuple[list[int], list[int]]:
+    """Greedily pair two (amount, day)-sorted sides in one pass; returns positions in each."""
+    src_pos: list[int] = []
+    tgt_pos: list[int] = []
+    i = j = 0
+    while i < len(src_amounts) and j < len(tgt_amounts):
+        amount, day = src_amounts[i], src_days[i]
+        if tgt_amounts[j] < amount or (
+            tgt_amounts[j] == amount and tgt_days[j] < day - window_days
+        ):
+            # Too early for this source, and so for every later one
+            j += 1
+        elif tgt_amounts[j] > amount or tgt_days[j] > day + window_days:
+            # Every remaining target of this amount is too late
+            i += 1
+        else:
+            src_pos.append(i)
+            tgt_pos.append(j)
+            i += 1
+            j += 1
+    return src_pos, tgt_pos
+
+
+class DateAmountWindowStrategy(MatchingStrategy):
+    """
+    Date- and amount-window matching strategy (1:1).
+
+    Pairs records with identical standardized amounts dated within
+    ``date_window_days`` of each other, regardless of reference, so records
+    without a usable reference can still be matched. Each record is used at
+    most once.
+    """
+
+    name: str = "date_amount_window"
+
+    def match(
+        self,
+        source: pd.DataFrame,
+        target: pd.DataFrame,
+        source_ref_col: str,
+        target_ref_col: str,
+        source_amt_col: str,
+        target_amt_col: str,
+        tolerance: float = 0.01,
+        normalize_refs: bool = True,
+        decimal_precision: int = 2,
+        source_date_col: str = "date",
+        target_date_col: str = "date",
+        date_window_days: int = 0,
+    ) -> MatchResult:
+        """
+        Pair records on amount and date, then classify them.
+
+        Args:
+            source: Source DataFrame
+            target: Target DataFrame
+            source_ref_col: Reference column in source
+            target_ref_col: Reference column in target
+            source_amt_col: Amount column in source
+            target_amt_col: Amount column in target
+            tolerance: Amount tolerance
+            normalize_refs: Whether to add normalized references for review
+            decimal_precision: Decimal precision
+            source_date_col: Date column in source
+            target_date_col: Date column in target
+            date_window_days: Maximum days between paired records
+
+        Returns:
+            MatchResult with paired records in ``matched`` and the rest in the
+            missing buckets
+        """
+        src = _EXACT.prepare(
+            source, source_ref_col, source_amt_col, normalize_refs, decimal_precision
+        )
+        tgt = _EXACT.prepare(
+            target, target_ref_col, target_amt_col, normalize_refs, decimal_precision
+        )
+        src["_day"] = day_numbers(src[source_date_col])
+        tgt["_day"] = day_numbers(tgt[target_date_col])
+
+        src_ok = src["_std_minor"].notna().to_numpy()
+        tgt_ok = tgt["_std_minor"].notna().to_numpy()
+        src_pos, tgt_pos = pair_within_window(
+            src["_std_minor"][src_ok].to_numpy(dtype=np.int64),
+            src["_day"].to_numpy()[src_ok],
+            tgt["_std_minor"][tgt_ok].to_numpy(dtype=np.int64),
+            tgt["_day"].to_numpy()[tgt_ok],
+            date_window_days,
+        )
+        src_pos = np.flatnonzero(src_ok)[src_pos]
+        tgt_pos = np.flatnonzero(tgt_ok)[tgt_pos]
+
+        # Join on a pair id: paired records share one, all others get their own
+        src_pair = np.full(len(src), -1, dtype=np.int64)
+        tgt_pair = np.full(len(tgt), -1, dtype=np.int64)
+        src_pair[src_pos] = np.arange(len(src_pos))
+        tgt_pair[tgt_pos] = np.arange(len(tgt_pos))
+        src_left = src_pair < 0
+        tgt_left = tgt_pair < 0
+        src_pair[src_left] = len(src_pos) + np.arange(src_left.sum())
+        tgt_pair[tgt_left] = len(src_pos) + src_left.sum() + np.arange(tgt_left.sum())
+        src["_pair"] = src_pair
+        tgt["_pair"] = tgt_pair
+
+        merged = _EXACT.join(_EXACT.slim(src, "_pair"), _EXACT.slim(tgt, "_pair"), "_pair", "_pair")
+        sides = _EXACT.sides(src, tgt, "_pair", "_pair")
+        return _EXACT.classify(merged, tolerance, decimal_precision, sides)
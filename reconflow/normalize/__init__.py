@@ -1,6 +1,35 @@
 """Normalization utilities for data standardization."""
 
-from reconflow.normalize.decimal import standardize_decimal
-from reconflow.normalize.reference import normalize_reference
+from typing import TYPE_CHECKING
 
-__all__ = ["standardize_decimal", "normalize_reference"]
+from reconflow._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from reconflow.normalize.decimal import (
+        standardize_decimal,
+        standardize_decimal_series,
+        to_minor_units,
+        tolerance_to_minor_units,
+    )
+    from reconflow.normalize.reference import normalize_reference, normalize_reference_series
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "standardize_decimal": "reconflow.normalize.decimal",
+        "standardize_decimal_series": "reconflow.normalize.decimal",
+        "to_minor_units": "reconflow.normalize.decimal",
+        "tolerance_to_minor_units": "reconflow.normalize.decimal",
+        "normalize_reference": "reconflow.normalize.reference",
+        "normalize_reference_series": "reconflow.normalize.reference",
+    },
+)
+
+__all__ = [
+    "standardize_decimal",
+    "standardize_decimal_series",
+    "to_minor_units",
+    "tolerance_to_minor_units",
+    "normalize_reference",
+    "normalize_reference_series",
+]
@@ -6,7 +6,24 @@ Decimal precision mismatches cause 80% of reconciliation failures.
 
 from __future__ import annotations
 
-from decimal import ROUND_HALF_UP, Decimal
+from decimal import ROUND_FLOOR, ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pandas as pd
+
+from reconflow.normalize.strings import to_string_series
+
+# sign, integer digits, fraction digits and exponent of a plain decimal literal
+_DECIMAL_TEXT = (
+    r"^(?P<sign>[+-]?)(?P<int>[0-9]*)(?:\.(?P<frac>[0-9]*))?(?:[eE](?P<exp>[+-]?[0-9]+))?$"
+)
+
+# int64 holds every 18-digit integer, so digit strings up to this length are safe
+_MAX_DIGITS = 18
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+_OUT_OF_RANGE = "Amount out of range for int64 minor units"
 
 
 def standardize_decimal(
@@ -51,6 +68,207 @@ def standardize_decimal(
     return float(result)
 
 
+def to_minor_units(
+    value: str | float | int | Decimal | None,
+    precision: int = 2,
+) -> int | None:
+    """
+    Convert a value to integer minor units (e.g. cents) with ROUND_HALF_UP.
+
+    Scalar reference for :func:`standardize_decimal_series`; the result equals
+    ``standardize_decimal(value, precision)`` scaled by ``10 ** precision``.
+
+    Args:
+        value: The numeric value to convert
+        precision: Number of decimal places in one major unit
+
+    Returns:
+        Amount in minor units, or None if the input is None or NaN
+
+    Examples:
+        >>> to_minor_units("10.005", 2)
+        1001
+        >>> to_minor_units(-10.005, 2)
+        -1001
+    """
+    if value is None:
+        return None
+
+    d = Decimal(str(value))
+
+    if d.is_nan():
+        return None
+
+    return int(d.scaleb(precision).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def tolerance_to_minor_units(tolerance: float, precision: int = 2) -> int:
+    """
+    Convert an absolute amount tolerance to whole minor units.
+
+    Standardized amounts are multiples of one minor unit, so a difference is
+    within ``tolerance`` exactly when its minor units are at most the floor
+    of the scaled tolerance.
+
+    Args:
+        tolerance: Absolute tolerance in major units
+        precision: Number of decimal places in one major unit
+
+    Returns:
+        Largest whole number of minor units within the tolerance
+    """
+    scaled = Decimal(str(tolerance)).scaleb(precision)
+    return int(scaled.to_integral_value(rounding=ROUND_FLOOR))
+
+
+def standardize_decimal_series(values: pd.Series, precision: int = 2) -> pd.Series:
+    """
+    Standardize a column of amounts to int64 minor units in one pass.
+
+    Columnar equivalent of :func:`to_minor_units`: rounding is ROUND_HALF_UP on
+    the value's decimal representation, exactly as :func:`standardize_decimal`
+    does, but without building a Decimal per row. Floats are rounded with
+    NumPy arithmetic and only values that sit on a rounding boundary are
+    re-read from their shortest decimal representation; strings are split into
+    digits and exponent with vectorized string kernels.
+
+    Args:
+        values: Series of amounts (strings, floats, ints or Decimals)
+        precision: Number of decimal places (default 2 for currency)
+
+    Returns:
+        Nullable ``Int64`` series of minor units; missing and NaN amounts are NA
+
+    Raises:
+        decimal.InvalidOperation: If a value is not a number (as the scalar function)
+
+    Examples:
+        >>> standardize_decimal_series(pd.Series(["10.005", None, 7])).tolist()
+        [1001, <NA>, 700]
+    """
+    minor = pd.Series(pd.NA, index=values.index, dtype="Int64")
+    present = values.notna().to_numpy()
+
+    if not present.any():
+        return minor
+
+    if pd.api.types.is_bool_dtype(values.dtype):
+        values = values.astype(object)
+
+    if pd.api.types.is_integer_dtype(values.dtype):
+        ints = values[present].to_numpy(dtype=np.int64)
+        minor[present] = _scale_integers(ints, precision)
+        return minor
+
+    if pd.api.types.is_float_dtype(values.dtype):
+        floats = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        exact, certain = _round_floats(floats, precision)
+        done = present & certain
+        minor[done] = exact[done]
+        present = present & ~certain
+        if not present.any():
+            return minor
+        text = pd.Series(floats[present].astype(str), index=values.index[present])
+    else:
+        text = values[present]
+
+    minor[present] = _parse_decimal_text(text, precision)
+    return minor
+
+
+def _scale_integers(ints: np.ndarray, precision: int) -> np.ndarray:
+    """Scale whole numbers to minor units, refusing silent int64 overflow."""
+    factor = 10**precision
+    if len(ints) and np.abs(ints).max() > _INT64_MAX // factor:
+        raise OverflowError(_OUT_OF_RANGE)
+    return ints * factor
+
+
+def _round_floats(floats: np.ndarray, precision: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Round floats half-up to minor units with float arithmetic.
+
+    The scaled float can differ from the scaled shortest decimal repr by a few
+    ulps, so rows within that distance of a half are flagged as uncertain and
+    must be decided on their decimal text instead.
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = np.abs(floats) * float(10**precision)
+        fraction = scaled - np.floor(scaled)
+        certain = (
+            np.isfinite(scaled)
+            & (scaled < 2.0**52)
+            & (np.abs(fraction - 0.5) > 4 * np.spacing(scaled))
+        )
+        rounded = np.where(certain, np.floor(scaled + 0.5), 0.0)
+
+    exact = np.copysign(rounded, floats).astype(np.int64)
+    return exact, certain
+
+
+def _parse_decimal_text(text: pd.Series, precision: int) -> np.ndarray:
+    """Convert decimal literals to minor units; irregular rows use the scalar path."""
+    strings = to_string_series(text).str.strip()
+    parts = strings.str.extract(_DECIMAL_TEXT, expand=True)
+
+    # Unmatched optional groups are NA on some backends and "" on others
+    matched = parts["sign"].notna().to_numpy()
+    sign = parts["sign"].fillna("")
+    whole = parts["int"].fillna("")
+    frac = parts["frac"].fillna("")
+    exp_text = parts["exp"].fillna("")
+
+    has_exp = (exp_text.str.len() > 0).to_numpy(dtype=bool)
+    # Only the first dropped digit decides ROUND_HALF_UP, so without an exponent
+    # nothing past precision + 1 fraction digits can change the result.
+    frac = frac.where(has_exp, frac.str.slice(0, precision + 1))
+    digits = whole + frac
+
+    n_digits = digits.str.len().fillna(0).to_numpy(dtype=np.int64)
+    regular = matched & (n_digits > 0) & (n_digits <= _MAX_DIGITS)
+
+    exponent = np.zeros(len(text), dtype=np.int64)
+    exponent[has_exp] = exp_text[has_exp].astype(np.int64).to_numpy()
+    shift = exponent - frac.str.len().fillna(0).to_numpy(dtype=np.int64) + precision
+    # Scaling up must stay within int64
+    regular &= (shift < 0) | (n_digits + shift <= _MAX_DIGITS)
+
+    result = np.zeros(len(text), dtype=np.int64)
+
+    if regular.any():
+        mantissa = digits[regular].astype(np.int64).to_numpy()
+        result[regular] = _round_shifted(mantissa, shift[regular])
+        negative = (sign == "-").to_numpy(dtype=bool) & regular
+        result[negative] = -result[negative]
+
+    irregular = ~regular
+    if irregular.any():
+        fallback = [to_minor_units(value, precision) for value in text[irregular]]
+        if any(value is not None and abs(value) > _INT64_MAX for value in fallback):
+            raise OverflowError(_OUT_OF_RANGE)
+        result = result.astype(object)
+        result[irregular] = fallback
+        return pd.array(result, dtype="Int64")
+
+    return result
+
+
+def _round_shifted(mantissa: np.ndarray, shift: np.ndarray) -> np.ndarray:
+    """Compute round_half_up(mantissa * 10**shift) for non-negative mantissas."""
+    result = np.zeros(len(mantissa), dtype=np.int64)
+
+    up = shift >= 0
+    result[up] = mantissa[up] * np.power(10, shift[up], dtype=np.int64)
+
+    # mantissa < 10**18 so anything scaled down by more than 18 digits is below 0.1
+    down = (shift < 0) & (shift >= -_MAX_DIGITS)
+    divisor = np.power(10, -shift[down], dtype=np.int64)
+    quotient, remainder = np.divmod(mantissa[down], divisor)
+    result[down] = quotient + (2 * remainder >= divisor)
+
+    return result
+
+
 def amounts_match(
     amount1: str | float | int | Decimal | None,
     amount2: str | float | int | Decimal | None,
@@ -69,10 +287,10 @@ def amounts_match(
     Returns:
         True if amounts match within tolerance, False otherwise
     """
-    std1 = standardize_decimal(amount1, precision)
-    std2 = standardize_decimal(amount2, precision)
+    std1 = to_minor_units(amount1, precision)
+    std2 = to_minor_units(amount2, precision)
 
     if std1 is None or std2 is None:
         return std1 is None and std2 is None
 
-    return abs(std1 - std2) <= tolerance
+    return abs(std1 - std2) <= tolerance_to_minor_units(tolerance, precision)
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import math
 import re
 
+import numpy as np
+import pandas as pd
+
+from reconflow.normalize.strings import to_string_series
+
 _TRF_PATTERN = re.compile(r"\b(TRF\|[^\s|]+(?:\|[^\s|]+)*)\b", re.IGNORECASE)
 
 _GENERIC_PATTERN = re.compile(r"[A-Za-z0-9]+(?:[|/_-][A-Za-z0-9]+)*")
 
+# Columnar spelling of _TRF_PATTERN: inline flag and a named group so Arrow-backed
+# strings can run it through the pyarrow (RE2) regex kernels.
+_TRF_EXTRACT = r"(?i)\b(?P<ref>TRF\|[^\s|]+(?:\|[^\s|]+)*)\b"
+
+# Characters where Python's str/re semantics (Unicode whitespace, case mapping)
+# can differ from Arrow's kernels; rows containing them use the scalar function.
+_NON_PORTABLE = r"[^\t\n\f\r\x20-\x7e]"
+
+_WHITESPACE_RUN = r"\s\s|[\t\n\f\r]"
+
 
 def normalize_reference(ref: str | None, extract_trf: bool = True) -> str:
     """
@@ -35,7 +51,7 @@ def normalize_reference(ref: str | None, extract_trf: bool = True) -> str:
         >>> normalize_reference(None)
         ''
     """
-    if ref is None:
+    if ref is None or (isinstance(ref, float) and math.isnan(ref)):
         return ""
 
     ref = str(ref).strip()
@@ -54,6 +70,53 @@ def normalize_reference(ref: str | None, extract_trf: bool = True) -> str:
     return ref
 
 
+def normalize_reference_series(refs: pd.Series, extract_trf: bool = True) -> pd.Series:
+    """
+    Normalize a column of references in one pass.
+
+    Columnar equivalent of :func:`normalize_reference` built on pandas string
+    methods, which run on pyarrow compute kernels when pyarrow is installed.
+    The output is identical to applying the scalar function row by row;
+    missing values (None/NaN) normalize to an empty string.
+
+    Args:
+        refs: Series of raw references
+        extract_trf: Whether to extract TRF patterns from longer strings
+
+    Returns:
+        Series of normalized references with the same index as ``refs``
+
+    Examples:
+        >>> normalize_reference_series(pd.Series(["trf|abc|1", None])).tolist()
+        ['TRF|ABC|1', '']
+    """
+    values = to_string_series(refs)
+
+    non_portable = values.str.contains(_NON_PORTABLE, regex=True)
+
+    values = values.str.strip()
+
+    if extract_trf:
+        extracted = values.str.extract(_TRF_EXTRACT, expand=False)
+        values = extracted.fillna(values)
+
+    values = values.str.upper()
+
+    spaced = values.str.contains(_WHITESPACE_RUN, regex=True)
+    if spaced.any():
+        values[spaced] = values[spaced].str.replace(r"\s+", " ", regex=True)
+
+    result = values.astype(str)
+
+    positions = np.flatnonzero(non_portable.to_numpy(dtype=bool))
+    if len(positions):
+        result.iloc[positions] = [
+            normalize_reference(ref, extract_trf) for ref in refs.iloc[positions]
+        ]
+
+    return result
+
+
 def extract_reference_parts(ref: str) -> list[str]:
     """
     Extract parts from a pipe-separated reference.
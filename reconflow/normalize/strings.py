@@ -0,0 +1,29 @@
+"""String column helpers shared by the columnar normalizers."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+
+def to_string_series(values: pd.Series) -> pd.Series:
+    """
+    Convert a series to strings, with missing values as empty strings.
+
+    Non-string values are converted with ``str()`` so the result matches what
+    the scalar normalizers see. When pyarrow is installed the result is
+    Arrow-backed, so ``.str`` methods run on pyarrow compute kernels.
+
+    Args:
+        values: Series of arbitrary values
+
+    Returns:
+        Series of strings with the same index as ``values``
+    """
+    strings = values.astype(str).where(values.notna(), "")
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return strings
+
+    return strings.astype(pd.ArrowDtype(pa.string()))
@@ -0,0 +1,520 @@
+"""Reconciliation pipeline orchestration."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from reconflow.assurance import ControlSet
+from reconflow.cache import PreparedCache, PreparedSources, file_digest
+from reconflow.config import ArrowSource, CSVSource, ParquetSource, ReconFlowConfig, Source
+from reconflow.incremental import IncrementalState
+from reconflow.io import coerce_amount, read_arrow, read_csv, read_parquet
+from reconflow.matching import match_out_of_core, match_records
+from reconflow.matching.engine import get_strategy
+from reconflow.matching.fuzzy import match_fuzzy_references
+from reconflow.matching.strategies import KeyedStrategy
+from reconflow.matching.subset_sum import match_subset_sums
+from reconflow.pricing import add_expected_fees
+from reconflow.profiling import StageTimer
+from reconflow.quality import UNPARSED, QualityCheck, count_unparsed
+from reconflow.report import RunArtifactWriter, RunSummary
+
+
+def _silent(message: str) -> None:
+    """Default progress callback."""
+
+
+def run_pipeline(
+    config: ReconFlowConfig,
+    log: Callable[[str], None] = _silent,
+    full_refresh: bool = False,
+    sources: PreparedSources | None = None,
+) -> RunSummary:
+    """
+    Run a reconciliation pipeline and write its artifacts.
+
+    Sources are matched in memory unless ``matching.memory_budget_mb`` is set,
+    in which case they are streamed and matched out-of-core.
+
+    With ``matching.incremental``, only records not seen by earlier runs are
+    matched, together with the open items those runs carried forward.
+
+    The wall time, CPU time, rows and peak memory of every stage are recorded
+    in the summary's ``stages``.
+
+    Args:
+        config: Validated pipeline configuration
+        log: Callback receiving progress messages
+        full_refresh: Discard incremental state and reconcile all records
+        sources: Prepared sources shared with other pipelines (e.g. a
+            ``SourcePool``), used instead of ``cache`` when ``shares_sources``
+
+    Returns:
+        RunSummary of the written run
+    """
+    timer = StageTimer()
+    if config.matching.memory_budget_mb is not None:
+        return _run_out_of_core(config, log, timer)
+    return _run_in_memory(config, log, timer, full_refresh, sources)
+
+
+def load_source(source: Source) -> pd.DataFrame:
+    """
+    Load the projected columns of a source of any type.
+
+    Args:
+        source: CSV, Parquet or Arrow source configuration
+
+    Returns:
+        DataFrame with the source's records
+    """
+    columns = source.selected_columns()
+
+    if isinstance(source, ParquetSource):
+        filters = []
+        if source.date_from is not None:
+            filters.append((source.date_field, ">=", source.date_from))
+        if source.date_to is not None:
+            filters.append((source.date_field, "<=", source.date_to))
+        return read_parquet(source.path, columns=columns, filters=filters)
+
+    if isinstance(source, ArrowSource):
+        return read_arrow(source.path, columns=columns)
+
+    return read_csv(source.path, columns=columns, engine=source.engine)
+
+
+def _run_in_memory(
+    config: ReconFlowConfig,
+    log: Callable[[str], None],
+    timer: StageTimer,
+    full_refresh: bool = False,
+    sources: PreparedSources | None = None,
+) -> RunSummary:
+    cache = _prepared_cache(config, sources)
+    controls = _controls(config)
+    checks = _quality_checks(config)
+    matcher = get_strategy(config.matching.strategy)
+
+    details = {}
+
+    log("  Loading product data...")
+    with timer.stage("load_product") as stage:
+        inputs = {"product": _fingerprint(config.product.path, cache)}
+        product = load_prepared(config.product, config, cache, log, inputs["product"]["blake2b"])
+        stage.rows = len(product)
+    if checks:
+        with timer.stage("quality_product", len(product)):
+            checks["product"].update(product)
+            details["quality"] = {"product": checks["product"].finish()}
+
+    log("  Loading CBA data...")
+    with timer.stage("load_cba") as stage:
+        inputs["cba"] = _fingerprint(config.cba.path, cache)
+        cba = load_prepared(config.cba, config, cache, log, inputs["cba"]["blake2b"])
+        stage.rows = len(cba)
+    details["inputs"] = inputs
+    if checks:
+        with timer.stage("quality_cba", len(cba)):
+            checks["cba"].update(cba)
+            details["quality"]["cba"] = checks["cba"].finish()
+
+    state = None
+    if config.matching.incremental:
+        with timer.stage("incremental") as stage:
+            state = IncrementalState.for_pipeline(config.output.run_dir, config.pipeline_name)
+            if full_refresh:
+                state.reset()
+            product, new_source, carried_source = state.delta("source", product)
+            cba, new_target, carried_target = state.delta("target", cba)
+            stage.rows = len(product) + len(cba)
+        log(f"  Incremental: {new_source} new + {carried_source} open product records")
+        log(f"  Incremental: {new_target} new + {carried_target} open CBA records")
+        details["incremental"] = {
+            "new_source": new_source,
+            "carried_source": carried_source,
+            "new_target": new_target,
+            "carried_target": carried_target,
+        }
+        # Row positions let the open items be stored in their loaded form
+        loaded = {"source": product.copy(), "target": cba.copy()}
+        product["_row_id"] = np.arange(len(product))
+        cba["_row_id"] = np.arange(len(cba))
+
+    if cache is None:
+        with timer.stage("coerce_amount", len(product) + len(cba)):
+            product[config.product.amount_field] = coerce_amount(
+                product[config.product.amount_field]
+            )
+            cba[config.cba.amount_field] = coerce_amount(cba[config.cba.amount_field])
+
+    pricing = config.pricing
+    if pricing.enabled:
+        log(f"  Computing expected fees ({pricing.strategy})...")
+        with timer.stage("pricing", len(product)):
+            product = add_expected_fees(product, config.product.amount_field, pricing)
+        details["pricing"] = {
+            "strategy": pricing.strategy,
+            "priced": int(product["_expected_fee_minor"].notna().sum()),
+            "total_expected_fee": int(product["_expected_fee_minor"].sum())
+            / 10**pricing.decimal_precision,
+        }
+
+    # Prepare keyed sides here so normalization is timed apart from the join;
+    # with several workers it stays inside matching, which prepares in parallel
+    prepared = cache is not None
+    if not prepared and isinstance(matcher, KeyedStrategy) and config.matching.workers <= 1:
+        log("  Normalizing references and amounts...")
+        with timer.stage("normalize", len(product) + len(cba)):
+            product = _prepare(matcher, product, config.product, config)
+            cba = _prepare(matcher, cba, config.cba, config)
+        prepared = True
+
+    if config.matching.workers > 1:
+        log(f"  Matching records ({config.matching.workers} workers)...")
+    else:
+        log("  Matching records...")
+    with timer.stage("match", len(product) + len(cba)):
+        result = match_records(
+            source=product,
+            target=cba,
+            strategy=config.matching.strategy,
+            source_ref_col=config.product.reference_field,
+            target_ref_col=config.cba.reference_field,
+            source_amt_col=config.product.amount_field,
+            target_amt_col=config.cba.amount_field,
+            tolerance=config.matching.amount_tolerance_abs,
+            normalize_refs=config.matching.normalize_reference,
+            decimal_precision=config.pricing.decimal_precision,
+            workers=config.matching.workers,
+            prepared=prepared,
+            source_date_col=config.product.date_field,
+            target_date_col=config.cba.date_field,
+            date_window_days=config.matching.date_window_days,
+        )
+    if result.stats:
+        details["duplicates"] = result.stats
+
+    subset_sum = config.matching.subset_sum
+    if subset_sum.enabled:
+        log("  Matching residuals by subset sum...")
+        residuals = result.count("missing_in_target") + result.count("missing_in_source")
+        with timer.stage("subset_sum", residuals):
+            result = match_subset_sums(
+                result,
+                source_date_col=config.product.date_field,
+                target_date_col=config.cba.date_field,
+                tolerance=config.matching.amount_tolerance_abs,
+                decimal_precision=config.pricing.decimal_precision,
+                max_subset_size=subset_sum.max_subset_size,
+                date_window_days=subset_sum.date_window_days,
+                counterparty_col=subset_sum.counterparty_field,
+                max_candidates=subset_sum.max_candidates,
+            )
+        log(f"    {result.count('subset_matched')} records in subsets")
+
+    fuzzy = config.matching.fuzzy
+    if fuzzy.enabled:
+        log("  Proposing fuzzy reference matches...")
+        residuals = result.count("missing_in_target") + result.count("missing_in_source")
+        with timer.stage("fuzzy", residuals):
+            result = match_fuzzy_references(
+                result,
+                source_ref_col=config.product.reference_field,
+                target_ref_col=config.cba.reference_field,
+                source_date_col=config.product.date_field,
+                target_date_col=config.cba.date_field,
+                normalize_refs=config.matching.normalize_reference,
+                min_similarity=fuzzy.min_similarity,
+                q=fuzzy.q,
+                date_window_days=fuzzy.date_window_days,
+                max_candidates=fuzzy.max_candidates,
+            )
+        log(f"    {result.count('fuzzy_candidates')} candidate pairs")
+
+    buckets = {
+        "matched": result.matched,
+        "missing_in_target": result.missing_in_target,
+        "missing_in_source": result.missing_in_source,
+        "amount_mismatches": result.amount_mismatches,
+    }
+    stage_artifacts = []
+    if subset_sum.enabled:
+        stage_artifacts.append("subset_matched")
+    if fuzzy.enabled:
+        stage_artifacts.append("fuzzy_candidates")
+    buckets.update({bucket: result.bucket(bucket) for bucket in stage_artifacts})
+    if state is not None:
+        open_items = {
+            "source": _rows(loaded["source"], result.missing_in_target["_row_id_source"]),
+            "target": _rows(loaded["target"], result.missing_in_source["_row_id_target"]),
+        }
+        buckets = {
+            bucket: frame.drop(columns=["_row_id_source", "_row_id_target"], errors="ignore")
+            for bucket, frame in buckets.items()
+        }
+        details["incremental"]["open_source"] = len(open_items["source"])
+        details["incremental"]["open_target"] = len(open_items["target"])
+
+    log("  Writing results...")
+    writer = RunArtifactWriter(
+        config.output.run_dir,
+        config.pipeline_name,
+        config.output.format,
+        config.output.compression,
+        config.output.index,
+        stage_artifacts,
+    )
+    writer.details.update(details)
+    with timer.stage("write", sum(len(frame) for frame in buckets.values())):
+        writer.write(buckets)
+    if controls is not None:
+        with timer.stage("assurance", sum(len(frame) for frame in buckets.values())):
+            controls.observe(buckets)
+    summary = _close(writer, controls, log, timer)
+
+    # Advance the state only once the run's artifacts are safely written
+    if state is not None:
+        state.save(open_items)
+
+    return summary
+
+
+def _controls(config: ReconFlowConfig) -> ControlSet | None:
+    """Compiled assurance controls, or None if there are none."""
+    if not config.assurance.controls:
+        return None
+    return ControlSet(config.assurance.controls)
+
+
+def _close(
+    writer: RunArtifactWriter,
+    controls: ControlSet | None,
+    log: Callable[[str], None],
+    timer: StageTimer,
+) -> RunSummary:
+    """Evaluate the run's controls, if any, and write its summary with the stage stats."""
+    if controls is not None:
+        log("  Evaluating assurance controls...")
+        assurance = controls.finish({**writer.totals, **writer.metrics})
+        writer.details["assurance"] = assurance
+        log(f"    {assurance['failed']} of {len(controls.controls)} controls failed")
+    writer.stages = timer.to_list()
+    return writer.close()
+
+
+def _quality_checks(config: ReconFlowConfig) -> dict[str, QualityCheck]:
+    """Quality checks of both sources, or none if disabled."""
+    if not config.quality.enabled:
+        return {}
+    # group_sum expects repeated references and date_amount_window ignores them
+    check_duplicates = config.matching.strategy == "exact_reference"
+    return {
+        name: QualityCheck(
+            name,
+            source,
+            config.quality,
+            config.matching.normalize_reference,
+            check_duplicates,
+        )
+        for name, source in (("product", config.product), ("cba", config.cba))
+    }
+
+
+def shares_sources(config: ReconFlowConfig) -> bool:
+    """Whether a pipeline can take its prepared sources from a cache or a ``SourcePool``."""
+    return (
+        config.matching.memory_budget_mb is None
+        and not config.matching.incremental
+        and isinstance(get_strategy(config.matching.strategy), KeyedStrategy)
+    )
+
+
+def _prepared_cache(
+    config: ReconFlowConfig, sources: PreparedSources | None = None
+) -> PreparedSources | None:
+    """Cache of prepared sources, if enabled and usable for this run."""
+    if not shares_sources(config):
+        return None
+    if sources is not None:
+        return sources
+    if not config.cache.enabled:
+        return None
+    return PreparedCache(config.cache.dir, config.cache.max_size_mb)
+
+
+def _fingerprint(path: str, cache: PreparedSources | None = None) -> dict:
+    """Size and content hash of an input file, recorded in the run catalog."""
+    digest = cache.digest(path) if cache is not None else file_digest(path)
+    return {"path": path, "bytes": os.path.getsize(path), "blake2b": digest}
+
+
+def source_key(
+    source: Source,
+    config: ReconFlowConfig,
+    cache: PreparedSources,
+    digest: str | None = None,
+) -> str:
+    """
+    Cache key of a source prepared for a pipeline.
+
+    Pipelines reading the same file with the same source, strategy and
+    normalization settings share a key.
+
+    Args:
+        source: Source configuration
+        config: Pipeline configuration
+        cache: Cache the key is for
+        digest: The source file's content hash, if already computed
+
+    Returns:
+        Cache key
+    """
+    return cache.key(
+        source.path,
+        {
+            "source": source.model_dump(exclude={"path"}),
+            "strategy": get_strategy(config.matching.strategy).name,
+            "normalize_reference": config.matching.normalize_reference,
+            "decimal_precision": config.pricing.decimal_precision,
+        },
+        digest,
+    )
+
+
+def load_prepared(
+    source: Source,
+    config: ReconFlowConfig,
+    cache: PreparedSources | None,
+    log: Callable[[str], None] = _silent,
+    digest: str | None = None,
+) -> pd.DataFrame:
+    """
+    Load a source, or its prepared form from the cache.
+
+    With a cache, the returned frame has its amount coerced and the strategy's
+    key and standardized amount columns added. Cache hits skip both parsing
+    and normalization. The amounts that could not be parsed are counted
+    before coercion and kept in ``frame.attrs[UNPARSED]`` for the quality
+    checks.
+
+    Args:
+        source: Source configuration
+        config: Pipeline configuration
+        cache: Cache of prepared sources, or None to load the raw records
+        log: Callback receiving progress messages
+        digest: The source file's content hash, if already computed
+
+    Returns:
+        DataFrame with the source's records
+    """
+    if cache is None:
+        frame = load_source(source)
+        log(f"    {len(frame)} records")
+        return frame
+
+    key = source_key(source, config, cache, digest)
+    frame = cache.get(key)
+    if frame is not None:
+        log(f"    {len(frame)} records (cached)")
+        return frame
+
+    frame = load_source(source)
+    log(f"    {len(frame)} records")
+    amounts = frame[source.amount_field]
+    frame[source.amount_field] = coerce_amount(amounts)
+    unparsed = {source.amount_field: count_unparsed(amounts, frame[source.amount_field])}
+    frame = _prepare(get_strategy(config.matching.strategy), frame, source, config)
+    frame.attrs[UNPARSED] = unparsed
+    cache.put(key, frame)
+    return frame
+
+
+def _prepare(
+    matcher: KeyedStrategy,
+    frame: pd.DataFrame,
+    source: Source,
+    config: ReconFlowConfig,
+) -> pd.DataFrame:
+    """Add a source's key and standardized amount columns for a keyed strategy."""
+    return matcher.prepare(
+        frame,
+        source.reference_field,
+        source.amount_field,
+        config.matching.normalize_reference,
+        config.pricing.decimal_precision,
+    )
+
+
+def _rows(frame: pd.DataFrame, row_ids: pd.Series) -> pd.DataFrame:
+    """Select loaded records by their ``_row_id``."""
+    return frame.iloc[row_ids.to_numpy(dtype=np.int64)]
+
+
+def _run_out_of_core(
+    config: ReconFlowConfig,
+    log: Callable[[str], None],
+    timer: StageTimer,
+) -> RunSummary:
+    if config.matching.incremental:
+        raise ValueError("Incremental matching runs in memory; unset matching.memory_budget_mb")
+    if config.matching.subset_sum.enabled:
+        raise ValueError("Subset-sum matching runs in memory; unset matching.memory_budget_mb")
+    if config.matching.fuzzy.enabled:
+        raise ValueError("Fuzzy matching runs in memory; unset matching.memory_budget_mb")
+    if config.pricing.enabled:
+        raise ValueError("Expected fees are computed in memory; unset matching.memory_budget_mb")
+    for source in (config.product, config.cba):
+        if not isinstance(source, CSVSource):
+            raise ValueError(
+                f"Out-of-core matching streams CSV sources only, got {source.type}: {source.path}"
+            )
+
+    checks = _quality_checks(config)
+    controls = _controls(config)
+
+    log(f"  Matching out-of-core (budget {config.matching.memory_budget_mb} MB)...")
+    writer = RunArtifactWriter(
+        config.output.run_dir,
+        config.pipeline_name,
+        config.output.format,
+        config.output.compression,
+        config.output.index,
+    )
+
+    with timer.stage("match_out_of_core") as stage:
+        writer.details["inputs"] = {
+            "product": _fingerprint(config.product.path),
+            "cba": _fingerprint(config.cba.path),
+        }
+        n_partitions = match_out_of_core(
+            source_path=config.product.path,
+            target_path=config.cba.path,
+            writer=writer,
+            memory_budget_mb=config.matching.memory_budget_mb,
+            strategy=config.matching.strategy,
+            source_ref_col=config.product.reference_field,
+            target_ref_col=config.cba.reference_field,
+            source_amt_col=config.product.amount_field,
+            target_amt_col=config.cba.amount_field,
+            tolerance=config.matching.amount_tolerance_abs,
+            normalize_refs=config.matching.normalize_reference,
+            decimal_precision=config.pricing.decimal_precision,
+            spill_dir=config.matching.spill_dir,
+            source_columns=config.product.selected_columns(),
+            target_columns=config.cba.selected_columns(),
+            on_source_chunk=checks["product"].update if checks else None,
+            on_target_chunk=checks["cba"].update if checks else None,
+            on_result=controls.observe if controls is not None else None,
+        )
+        stage.rows = writer.totals["total_source"] + writer.totals["missing_in_source"]
+    log(f"    {n_partitions} partitions")
+    if checks:
+        writer.details["quality"] = {name: check.finish() for name, check in checks.items()}
+
+    log("  Writing results...")
+    return _close(writer, controls, log, timer)
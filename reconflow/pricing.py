@@ -0,0 +1,120 @@
+"""Expected fees for whole amount columns, computed in integer minor units."""
+
+from __future__ import annotations
+
+import math
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from reconflow.config import PricingConfig
+from reconflow.normalize import standardize_decimal_series, to_minor_units
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _rate_fraction(rate: float) -> tuple[int, int]:
+    """Exact (numerator, denominator) of a rate as written, e.g. 0.015 -> (3, 200)."""
+    return Decimal(str(rate)).as_integer_ratio()
+
+
+def _apply_rates(amounts: np.ndarray, numerators: np.ndarray, denominator: int) -> np.ndarray:
+    """Round ``amounts * numerators / denominator`` half-up without leaving int64."""
+    if len(amounts) and int(amounts.max()) > _INT64_MAX // max(int(numerators.max()), 1):
+        raise OverflowError("Amount too large to price in int64 minor units")
+    quotient, remainder = np.divmod(amounts * numerators, denominator)
+    return quotient + (2 * remainder >= denominator)
+
+
+def fees_from_minor_units(amounts: np.ndarray, config: PricingConfig) -> np.ndarray:
+    """
+    Compute fees for amounts already in minor units.
+
+    Fees are charged on the absolute amount and rounded half-up to a whole
+    minor unit. Rates are applied as exact fractions of their decimal form,
+    so 1.5% of 1001 minor units is 15.015, rounded to 15, with no float drift.
+
+    Tiered pricing finds each amount's band by binary search over the band
+    bounds and applies that band's rate and flat fee to the whole amount;
+    amounts above the last bound use the last band.
+
+    Args:
+        amounts: int64 amounts in minor units
+        config: Pricing strategy, rates, tiers and cap
+
+    Returns:
+        int64 fees in minor units
+
+    Raises:
+        OverflowError: If an amount times a rate numerator exceeds int64
+    """
+    precision = config.decimal_precision
+    amounts = np.abs(np.asarray(amounts, dtype=np.int64))
+
+    if config.strategy == "flat":
+        fees = np.full(len(amounts), to_minor_units(config.flat_fee, precision), dtype=np.int64)
+
+    elif config.strategy == "percentage":
+        numerator, denominator = _rate_fraction(config.rate)
+        fees = _apply_rates(amounts, np.int64(numerator), denominator)
+
+    else:
+        fractions = [_rate_fraction(tier.rate) for tier in config.tiers]
+        denominator = math.lcm(*(den for _, den in fractions))
+        numerators = np.array([num * (denominator // den) for num, den in fractions], np.int64)
+        flat_fees = np.array(
+            [to_minor_units(tier.flat_fee, precision) for tier in config.tiers], np.int64
+        )
+        bounds = np.array(
+            [to_minor_units(tier.up_to, precision) for tier in config.tiers[:-1]], np.int64
+        )
+
+        # A band covers amounts up to and including its bound
+        band = np.searchsorted(bounds, amounts, side="left")
+        fees = flat_fees[band] + _apply_rates(amounts, numerators[band], denominator)
+
+    if config.cap is not None:
+        fees = np.minimum(fees, to_minor_units(config.cap, precision))
+
+    return fees
+
+
+def expected_fees(amounts: pd.Series, config: PricingConfig) -> pd.Series:
+    """
+    Compute the expected fee of every amount in a column.
+
+    Args:
+        amounts: Amounts as strings, floats, ints or Decimals
+        config: Pricing configuration
+
+    Returns:
+        Nullable ``Int64`` series of fees in minor units; NA where the amount
+        is missing
+    """
+    minor = standardize_decimal_series(amounts, config.decimal_precision)
+    present = minor.notna().to_numpy()
+
+    fees = pd.Series(pd.NA, index=amounts.index, dtype="Int64")
+    fees[present] = fees_from_minor_units(minor[present].to_numpy(dtype=np.int64), config)
+    return fees
+
+
+def add_expected_fees(frame: pd.DataFrame, amt_col: str, config: PricingConfig) -> pd.DataFrame:
+    """
+    Add expected fee columns to records.
+
+    Args:
+        frame: Records with an amount column
+        amt_col: Amount column name
+        config: Pricing configuration
+
+    Returns:
+        Copy of ``frame`` with ``_expected_fee_minor`` (Int64 minor units) and
+        ``_expected_fee`` (major units)
+    """
+    fees = expected_fees(frame[amt_col], config)
+    return frame.assign(
+        _expected_fee_minor=fees,
+        _expected_fee=fees.astype("float64") / 10**config.decimal_precision,
+    )
@@ -0,0 +1,85 @@
+"""Per-stage timing and resource usage of a run."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far in MB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@dataclass
+class Stage:
+    """Resource usage of one stage of a run."""
+
+    name: str
+    rows: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_mb: float | None = None
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.wall_s if self.wall_s > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Stage stats for ``summary.json``."""
+        return {
+            **asdict(self),
+            "wall_s": round(self.wall_s, 4),
+            "cpu_s": round(self.cpu_s, 4),
+            "rows_per_s": round(self.rows_per_s, 1),
+        }
+
+
+class StageTimer:
+    """
+    Record the wall time, CPU time, rows and peak memory of each stage of a run.
+
+    CPU time covers every thread of this process but not worker processes.
+    Peak RSS is the process's high-water mark when the stage ends, so it only
+    grows from stage to stage; the stage where it jumps is the one that
+    needed the memory.
+    """
+
+    def __init__(self) -> None:
+        self.stages: list[Stage] = []
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[Stage]:
+        """
+        Time a stage; set ``rows`` on the yielded stage if not known upfront.
+
+        Args:
+            name: Stage name
+            rows: Records processed by the stage
+
+        Yields:
+            The stage, recorded once the block completes
+        """
+        stage = Stage(name, rows)
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield stage
+        stage.wall_s = time.perf_counter() - wall
+        stage.cpu_s = time.process_time() - cpu
+        stage.peak_rss_mb = peak_rss_mb()
+        self.stages.append(stage)
+
+    def to_list(self) -> list[dict]:
+        """All recorded stages for ``summary.json``, in order."""
+        return [stage.to_dict() for stage in self.stages]
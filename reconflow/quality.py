@@ -0,0 +1,213 @@
+"""Data quality checks run on each source before matching."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from reconflow.config import QualityConfig, Source
+from reconflow.io import coerce_amount, coerce_date
+from reconflow.normalize import normalize_reference_series
+from reconflow.normalize.strings import to_string_series
+
+# ``DataFrame.attrs`` key of a frame whose loader already coerced some columns:
+# the number of present values it could not parse, by column
+UNPARSED = "reconflow_unparsed"
+
+
+def _blank(values: pd.Series) -> np.ndarray:
+    """Mask of missing or blank values."""
+    return (to_string_series(values).str.strip() == "").to_numpy(dtype=bool)
+
+
+def count_unparsed(raw: pd.Series, parsed: pd.Series) -> int:
+    """
+    Count the values that were present in ``raw`` but missing once parsed.
+
+    Args:
+        raw: Values as loaded
+        parsed: The same values after coercion
+
+    Returns:
+        Number of unparseable values
+    """
+    return int((parsed.isna().to_numpy() & ~_blank(raw)).sum())
+
+
+class QualityError(ValueError):
+    """A source broke a hard quality threshold."""
+
+    def __init__(self, name: str, failures: list[str]) -> None:
+        super().__init__(f"{name} failed quality checks: {'; '.join(failures)}")
+        self.failures = failures
+
+
+class QualityCheck:
+    """
+    Quality checks of one source, accumulated over one or more chunks.
+
+    Each chunk is checked in a single vectorized pass: required columns,
+    missing values per required field, values ``coerce_amount`` or
+    ``coerce_date`` cannot parse, and references repeating an earlier
+    record's. Rates are cumulative, so a streamed source fails at the first
+    chunk after which a threshold is broken instead of after a full load.
+    The minimum record count can only be checked once all chunks are seen.
+
+    Columns coerced before the check (e.g. amounts of a cached prepared
+    source) are counted from the unparseable counts the loader recorded
+    in ``chunk.attrs[UNPARSED]``, as their invalid values are now missing.
+
+    Args:
+        name: Source name used in messages (e.g. ``product``)
+        source: Source configuration; ``date``, ``reference`` and ``amount``
+            in ``required_fields`` map to its configured columns
+        config: Quality thresholds
+        normalize_refs: Whether duplicates compare normalized references
+        check_duplicates: Whether ``max_duplicate_pct`` is enforced
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: Source,
+        config: QualityConfig,
+        normalize_refs: bool = True,
+        check_duplicates: bool = True,
+    ) -> None:
+        self.name = name
+        self.source = source
+        self.config = config
+        self.normalize_refs = normalize_refs
+        self.check_duplicates = check_duplicates
+
+        aliases = {
+            "date": source.date_field,
+            "reference": source.reference_field,
+            "amount": source.amount_field,
+        }
+        self.fields = list(dict.fromkeys(aliases.get(f, f) for f in config.required_fields))
+
+        self.rows = 0
+        self.missing_fields: list[str] = []
+        self.null = dict.fromkeys(self.fields, 0)
+        self.invalid = dict.fromkeys(self.fields, 0)
+        self.duplicates = 0
+        self._seen_keys = np.empty(0, dtype=np.uint64)
+        self._seen_unique: pd.Index | None = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Check the next chunk of records.
+
+        Raises:
+            QualityError: If a hard threshold is broken by the records so far
+        """
+        if self.rows == 0:
+            self.missing_fields = [f for f in self.fields if f not in chunk.columns]
+        self.rows += len(chunk)
+
+        unparsed = chunk.attrs.get(UNPARSED, {})
+        for field in self.fields:
+            if field not in chunk.columns:
+                continue
+            values = chunk[field]
+            null = int(_blank(values).sum())
+            if field in unparsed:
+                self.null[field] += null - unparsed[field]
+                self.invalid[field] += unparsed[field]
+                continue
+            self.null[field] += null
+            parsed = self._coerce(field, values)
+            if parsed is not None:
+                self.invalid[field] += count_unparsed(values, parsed)
+
+        if self.source.reference_field in chunk.columns:
+            self._count_duplicates(chunk[self.source.reference_field])
+
+        failures = self.failures(final=False)
+        if failures:
+            raise QualityError(self.name, failures)
+
+    def finish(self) -> dict[str, Any]:
+        """
+        Check the totals once every chunk is seen.
+
+        Returns:
+            Summary of the checks for ``summary.json``
+
+        Raises:
+            QualityError: If a hard threshold is broken
+        """
+        failures = self.failures(final=True)
+        if failures:
+            raise QualityError(self.name, failures)
+        return self.to_dict()
+
+    def _coerce(self, field: str, values: pd.Series) -> pd.Series | None:
+        if field == self.source.amount_field:
+            return coerce_amount(values)
+        if field == self.source.date_field:
+            return coerce_date(values)
+        return None
+
+    def _count_duplicates(self, references: pd.Series) -> None:
+        keys = normalize_reference_series(references) if self.normalize_refs else references
+        keys = to_string_series(keys)
+        keys = keys[(keys.str.strip() != "").to_numpy(dtype=bool)]
+        _, unique = pd.factorize(keys)
+        self.duplicates += len(keys) - len(unique)
+
+        # Hashing is only needed to compare against earlier chunks, so a source
+        # checked in one piece keeps its distinct keys as they are
+        if self._seen_unique is not None:
+            self._seen_keys = _hashes(self._seen_unique)
+            self._seen_unique = None
+        if self.rows == len(references):
+            self._seen_unique = unique
+            return
+
+        hashes = _hashes(unique)
+        self.duplicates += int(np.isin(hashes, self._seen_keys, assume_unique=True).sum())
+        self._seen_keys = np.union1d(self._seen_keys, hashes)
+
+    def failures(self, final: bool = True) -> list[str]:
+        """Broken thresholds; ``final`` also checks the minimum record count."""
+        config = self.config
+        failures = [f"missing required column {field!r}" for field in self.missing_fields]
+
+        if self.rows:
+            for field in self.fields:
+                bad = self.null[field] + self.invalid[field]
+                if bad / self.rows > config.max_invalid_pct:
+                    failures.append(
+                        f"{bad / self.rows:.2%} of {field!r} values missing or invalid "
+                        f"(max {config.max_invalid_pct:.2%})"
+                    )
+            if self.check_duplicates and self.duplicates / self.rows > config.max_duplicate_pct:
+                failures.append(
+                    f"{self.duplicates / self.rows:.2%} duplicate references "
+                    f"(max {config.max_duplicate_pct:.2%})"
+                )
+
+        if final and self.rows < config.min_record_count:
+            failures.append(f"{self.rows} records (min {config.min_record_count})")
+
+        return failures
+
+    def to_dict(self) -> dict[str, Any]:
+        """Counts and rates of the checks so far."""
+        return {
+            "rows": self.rows,
+            "missing_fields": self.missing_fields,
+            "null": self.null,
+            "invalid": self.invalid,
+            "duplicates": self.duplicates,
+            "duplicate_pct": round(self.duplicates / self.rows, 6) if self.rows else 0.0,
+        }
+
+
+def _hashes(keys: pd.Index) -> np.ndarray:
+    """Sorted uint64 hashes of distinct keys."""
+    return np.unique(pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64))
@@ -1,5 +1,29 @@
 """Report generation utilities."""
 
-from reconflow.report.summary import RunSummary, write_run_artifacts
+from typing import TYPE_CHECKING
 
-__all__ = ["RunSummary", "write_run_artifacts"]
+from reconflow._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from reconflow.report.catalog import RunCatalog
+    from reconflow.report.formats import read_artifact
+    from reconflow.report.summary import RunArtifactWriter, RunSummary, write_run_artifacts
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RunArtifactWriter": "reconflow.report.summary",
+        "RunCatalog": "reconflow.report.catalog",
+        "RunSummary": "reconflow.report.summary",
+        "read_artifact": "reconflow.report.formats",
+        "write_run_artifacts": "reconflow.report.summary",
+    },
+)
+
+__all__ = [
+    "RunArtifactWriter",
+    "RunCatalog",
+    "RunSummary",
+    "read_artifact",
+    "write_run_artifacts",
+]
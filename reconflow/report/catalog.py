@@ -0,0 +1,287 @@
+"""SQLite catalog of run summaries."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import re
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+CATALOG_FILE = "catalog.sqlite"
+
+# Queryable per-run numbers: totals by bucket, then the run metric
+COLUMNS = (
+    "total_source",
+    "matched",
+    "missing_in_target",
+    "missing_in_source",
+    "amount_mismatches",
+    "subset_matched",
+    "fuzzy_candidates",
+    "pool_match_pct",
+)
+
+STAGE_COLUMNS = ("rows", "wall_s", "cpu_s", "rows_per_s", "peak_rss_mb")
+
+PERIODS = {"day": "%Y-%m-%d", "week": "%Y-W%W", "month": "%Y-%m"}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    pipeline_name TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    executed_at TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    format TEXT NOT NULL,
+    {", ".join(f"{column} INTEGER" for column in COLUMNS[:-1])},
+    pool_match_pct REAL,
+    product_hash TEXT,
+    cba_hash TEXT,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (pipeline_name, run_id)
+);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (pipeline_name, executed_at);
+CREATE TABLE IF NOT EXISTS stages (
+    pipeline_name TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    rows INTEGER,
+    {", ".join(f"{column} REAL" for column in STAGE_COLUMNS[1:])},
+    PRIMARY KEY (pipeline_name, run_id, position)
+);
+CREATE INDEX IF NOT EXISTS stages_by_name ON stages (pipeline_name, name);
+"""
+
+_CONDITION = re.compile(r"^\s*(\w+)\s*(<=|>=|!=|==|=|<|>)\s*(-?[\d.]+)\s*$")
+
+_LISTED = ("pipeline_name", "run_id", "executed_at", "dir", *COLUMNS)
+
+
+def _parse_condition(text: str) -> tuple[str, str, float]:
+    """Split ``missing_in_target > 100`` into a checked column, operator and value."""
+    found = _CONDITION.match(text)
+    if found is None:
+        raise ValueError(f"Invalid condition {text!r}; expected e.g. 'missing_in_target > 100'")
+    column, op, value = found.groups()
+    if column not in COLUMNS:
+        raise ValueError(f"Unknown column {column!r}; expected one of {', '.join(COLUMNS)}")
+    return column, "=" if op == "==" else op, float(value)
+
+
+class RunCatalog:
+    """
+    Index of the runs under a run directory, stored in ``<run_dir>/catalog.sqlite``.
+
+    Each run's totals, metrics, input hashes and stage timings are recorded
+    in one transaction when its summary is written, so history queries read
+    a few indexed rows instead of parsing every ``summary.json``. Only
+    ``record`` and ``rebuild`` create the catalog, indexing the summaries of
+    existing runs first; queries open it read-only, or read the summaries
+    directly while it does not exist.
+    """
+
+    def __init__(self, run_dir: str | Path) -> None:
+        self.run_dir = Path(run_dir)
+        self.path = self.run_dir / CATALOG_FILE
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the catalog for writing, creating it (and indexing existing runs) if missing."""
+        new = not self.path.exists()
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_SCHEMA)
+        if new:
+            self._index_summaries(conn)
+        return conn
+
+    def _index_summaries(self, conn: sqlite3.Connection) -> None:
+        """Insert the ``summary.json`` of every run under the run directory."""
+        with conn:
+            for path in sorted(self.run_dir.glob("*/*/summary.json")):
+                self._insert(conn, json.loads(path.read_text(encoding="utf-8")))
+
+    def _read(self, sql: str, params: list[Any]) -> list[sqlite3.Row]:
+        """
+        Run a query on a read-only connection.
+
+        Without a catalog file (e.g. runs written before the catalog
+        existed), the run summaries are indexed into an in-memory catalog
+        for this query, leaving the run directory untouched.
+        """
+        if self.path.exists():
+            uri = f"{self.path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=30)
+        else:
+            conn = sqlite3.connect(":memory:")
+            conn.executescript(_SCHEMA)
+            self._index_summaries(conn)
+        with closing(conn):
+            conn.row_factory = sqlite3.Row
+            return conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, summary: dict[str, Any]) -> None:
+        key = (summary["pipeline_name"], summary["run_id"])
+        numbers = {**summary["totals"], **summary["metrics"]}
+        inputs = summary.get("details", {}).get("inputs", {})
+        conn.execute(
+            f"INSERT OR REPLACE INTO runs VALUES ({', '.join('?' * (len(COLUMNS) + 8))})",
+            (
+                *key,
+                summary["executed_at"],
+                summary["paths"]["dir"],
+                summary.get("format", "csv"),
+                *(numbers.get(column) for column in COLUMNS),
+                inputs.get("product", {}).get("blake2b"),
+                inputs.get("cba", {}).get("blake2b"),
+                json.dumps(summary),
+            ),
+        )
+        conn.execute("DELETE FROM stages WHERE pipeline_name = ? AND run_id = ?", key)
+        conn.executemany(
+            f"INSERT INTO stages VALUES ({', '.join('?' * (len(STAGE_COLUMNS) + 4))})",
+            [
+                (*key, position, stage["name"], *(stage.get(c) for c in STAGE_COLUMNS))
+                for position, stage in enumerate(summary.get("stages", []))
+            ],
+        )
+
+    def record(self, summary: dict[str, Any]) -> None:
+        """
+        Add or replace a run, atomically.
+
+        Args:
+            summary: The run's summary, as written to ``summary.json``
+        """
+        with closing(self._connect()) as conn, conn:
+            self._insert(conn, summary)
+
+    def rebuild(self) -> int:
+        """
+        Re-index every ``summary.json`` under the run directory.
+
+        Returns:
+            Number of runs indexed
+        """
+        self.path.unlink(missing_ok=True)
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def get(self, pipeline_name: str, run_id: str | None = None) -> dict[str, Any] | None:
+        """
+        Summary of a run, or of the pipeline's latest run.
+
+        Args:
+            pipeline_name: Pipeline name
+            run_id: Run ID (default: the latest run)
+
+        Returns:
+            The run's summary, or None if the catalog has no such run
+        """
+        sql = "SELECT summary FROM runs WHERE pipeline_name = ?"
+        params: list[Any] = [pipeline_name]
+        if run_id is not None:
+            sql += " AND run_id = ?"
+            params.append(run_id)
+        sql += " ORDER BY executed_at DESC LIMIT 1"
+        rows = self._read(sql, params)
+        return json.loads(rows[0]["summary"]) if rows else None
+
+    def query(
+        self,
+        pipeline_name: str | None = None,
+        where: list[str] | None = None,
+        since: str | None = None,
+        input_hash: str | None = None,
+        order_by: str = "executed_at",
+        descending: bool = True,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Find runs by their totals and metrics.
+
+        Args:
+            pipeline_name: Only runs of this pipeline (default: all pipelines)
+            where: Conditions such as ``missing_in_target > 100``, all of which must hold
+            since: Only runs executed on or after this ISO date or timestamp
+            input_hash: Only runs that read an input with this content hash
+            order_by: ``executed_at`` or a column of ``COLUMNS``
+            descending: Sort from highest or latest
+            limit: Maximum number of runs
+
+        Returns:
+            One dict per run with its identity, directory, totals and metrics
+        """
+        if order_by not in ("executed_at", *COLUMNS):
+            raise ValueError(f"Cannot order by {order_by!r}")
+
+        clauses, params = [], []
+        if pipeline_name is not None:
+            clauses.append("pipeline_name = ?")
+            params.append(pipeline_name)
+        if since is not None:
+            clauses.append("executed_at >= ?")
+            params.append(since)
+        if input_hash is not None:
+            clauses.append("(product_hash = ? OR cba_hash = ?)")
+            params.extend([input_hash, input_hash])
+        for condition in where or []:
+            column, op, value = _parse_condition(condition)
+            clauses.append(f"{column} {op} ?")
+            params.append(value)
+
+        sql = f"SELECT {', '.join(_LISTED)} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, executed_at DESC LIMIT ?"
+        params.append(limit)
+
+        return [dict(row) for row in self._read(sql, params)]
+
+    def trend(
+        self,
+        pipeline_name: str,
+        metric: str = "pool_match_pct",
+        days: int = 90,
+        period: str = "day",
+        stage: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate a metric per period over a pipeline's recent runs.
+
+        Args:
+            pipeline_name: Pipeline name
+            metric: A column of ``COLUMNS``, or of ``STAGE_COLUMNS`` with ``stage``
+            days: How far back to look
+            period: ``day``, ``week`` or ``month``
+            stage: Aggregate this stage's timings instead of run totals
+
+        Returns:
+            One dict per period, oldest first, with period, runs, min, avg and max
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}; expected one of {', '.join(PERIODS)}")
+        allowed = STAGE_COLUMNS if stage is not None else COLUMNS
+        if metric not in allowed:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {', '.join(allowed)}")
+
+        since = (dt.datetime.now(dt.UTC) - dt.timedelta(days=days)).isoformat()
+        source = "runs"
+        params: list[Any] = [PERIODS[period], pipeline_name, since]
+        if stage is not None:
+            source = "stages JOIN runs USING (pipeline_name, run_id) WHERE stages.name = ? AND"
+            params.insert(1, stage)
+        else:
+            source += " WHERE"
+
+        sql = (
+            f"SELECT strftime(?, executed_at) AS period, COUNT(*) AS runs, "
+            f"MIN({metric}) AS min, AVG({metric}) AS avg, MAX({metric}) AS max "
+            f"FROM {source} pipeline_name = ? AND executed_at >= ? "
+            f"GROUP BY period ORDER BY period"
+        )
+        return [dict(row) for row in self._read(sql, params)]
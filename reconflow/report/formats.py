@@ -0,0 +1,204 @@
+"""Artifact file formats: CSV, JSON Lines and Parquet."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from reconflow.io import read_csv
+from reconflow.io.arrow import require_pyarrow, table_to_pandas
+from reconflow.report.index import STRIDE, ArtifactIndexer
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+SUFFIXES = {"csv": ".csv", "json": ".jsonl", "parquet": ".parquet"}
+
+
+class ArtifactFile(ABC):
+    """
+    A result file that frames are appended to, then closed.
+
+    With ``index``, the file is written in blocks of ``STRIDE`` records
+    whose offsets, along with a reference index, are saved on close so
+    pages and references can be read without loading the file.
+    """
+
+    def __init__(self, path: Path, index: bool = False) -> None:
+        self.path = path
+        self.rows = 0
+        self.index = ArtifactIndexer(path) if index else None
+
+    def append(self, frame: pd.DataFrame) -> None:
+        """Append records to the file."""
+        self._write(frame)
+        if self.index is not None:
+            self.index.add(frame)
+        self.rows += len(frame)
+
+    @abstractmethod
+    def _write(self, frame: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def _blocks(self, frame: pd.DataFrame) -> Iterator[tuple[pd.DataFrame, bool]]:
+        """Split appended records where index blocks start; True marks a block's start."""
+        if self.index is None:
+            yield frame, False
+            return
+        cuts = [0, *range((-self.rows) % STRIDE, len(frame), STRIDE), len(frame)]
+        for start, stop in pairwise(cuts):
+            if stop > start:
+                yield frame.iloc[start:stop], (self.rows + start) % STRIDE == 0
+
+    def _finish(self) -> None:  # noqa: B027 - most formats have nothing to finish
+        pass
+
+    def close(self) -> None:
+        """Finish the file and save its index."""
+        self._finish()
+        if self.index is not None:
+            self.index.save(self.rows)
+
+    @property
+    def size(self) -> int:
+        """Size of the file on disk in bytes."""
+        return self.path.stat().st_size if self.path.exists() else 0
+
+
+class _CSVFile(ArtifactFile):
+    def __init__(self, path: Path, index: bool = False) -> None:
+        super().__init__(path, index)
+        self._started = False
+
+    def _write(self, frame: pd.DataFrame) -> None:
+        first = not self._started
+        with open(self.path, "w" if first else "a", encoding="utf-8", newline="") as f:
+            if first:
+                frame.iloc[:0].to_csv(f, index=False)
+            for block, starts in self._blocks(frame):
+                if starts:
+                    self.index.offsets.append(f.tell())
+                block.to_csv(f, header=False, index=False)
+        self._started = True
+
+
+class _JSONLinesFile(ArtifactFile):
+    def __init__(self, path: Path, index: bool = False) -> None:
+        super().__init__(path, index)
+        self.path.write_text("", encoding="utf-8")
+
+    def _write(self, frame: pd.DataFrame) -> None:
+        if frame.empty:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for block, starts in self._blocks(frame):
+                if starts:
+                    self.index.offsets.append(f.tell())
+                block.to_json(f, orient="records", lines=True, date_format="iso")
+
+
+class _ParquetFile(ArtifactFile):
+    """
+    Streaming Parquet file.
+
+    The schema is taken from the first non-empty frame and later frames are
+    cast to it, so every appended batch becomes row groups of one file. With
+    ``index``, row groups hold at most ``STRIDE`` records so pages can be
+    read a row group at a time.
+    """
+
+    def __init__(self, path: Path, compression: str, index: bool = False) -> None:
+        require_pyarrow("Parquet artifacts")
+        super().__init__(path, index)
+        self.compression = compression
+        self._writer: pq.ParquetWriter | None = None
+        self._empty: pd.DataFrame | None = None
+
+    def _table(self, frame: pd.DataFrame) -> pa.Table:
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(frame, preserve_index=False)
+
+    def _write(self, frame: pd.DataFrame) -> None:
+        import pyarrow.parquet as pq
+
+        if frame.empty:
+            if self._empty is None:
+                self._empty = frame
+            return
+
+        table = self._table(frame)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+        elif not table.schema.equals(self._writer.schema):
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table, row_group_size=STRIDE if self.index is not None else None)
+
+    def _finish(self) -> None:
+        import pyarrow.parquet as pq
+
+        if self._writer is not None:
+            self._writer.close()
+            return
+
+        empty = self._empty if self._empty is not None else pd.DataFrame()
+        pq.write_table(self._table(empty), self.path, compression=self.compression)
+
+
+def open_artifact(
+    path: Path, format: str, compression: str = "snappy", index: bool = False
+) -> ArtifactFile:
+    """
+    Open a result file for writing.
+
+    Args:
+        path: File path, including the format's suffix
+        format: ``csv``, ``json`` (JSON Lines) or ``parquet``
+        compression: Parquet compression codec (``none`` to disable)
+        index: Save row-offset and reference indexes for ``read_page``
+
+    Returns:
+        ArtifactFile to append frames to
+    """
+    if format == "csv":
+        return _CSVFile(path, index)
+    if format == "json":
+        return _JSONLinesFile(path, index)
+    if format == "parquet":
+        return _ParquetFile(path, compression, index)
+    raise ValueError(f"Unknown artifact format: {format}")
+
+
+def read_artifact(path: str | Path) -> pd.DataFrame:
+    """
+    Read a result file written in any artifact format.
+
+    Args:
+        path: Artifact path; the format is taken from its suffix
+
+    Returns:
+        DataFrame with the artifact's records
+    """
+    path = Path(path)
+
+    if path.suffix == SUFFIXES["parquet"]:
+        require_pyarrow("Parquet artifacts")
+        import pyarrow.parquet as pq
+
+        return table_to_pandas(pq.read_table(path, memory_map=True))
+
+    if path.suffix == SUFFIXES["json"]:
+        if path.stat().st_size == 0:
+            return pd.DataFrame()
+        return pd.read_json(path, orient="records", lines=True, dtype=False)
+
+    try:
+        return read_csv(path)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
@@ -0,0 +1,287 @@
+"""Row-offset and reference indexes for paging through large artifacts."""
+
+from __future__ import annotations
+
+import io
+import json
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from reconflow.normalize.reference import normalize_reference, normalize_reference_series
+
+# Records per indexed block (CSV/JSON Lines) and per Parquet row group
+STRIDE = 65536
+
+# Column whose values the reference index covers
+REF_COLUMN = "_norm_ref"
+
+INDEX_DIR = "index"
+
+_PRIME = np.uint64(0x100000001B3)
+
+
+def _utf8(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """UTF-8 bytes of strings and the offsets delimiting each one (nulls are empty)."""
+    values = values.fillna("").astype("str")
+    try:
+        import pyarrow as pa
+    except ImportError:
+        encoded = [value.encode("utf-8") for value in values]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    array = pa.array(values, type=pa.large_string(), from_pandas=True)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    _, offsets, data = array.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64, count=len(array) + 1, offset=array.offset * 8)
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, np.uint8)
+    return offsets - offsets[0], data[offsets[0] : offsets[-1]]
+
+
+def hash_references(values: pd.Series) -> np.ndarray:
+    """
+    Hash strings to uint64, identically in every process.
+
+    A polynomial hash over the UTF-8 bytes, vectorized with NumPy (over the
+    Arrow buffers when pyarrow is installed). Missing and empty values hash
+    to 0. Lookups compare the records they find, so collisions only cost an
+    extra read.
+
+    Args:
+        values: Strings to hash
+
+    Returns:
+        One hash per value
+    """
+    offsets, data = _utf8(values)
+    hashes = np.zeros(len(values), dtype=np.uint64)
+    if len(data) == 0:
+        return hashes
+
+    lengths = np.diff(offsets)
+    position = np.arange(len(data)) - np.repeat(offsets[:-1], lengths)
+    powers = np.cumprod(np.full(int(lengths.max()), _PRIME, dtype=np.uint64))
+    # Multiplication and sums wrap modulo 2**64 by design
+    with np.errstate(over="ignore"):
+        terms = (data.astype(np.uint64) + np.uint64(1)) * powers[position]
+    present = lengths > 0
+    hashes[present] = np.add.reduceat(terms, offsets[:-1][present])
+    return hashes
+
+
+def _index_path(path: Path, kind: str) -> Path:
+    return path.parent / INDEX_DIR / f"{path.name}.{kind}"
+
+
+class ArtifactIndexer:
+    """
+    Build the indexes of one artifact while it is written.
+
+    The artifact file records the byte offset of every ``STRIDE``-th record;
+    the indexer hashes the ``_norm_ref`` of every record. ``save`` writes
+    the offsets, the hashes sorted with their row numbers and a small JSON
+    header to ``index/`` next to the artifact.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.offsets: list[int] = []
+        self._hashes: list[np.ndarray] = []
+        self._has_refs = False
+
+    def add(self, frame: pd.DataFrame) -> None:
+        """Hash the references of appended records."""
+        if REF_COLUMN in frame:
+            self._has_refs = True
+            self._hashes.append(hash_references(frame[REF_COLUMN]))
+        else:
+            self._hashes.append(np.zeros(len(frame), dtype=np.uint64))
+
+    def save(self, rows: int) -> None:
+        """
+        Write the index files.
+
+        Args:
+            rows: Records in the artifact
+        """
+        directory = self.path.parent / INDEX_DIR
+        directory.mkdir(exist_ok=True)
+        meta = {"rows": rows, "stride": STRIDE, "offsets": bool(self.offsets), "refs": False}
+
+        if self.offsets:
+            np.save(_index_path(self.path, "offsets.npy"), np.asarray(self.offsets, np.int64))
+        if self._has_refs:
+            hashes = np.concatenate(self._hashes)
+            order = np.argsort(hashes)
+            np.save(_index_path(self.path, "ref_hash.npy"), hashes[order])
+            np.save(
+                _index_path(self.path, "ref_row.npy"),
+                order.astype(np.uint32 if rows < 2**32 else np.int64),
+            )
+            meta["refs"] = True
+
+        _index_path(self.path, "json").write_text(json.dumps(meta), encoding="utf-8")
+
+
+class _Reader:
+    """Read row ranges of an indexed artifact without loading the rest of it."""
+
+    def __init__(self, path: Path, meta: dict) -> None:
+        self.path = path
+        self.meta = meta
+        self.stride = meta["stride"]
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            self._parquet = pq.ParquetFile(path, memory_map=True)
+            groups = self._parquet.metadata
+            sizes = [groups.row_group(i).num_rows for i in range(groups.num_row_groups)]
+            self._group_starts = np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+        elif meta["offsets"]:
+            self._offsets = np.load(_index_path(path, "offsets.npy"), mmap_mode="r")
+            if path.suffix == ".csv":
+                self._columns = pd.read_csv(path, nrows=0).columns.tolist()
+
+    @property
+    def rows(self) -> int:
+        return self.meta["rows"]
+
+    def blocks(self, rows: np.ndarray) -> np.ndarray:
+        """Block (row group for Parquet) holding each row."""
+        if self.path.suffix == ".parquet":
+            return np.searchsorted(self._group_starts, rows, side="right") - 1
+        return rows // self.stride
+
+    def read(self, start: int, stop: int) -> pd.DataFrame:
+        """Records ``start`` up to ``stop``, which may span blocks."""
+        stop = min(stop, self.rows)
+        if start >= stop:
+            return self._empty()
+
+        if self.path.suffix == ".parquet":
+            from reconflow.io.arrow import table_to_pandas
+
+            first, last = self.blocks(np.array([start, stop - 1])).tolist()
+            table = self._parquet.read_row_groups(range(first, last + 1))
+            offset = start - int(self._group_starts[first])
+            return table_to_pandas(table.slice(offset, stop - start))
+
+        block = start // self.stride
+        skip = start - block * self.stride
+        with open(self.path, "rb") as f:
+            f.seek(int(self._offsets[block]))
+            if self.path.suffix == ".csv":
+                return pd.read_csv(
+                    f,
+                    header=None,
+                    names=self._columns,
+                    dtype=str,
+                    skiprows=skip,
+                    nrows=stop - start,
+                )
+            lines = b"".join(islice(f, skip, skip + stop - start))
+        return pd.read_json(io.BytesIO(lines), orient="records", lines=True, dtype=False)
+
+    def _empty(self) -> pd.DataFrame:
+        if self.path.suffix == ".parquet":
+            from reconflow.io.arrow import table_to_pandas
+
+            return table_to_pandas(self._parquet.schema_arrow.empty_table())
+        if self.path.suffix == ".csv" and self.meta["offsets"]:
+            return pd.DataFrame(columns=self._columns)
+        return pd.DataFrame()
+
+    def take(self, rows: np.ndarray) -> pd.DataFrame:
+        """Records at sorted row numbers, reading only the blocks that hold them."""
+        blocks = self.blocks(rows)
+        frames = []
+        for block in np.unique(blocks):
+            wanted = rows[blocks == block]
+            first, last = int(wanted[0]), int(wanted[-1])
+            frame = self.read(first, last + 1)
+            frames.append(frame.iloc[wanted - first])
+        if not frames:
+            return self._empty()
+        return pd.concat(frames, ignore_index=True)
+
+
+def _read_unindexed(path: Path, ref: str | None) -> pd.DataFrame:
+    """Load a whole artifact, for runs written without indexes."""
+    from reconflow.report.formats import read_artifact
+
+    frame = read_artifact(path)
+    if ref is None or frame.empty:
+        return frame
+    if REF_COLUMN in frame:
+        return frame[frame[REF_COLUMN] == ref].reset_index(drop=True)
+    columns = [column for column in frame.columns if "reference" in column.lower()]
+    mask = np.zeros(len(frame), dtype=bool)
+    for column in columns:
+        mask |= (normalize_reference_series(frame[column]) == ref).to_numpy(dtype=bool)
+    return frame[mask].reset_index(drop=True)
+
+
+def read_page(
+    path: str | Path,
+    page: int = 1,
+    page_size: int = 50,
+    ref: str | None = None,
+) -> tuple[pd.DataFrame, int]:
+    """
+    Read one page of an artifact, optionally only the records with a reference.
+
+    Indexed artifacts are read by seeking to the block (or Parquet row
+    group) holding the page, and references are looked up in the sorted
+    hash index, so the cost does not grow with the artifact's size.
+    Artifacts written without indexes are loaded in full.
+
+    Args:
+        path: Artifact path
+        page: 1-based page number
+        page_size: Records per page
+        ref: Only records whose normalized reference equals this one (normalized first)
+
+    Returns:
+        Tuple of (records on the page, total records across all pages)
+    """
+    path = Path(path)
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be at least 1")
+    start = (page - 1) * page_size
+    ref = normalize_reference(ref) if ref is not None else None
+
+    meta_path = _index_path(path, "json")
+    meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else None
+    # Row-wise access needs block offsets, except in Parquet files
+    indexed = meta is not None and (
+        meta["offsets"] or path.suffix == ".parquet" or not meta["rows"]
+    )
+    if not indexed or (ref is not None and not meta["refs"]):
+        frame = _read_unindexed(path, ref)
+        return frame.iloc[start : start + page_size].reset_index(drop=True), len(frame)
+
+    reader = _Reader(path, meta)
+    if ref is None:
+        return reader.read(start, start + page_size).reset_index(drop=True), reader.rows
+
+    hashes = np.load(_index_path(path, "ref_hash.npy"), mmap_mode="r")
+    target = hash_references(pd.Series([ref], dtype="str"))[0]
+    # Records without a reference hash to 0 and never match
+    low, high = (
+        (np.searchsorted(hashes, target, "left"), np.searchsorted(hashes, target, "right"))
+        if target
+        else (0, 0)
+    )
+    rows = np.sort(np.load(_index_path(path, "ref_row.npy"), mmap_mode="r")[low:high]).astype(
+        np.int64
+    )
+    candidates = reader.take(rows)
+    if candidates.empty:
+        return candidates, 0
+    found = candidates[candidates[REF_COLUMN] == ref].reset_index(drop=True)
+    return found.iloc[start : start + page_size].reset_index(drop=True), len(found)
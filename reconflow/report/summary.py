@@ -4,11 +4,18 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-from dataclasses import asdict, dataclass
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import count
 from pathlib import Path
 
 import pandas as pd
 
+from reconflow.matching.strategies import source_records
+from reconflow.report.catalog import RunCatalog
+from reconflow.report.formats import SUFFIXES, open_artifact
+
 
 @dataclass
 class RunSummary:
@@ -20,6 +27,10 @@ class RunSummary:
     totals: dict[str, int]
     metrics: dict[str, float]
     paths: dict[str, str]
+    format: str = "csv"
+    files: dict[str, dict[str, int]] = field(default_factory=dict)
+    details: dict[str, dict] = field(default_factory=dict)
+    stages: list[dict] = field(default_factory=list)
 
 
 def _utc_now_id() -> str:
@@ -27,6 +38,158 @@ def _utc_now_id() -> str:
     return dt.datetime.now(dt.UTC).strftime("%Y%m%dT%H%M%SZ")
 
 
+# Result buckets written by every run
+BUCKETS = (
+    "matched",
+    "missing_in_target",
+    "missing_in_source",
+    "amount_mismatches",
+)
+
+# Artifacts of optional stages, written only by runs that enable them
+STAGE_ARTIFACTS = ("subset_matched", "fuzzy_candidates")
+
+ARTIFACTS = (*BUCKETS, *STAGE_ARTIFACTS)
+
+# Buckets whose records hold a source record
+_SOURCE_BUCKETS = ("matched", "missing_in_target", "amount_mismatches", "subset_matched")
+
+
+class RunArtifactWriter:
+    """
+    Incrementally write the artifacts of a single run.
+
+    Result frames can be appended bucket by bucket (e.g. one partition at a
+    time), so a run never has to hold all of its results in memory. Call
+    ``close`` once to write ``summary.json``, update ``latest.txt`` and
+    record the run in the run directory's catalog.
+
+    With ``index``, each artifact also gets the row-offset and reference
+    indexes read by ``read_page``; building them keeps 8 bytes per record
+    in memory until ``close``. Only the ``BUCKETS`` and the given stage
+    artifacts are written, counted and listed in the summary.
+    """
+
+    def __init__(
+        self,
+        run_dir: str,
+        pipeline_name: str,
+        format: str = "csv",
+        compression: str = "snappy",
+        index: bool = True,
+        stage_artifacts: Sequence[str] = (),
+    ) -> None:
+        unknown = set(stage_artifacts) - set(STAGE_ARTIFACTS)
+        if unknown:
+            raise ValueError(f"Unknown stage artifacts: {', '.join(sorted(unknown))}")
+        self.run_dir = run_dir
+        self.pipeline_name = pipeline_name
+        self.format = format
+        started = self.run_id = _utc_now_id()
+        # Runs started within the same second get a numbered suffix
+        for attempt in count(1):
+            self.out_dir = Path(run_dir) / pipeline_name / self.run_id
+            try:
+                self.out_dir.mkdir(parents=True)
+                break
+            except FileExistsError:
+                self.run_id = f"{started}-{attempt}"
+        self.details: dict[str, dict] = {}
+        self.stages: list[dict] = []
+        self._files = {
+            bucket: open_artifact(self.path(bucket), format, compression, index)
+            for bucket in ARTIFACTS
+            if bucket in BUCKETS or bucket in stage_artifacts
+        }
+        # Records holding a source record, by bucket
+        self._sourced = dict.fromkeys(self._files, 0)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Records written so far, by bucket."""
+        return {bucket: file.rows for bucket, file in self._files.items()}
+
+    @property
+    def totals(self) -> dict[str, int]:
+        """Records written so far, by bucket, plus the source records in any bucket."""
+        total_source = sum(self._sourced.get(bucket, 0) for bucket in _SOURCE_BUCKETS)
+        return {**self.counts, "total_source": total_source}
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """Run metrics of the records written so far."""
+        totals = self.totals
+        total_source = totals["total_source"]
+        pool_match_pct = (totals["matched"] / total_source * 100) if total_source > 0 else 0.0
+        return {"pool_match_pct": round(pool_match_pct, 2)}
+
+    def path(self, bucket: str) -> Path:
+        """Path of a bucket's artifact file."""
+        return self.out_dir / f"{bucket}{SUFFIXES[self.format]}"
+
+    def append(self, bucket: str, frame: pd.DataFrame) -> None:
+        """Append records to a bucket."""
+        if bucket not in self._files:
+            raise ValueError(f"Unknown result bucket: {bucket}")
+        self._files[bucket].append(frame)
+        self._sourced[bucket] += source_records(frame)
+
+    def write(self, frames: Mapping[str, pd.DataFrame]) -> None:
+        """
+        Append records to several buckets concurrently.
+
+        Each bucket has its own file, so the writes run on a thread pool;
+        CSV formatting, Parquet encoding and compression largely release the GIL.
+
+        Args:
+            frames: Records to append, by bucket name
+        """
+        for bucket in frames:
+            if bucket not in self._files:
+                raise ValueError(f"Unknown result bucket: {bucket}")
+
+        with ThreadPoolExecutor(max_workers=max(1, len(frames))) as pool:
+            # Consume the results so the first failed write is raised here
+            list(pool.map(self.append, frames.keys(), frames.values()))
+
+    def close(self) -> RunSummary:
+        """Finish the run: write summary.json, point latest.txt at it and catalog it."""
+        for file in self._files.values():
+            if file.rows == 0:
+                file.append(pd.DataFrame())
+            file.close()
+
+        paths = {"dir": str(self.out_dir)}
+        paths.update({bucket: str(self.path(bucket)) for bucket in self._files})
+
+        files = {
+            bucket: {"rows": file.rows, "bytes": file.size} for bucket, file in self._files.items()
+        }
+
+        summary = RunSummary(
+            run_id=self.run_id,
+            pipeline_name=self.pipeline_name,
+            executed_at=dt.datetime.now(dt.UTC).isoformat(),
+            totals=self.totals,
+            metrics=self.metrics,
+            paths=paths,
+            format=self.format,
+            files=files,
+            details=self.details,
+            stages=self.stages,
+        )
+
+        with open(self.out_dir / "summary.json", "w", encoding="utf-8") as f:
+            json.dump(asdict(summary), f, indent=2)
+        RunCatalog(self.run_dir).record(asdict(summary))
+
+        latest_file = Path(self.run_dir) / self.pipeline_name / "latest.txt"
+        latest_file.parent.mkdir(parents=True, exist_ok=True)
+        latest_file.write_text(self.run_id, encoding="utf-8")
+
+        return summary
+
+
 def write_run_artifacts(
     run_dir: str,
     pipeline_name: str,
@@ -34,6 +197,12 @@ def write_run_artifacts(
     missing_in_target: pd.DataFrame,
     missing_in_source: pd.DataFrame,
     amount_mismatches: pd.DataFrame,
+    subset_matched: pd.DataFrame | None = None,
+    fuzzy_candidates: pd.DataFrame | None = None,
+    format: str = "csv",
+    compression: str = "snappy",
+    details: dict[str, dict] | None = None,
+    index: bool = True,
 ) -> RunSummary:
     """
     Write run artifacts to disk.
@@ -45,56 +214,37 @@ def write_run_artifacts(
         missing_in_target: Records missing in target
         missing_in_source: Records missing in source
         amount_mismatches: Records with amount mismatches
+        subset_matched: Source records matched to a target entry by subset sum,
+            if the stage ran
+        fuzzy_candidates: Proposed pairs of residuals with similar references,
+            if the stage ran
+        format: Artifact format, ``csv``, ``json`` or ``parquet``
+        compression: Parquet compression codec
+        details: Stage details to record in the summary
+        index: Save row-offset and reference indexes of each artifact
 
     Returns:
         RunSummary with paths and metrics
     """
-    run_id = _utc_now_id()
-    out_dir = Path(run_dir) / pipeline_name / run_id
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    matched.to_csv(out_dir / "matched.csv", index=False)
-    missing_in_target.to_csv(out_dir / "missing_in_target.csv", index=False)
-    missing_in_source.to_csv(out_dir / "missing_in_source.csv", index=False)
-    amount_mismatches.to_csv(out_dir / "amount_mismatches.csv", index=False)
-
-    total_source = len(matched) + len(missing_in_target) + len(amount_mismatches)
-    pool_match_pct = (len(matched) / total_source * 100) if total_source > 0 else 0.0
-
-    totals = {
-        "matched": len(matched),
-        "missing_in_target": len(missing_in_target),
-        "missing_in_source": len(missing_in_source),
-        "amount_mismatches": len(amount_mismatches),
-        "total_source": total_source,
-    }
-
-    metrics = {
-        "pool_match_pct": round(pool_match_pct, 2),
+    frames = {
+        "matched": matched,
+        "missing_in_target": missing_in_target,
+        "missing_in_source": missing_in_source,
+        "amount_mismatches": amount_mismatches,
+        "subset_matched": subset_matched,
+        "fuzzy_candidates": fuzzy_candidates,
     }
-
-    paths = {
-        "dir": str(out_dir),
-        "matched": str(out_dir / "matched.csv"),
-        "missing_in_target": str(out_dir / "missing_in_target.csv"),
-        "missing_in_source": str(out_dir / "missing_in_source.csv"),
-        "amount_mismatches": str(out_dir / "amount_mismatches.csv"),
-    }
-
-    summary = RunSummary(
-        run_id=run_id,
-        pipeline_name=pipeline_name,
-        executed_at=dt.datetime.now(dt.UTC).isoformat(),
-        totals=totals,
-        metrics=metrics,
-        paths=paths,
+    frames = {bucket: frame for bucket, frame in frames.items() if frame is not None}
+    writer = RunArtifactWriter(
+        run_dir,
+        pipeline_name,
+        format,
+        compression,
+        index,
+        stage_artifacts=[bucket for bucket in frames if bucket in STAGE_ARTIFACTS],
     )
+    writer.details.update(details or {})
 
-    with open(out_dir / "summary.json", "w", encoding="utf-8") as f:
-        json.dump(asdict(summary), f, indent=2)
-
-    latest_file = Path(run_dir) / pipeline_name / "latest.txt"
-    latest_file.parent.mkdir(parents=True, exist_ok=True)
-    latest_file.write_text(run_id, encoding="utf-8")
+    writer.write(frames)
 
-    return summary
+    return writer.close()
@@ -0,0 +1,171 @@
+"""Keep a pipeline's reference side warm and reconcile product files as they arrive."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from reconflow.cache import SourcePool
+from reconflow.config import ReconFlowConfig
+from reconflow.pipeline import load_prepared, run_pipeline, shares_sources, source_key
+from reconflow.report.summary import RunSummary
+
+# File name patterns of product arrivals in a watched directory, by source type
+_PATTERNS = {"csv": "*.csv", "parquet": "*.parquet", "arrow": "*.arrow"}
+
+
+def _silent(message: str) -> None:
+    """Default progress callback."""
+
+
+def _version(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class Watcher:
+    """
+    Reconcile product files against a CBA side kept prepared in memory.
+
+    ``product.path`` may name a directory, in which each new file matching
+    ``pattern`` is reconciled in its own run, or a file, which is
+    reconciled again whenever it changes. The CBA file is loaded and
+    prepared once and again only when it changes; each product file is
+    prepared once per run. Files are picked up once they have not been
+    modified for ``settle_s`` seconds, so partly written drops are skipped
+    until complete.
+
+    Pipelines that cannot share prepared sources (out-of-core, incremental
+    or non-keyed strategies) still re-run on arrival, loading both sides.
+
+    Args:
+        config: Pipeline configuration
+        log: Callback receiving progress messages
+        pattern: Glob of product files in a watched directory (default: by
+            the product's type, e.g. ``*.csv``)
+        settle_s: Seconds a file must stay unmodified before it is read
+        backfill: Also reconcile the files already present at start
+    """
+
+    def __init__(
+        self,
+        config: ReconFlowConfig,
+        log: Callable[[str], None] = _silent,
+        pattern: str | None = None,
+        settle_s: float = 1.0,
+        backfill: bool = False,
+    ) -> None:
+        self.config = config
+        self.log = log
+        self.pattern = pattern or _PATTERNS[config.product.type]
+        self.settle_s = settle_s
+        self.pool = SourcePool()
+        self.runs = 0
+        self._warm = shares_sources(config)
+        self._cba_key: str | None = None
+        self._cba_version: tuple[int, int] | None = None
+        self._seen: dict[Path, tuple[int, int]] = {}
+        if not backfill:
+            self._seen = {path: _version(path) for path in self._product_files()}
+
+    @property
+    def watches_directory(self) -> bool:
+        """Whether product files arrive in a directory rather than as one file."""
+        return Path(self.config.product.path).is_dir()
+
+    def _product_files(self) -> list[Path]:
+        path = Path(self.config.product.path)
+        if path.is_dir():
+            files = [file for file in path.glob(self.pattern) if file.is_file()]
+        else:
+            files = [path] if path.exists() else []
+        return sorted(files, key=lambda file: (file.stat().st_mtime_ns, file.name))
+
+    def _settled(self, path: Path) -> bool:
+        return time.time() - path.stat().st_mtime >= self.settle_s
+
+    def refresh_cba(self) -> bool:
+        """
+        Prepare the CBA side again if its file changed.
+
+        Returns:
+            Whether the CBA file changed since it was last prepared
+        """
+        path = Path(self.config.cba.path)
+        if not path.exists():
+            return False
+        version = _version(path)
+        if version == self._cba_version or not self._settled(path):
+            return False
+
+        if self._warm:
+            digest = self.pool.digest(path)
+            key = source_key(self.config.cba, self.config, self.pool, digest)
+            if key != self._cba_key:
+                self.log(f"Preparing {path}...")
+                if self._cba_key is not None:
+                    self.pool.discard(self._cba_key)
+                    self._cba_key = None
+                load_prepared(self.config.cba, self.config, self.pool, self.log, digest)
+                self._cba_key = key
+
+        changed = self._cba_version is not None
+        self._cba_version = version
+        return changed
+
+    def poll_once(self) -> list[RunSummary]:
+        """
+        Reconcile the product files that arrived or changed since the last poll.
+
+        When the product is a single file, a change of the CBA file also
+        triggers a run; with a directory, it only re-prepares the CBA side
+        for the next arrivals.
+
+        Returns:
+            Summaries of the runs made, oldest file first
+        """
+        try:
+            cba_changed = self.refresh_cba()
+        except Exception as e:
+            self.log(f"Preparing {self.config.cba.path} failed: {e}")
+            return []
+        cba = Path(self.config.cba.path)
+        if not cba.exists() or _version(cba) != self._cba_version:
+            # CBA file missing or still being written
+            return []
+
+        arrivals = [
+            path
+            for path in self._product_files()
+            if self._seen.get(path) != _version(path) and self._settled(path)
+        ]
+        if cba_changed and not arrivals and not self.watches_directory:
+            arrivals = self._product_files()
+
+        summaries = []
+        for path in arrivals:
+            self._seen[path] = _version(path)
+            config = self.config.model_copy(deep=True)
+            config.product.path = str(path)
+            self.log(f"Reconciling {path}...")
+            try:
+                summary = run_pipeline(config, log=self.log, sources=self.pool)
+            except Exception as e:
+                self.log(f"Run failed for {path}: {e}")
+                continue
+            finally:
+                self._drop_product(config)
+            self.runs += 1
+            summaries.append(summary)
+        return summaries
+
+    def _drop_product(self, config: ReconFlowConfig) -> None:
+        """Free a reconciled product file's prepared frame; only the CBA side stays warm."""
+        if not self._warm or not os.path.exists(config.product.path):
+            return
+        digest = self.pool.digest(config.product.path)
+        key = source_key(config.product, config, self.pool, digest)
+        if key != self._cba_key:
+            self.pool.discard(key)
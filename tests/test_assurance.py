@@ -0,0 +1,135 @@
+"""Tests for assurance controls."""
+
+import pandas as pd
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from reconflow.assurance import ControlSet, Rule
+from reconflow.cli import app
+from reconflow.config import AssuranceControl
+
+
+def test_metric_rules():
+    """Test that metric rules are evaluated against run totals and metrics."""
+    metrics = {"pool_match_pct": 99.5, "missing_in_target": 2, "total_source": 400}
+
+    assert Rule("pool_match_pct >= 99 and missing_in_target <= 0.01 * total_source").evaluate(
+        metrics
+    )
+    assert not Rule("not (90 < pool_match_pct < 99)").evaluate({"pool_match_pct": 95})
+
+
+def test_column_rules_are_vectorized():
+    """Test that column rules give one outcome per record, missing values failing."""
+    frame = pd.DataFrame(
+        {
+            "_amt_diff": [0.5, 3.0, None, 1.0],
+            "status": pd.Series(["POSTED", "POSTED", "POSTED", "REVERSED"], dtype="str"),
+        }
+    )
+    rule = Rule("amount_mismatches._amt_diff < 2 and amount_mismatches.status in ('POSTED',)")
+
+    assert rule.bucket == "amount_mismatches"
+    assert rule.evaluate(frame).tolist() == [True, False, False, False]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "__import__('os').system('true')",
+        "matched.amount.__class__",
+        "matched['amount'] > 0",
+        "[x for x in matched.amount]",
+        "lambda: 1",
+        "unknown_metric > 1",
+        "pool_match_pct > 1 and matched._amt_diff < 1",
+        "matched.a > missing_in_target.b",
+        "pool_match_pct >",
+        "matched._amt_diff",
+        "missing_in_target / total_source",
+        "not matched.amount",
+    ],
+)
+def test_unsafe_or_invalid_rules_are_rejected(text):
+    """Test that rules outside the whitelist fail at compile time."""
+    with pytest.raises(ValueError):
+        Rule(text)
+
+
+def test_division_by_zero_fails_the_control():
+    """Test that dividing by a zero total gives NaN and fails the control instead of raising."""
+    controls = ControlSet(
+        [
+            AssuranceControl(id="R1", name="Rate", rule="missing_in_target / total_source < 0.05"),
+            AssuranceControl(
+                id="R2", name="Not rate", rule="missing_in_target % total_source != 1"
+            ),
+            AssuranceControl(id="R3", name="Share", rule="matched.fee / matched.amount < 0.1"),
+        ]
+    )
+
+    controls.observe({"matched": pd.DataFrame({"fee": [1.0, 1.0], "amount": [100.0, 0.0]})})
+    outcome = controls.finish({"missing_in_target": 0, "total_source": 0})
+
+    assert [c["passed"] for c in outcome["controls"]] == [False, False, False]
+    assert outcome["controls"][2]["failing_rows"] == 1
+
+
+def test_non_boolean_rule_names_the_control():
+    """Test that a rule that does not give a truth value is rejected with its control id."""
+    with pytest.raises(ValueError, match="Control D1"):
+        ControlSet([AssuranceControl(id="D1", name="Diff", rule="matched.amount_diff")])
+
+
+def test_rule_errors_on_records_name_the_control():
+    """Test that a rule failing on a bucket's column types is reported with its control."""
+    controls = ControlSet([AssuranceControl(id="T1", name="Status", rule="matched.status > 5")])
+    frame = pd.DataFrame({"status": pd.Series(["POSTED"], dtype="str")})
+
+    with pytest.raises(ValueError, match=r"Control T1: rule 'matched.status > 5' failed"):
+        controls.observe({"matched": frame})
+
+
+def test_control_set_counts_failing_rows_across_batches():
+    """Test that failing records accumulate over batches and severities are tallied."""
+    controls = ControlSet(
+        [
+            AssuranceControl(id="C1", name="Small diffs", rule="amount_mismatches._amt_diff < 5"),
+            AssuranceControl(
+                id="C2", name="Match rate", rule="pool_match_pct >= 99", severity="CRITICAL"
+            ),
+        ]
+    )
+
+    controls.observe({"amount_mismatches": pd.DataFrame({"_amt_diff": [1.0, 10.0]})})
+    controls.observe({"amount_mismatches": pd.DataFrame({"_amt_diff": [20.0]})})
+    outcome = controls.finish({"pool_match_pct": 50.0})
+
+    assert [c["failing_rows"] for c in outcome["controls"]] == [2, None]
+    assert outcome["failed"] == 2
+    assert outcome["critical_failed"] == 1
+
+
+def test_run_exits_non_zero_on_critical_failure(tmp_path):
+    """Test that a failed CRITICAL control is recorded and fails the run command."""
+    with open("examples/quickstart/reconflow.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    config["output"]["run_dir"] = str(tmp_path / "runs")
+    config["assurance"] = {
+        "controls": [
+            {"id": "A1", "name": "Diff", "rule": "amount_mismatches._amt_diff < 0.5"},
+            {"id": "A2", "name": "Rate", "rule": "pool_match_pct == 100", "severity": "CRITICAL"},
+        ]
+    }
+    path = tmp_path / "reconflow.yaml"
+    path.write_text(yaml.safe_dump(config), encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["run", str(path)])
+
+    assert result.exit_code == 2, result.output
+    assert "A1 Diff [HIGH]: 1 failing records" in result.output
+
+    config["assurance"]["controls"].pop()
+    path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    assert CliRunner().invoke(app, ["run", str(path)]).exit_code == 0
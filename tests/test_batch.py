@@ -0,0 +1,113 @@
+"""Tests for batch runs."""
+
+import datetime as dt
+import json
+import types
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+import reconflow.batch
+from reconflow.batch import run_batch
+from reconflow.cli import app
+from reconflow.config import load_config
+from reconflow.pipeline import run_pipeline
+
+
+def _write_config(tmp_path, name, **changes):
+    with open("examples/quickstart/reconflow.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    config["pipeline_name"] = name
+    config["output"]["run_dir"] = str(tmp_path / "runs")
+    for section, values in changes.items():
+        config[section].update(values)
+    path = tmp_path / f"{name}.yaml"
+    path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    return str(path)
+
+
+def test_batch_loads_shared_sources_once(tmp_path, monkeypatch):
+    """Test that pipelines reading the same files share one load and match like single runs."""
+    loads = []
+    load_prepared = reconflow.batch.load_prepared
+
+    def counting(source, *args, **kwargs):
+        loads.append(source.path)
+        return load_prepared(source, *args, **kwargs)
+
+    monkeypatch.setattr(reconflow.batch, "load_prepared", counting)
+    configs = [_write_config(tmp_path, name) for name in ("first", "second", "third")]
+
+    summary = run_batch(configs, workers=2, batch_dir=str(tmp_path / "batches"))
+
+    assert summary.failed == 0
+    assert sorted(loads) == sorted(
+        ["examples/quickstart/data/broken_product.csv", "examples/quickstart/data/broken_cba.csv"]
+    )
+    assert [source["pipelines"] for source in summary.sources] == [3, 3]
+
+    single = run_pipeline(load_config(configs[0]))
+    assert all(pipeline["totals"] == single.totals for pipeline in summary.pipelines)
+
+    written = json.loads((tmp_path / "batches" / f"{summary.batch_id}.json").read_text())
+    assert [pipeline["pipeline_name"] for pipeline in written["pipelines"]] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_batch_reports_failures_without_stopping(tmp_path):
+    """Test that a failing pipeline is recorded while the others complete."""
+    good = _write_config(tmp_path, "good")
+    broken = _write_config(tmp_path, "broken", cba={"path": str(tmp_path / "missing.csv")})
+
+    summary = run_batch(
+        [broken, str(tmp_path / "absent.yaml"), good],
+        workers=1,
+        memory_budget_mb=1,
+        batch_dir=str(tmp_path / "batches"),
+    )
+
+    statuses = {pipeline["config"]: pipeline["status"] for pipeline in summary.pipelines}
+    assert statuses == {broken: "failed", str(tmp_path / "absent.yaml"): "failed", good: "ok"}
+    assert summary.failed == 2
+
+
+def test_run_batch_command(tmp_path):
+    """Test that run-batch prints each pipeline and exits non-zero on failures."""
+    configs = [_write_config(tmp_path, name) for name in ("first", "second")]
+    batch_dir = str(tmp_path / "batches")
+
+    result = CliRunner().invoke(app, ["run-batch", *configs, "--batch-dir", batch_dir])
+
+    assert result.exit_code == 0, result.output
+    assert "first" in result.output and "second" in result.output
+    assert "2 loaded for 2 pipelines" in result.output
+
+    failing = CliRunner().invoke(
+        app, ["run-batch", *configs, str(tmp_path / "absent.yaml"), "--batch-dir", batch_dir]
+    )
+    assert failing.exit_code == 1
+
+
+def test_batches_in_the_same_second_get_distinct_ids(tmp_path, monkeypatch):
+    """Test that batch summaries never overwrite each other and duplicate configs are rejected."""
+
+    class Frozen(dt.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return dt.datetime(2026, 1, 2, 3, 4, 5, tzinfo=tz)
+
+    monkeypatch.setattr(reconflow.batch, "dt", types.SimpleNamespace(datetime=Frozen, UTC=dt.UTC))
+    batch_dir = str(tmp_path / "batches")
+
+    ids = [run_batch([], batch_dir=batch_dir).batch_id for _ in range(3)]
+
+    assert ids == ["20260102T030405Z", "20260102T030405Z-1", "20260102T030405Z-2"]
+    assert len(list((tmp_path / "batches").glob("*.json"))) == 3
+
+    config = _write_config(tmp_path, "twice")
+    with pytest.raises(ValueError, match="listed more than once"):
+        run_batch([config, str(tmp_path / "." / "twice.yaml")], batch_dir=batch_dir)
@@ -0,0 +1,101 @@
+"""Tests for synthetic data and benchmarks."""
+
+import json
+
+from typer.testing import CliRunner
+
+from reconflow.bench import DataMix, compare_to_baseline, generate_pair, run_benchmark
+from reconflow.cli import app
+from reconflow.io import coerce_amount
+from reconflow.matching import match_records
+
+
+def test_generated_pair_has_the_requested_breaks():
+    """Test that generated data reconciles into the configured mix of breaks."""
+    mix = DataMix(
+        embedded=0.2,
+        duplicates=0.0,
+        rounding_drift=0.1,
+        amount_drift=0.05,
+        missing_in_target=0.03,
+        missing_in_source=0.02,
+    )
+    product, cba = generate_pair(20_000, mix, seed=7)
+
+    assert len(product) == 20_000
+    assert product["reference"].str.contains("Payment completed trf|", regex=False).any()
+
+    product["amount"] = coerce_amount(product["amount"])
+    cba["amount"] = coerce_amount(cba["amount"])
+    result = match_records(product, cba)
+
+    assert len(result.missing_in_source) == 400
+    assert abs(len(result.missing_in_target) / 20_000 - 0.03) < 0.005
+    assert abs(len(result.amount_mismatches) / 20_000 - 0.05) < 0.01
+    assert len(result.matched) + len(result.amount_mismatches) + len(
+        result.missing_in_target
+    ) == len(product)
+
+
+def test_generation_is_reproducible():
+    """Test that equal seeds give equal data and duplicates repeat references."""
+    first, _ = generate_pair(1_000, DataMix(duplicates=0.1), seed=3)
+    second, _ = generate_pair(1_000, DataMix(duplicates=0.1), seed=3)
+
+    assert first.equals(second)
+    assert len(first) > 1_000
+    assert first["reference"].duplicated().sum() == len(first) - 1_000
+
+
+def test_compare_to_baseline_flags_slower_stages():
+    """Test that only stages slower by more than the threshold and noise floor regress."""
+    baseline = {"sizes": {"1000": [{"name": "match", "wall_s": 1.0}]}}
+    results = {
+        "sizes": {
+            "1000": [
+                {"name": "generate", "wall_s": 9.0},
+                {"name": "match", "wall_s": 1.5},
+            ],
+            "5000": [{"name": "match", "wall_s": 9.0}],
+        }
+    }
+
+    (regression,) = compare_to_baseline(results, baseline, threshold=0.2)
+    assert regression["stage"] == "match"
+    assert regression["change"] == 0.5
+    assert compare_to_baseline(results, baseline, threshold=0.6) == []
+
+
+def test_run_benchmark_times_each_stage(tmp_path):
+    """Test that each size records every stage with its throughput."""
+    results = run_benchmark([500, 1_000], workdir=tmp_path)
+
+    assert list(results["sizes"]) == ["500", "1000"]
+    names = [stage["name"] for stage in results["sizes"]["1000"]]
+    assert names == [
+        "generate",
+        "write_input",
+        "read_input",
+        "coerce_amount",
+        "match",
+        "write_artifacts",
+    ]
+    assert all(stage["rows"] > 1_000 for stage in results["sizes"]["1000"])
+
+
+def test_bench_command_fails_on_regression(tmp_path):
+    """Test that the bench command saves results and exits 1 on a regression."""
+    output = tmp_path / "bench.json"
+    args = ["bench", "--sizes", "500", "--output", str(output), "--workdir", str(tmp_path)]
+
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+
+    baseline = json.loads(output.read_text(encoding="utf-8"))
+    for stage in baseline["sizes"]["500"]:
+        stage["wall_s"] = stage["wall_s"] / 100 - 1
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline), encoding="utf-8")
+
+    result = CliRunner().invoke(app, [*args, "--baseline", str(tmp_path / "baseline.json")])
+    assert result.exit_code == 1, result.output
+    assert "match at 500 records" in result.output
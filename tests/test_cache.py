@@ -0,0 +1,132 @@
+"""Tests for the prepared-source cache."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reconflow import pipeline
+from reconflow.cache import PreparedCache, SourcePool
+from reconflow.config import load_config
+
+pytest.importorskip("pyarrow")
+
+
+def test_warm_run_skips_loading(tmp_path, monkeypatch):
+    """Test that a warm re-run reuses prepared sources and gives the same totals."""
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path / "runs")
+    config.cache.enabled = True
+    config.cache.dir = str(tmp_path / "cache")
+
+    cold = pipeline.run_pipeline(config)
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 2
+
+    def fail(source):
+        raise AssertionError(f"{source.path} was parsed on a warm run")
+
+    monkeypatch.setattr(pipeline, "load_source", fail)
+    config.matching.amount_tolerance_abs = 0.02
+    warm = pipeline.run_pipeline(config)
+
+    assert warm.totals == cold.totals
+
+
+def test_quality_counts_do_not_depend_on_the_cache(tmp_path):
+    """Test that unparseable amounts are reported as invalid with and without a cache."""
+    product = pd.read_csv("examples/quickstart/data/broken_product.csv", dtype=str)
+    product.loc[0, "amount"] = "not an amount"
+    product.loc[1, "amount"] = ""
+    product.to_csv(tmp_path / "product.csv", index=False)
+
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.product.path = str(tmp_path / "product.csv")
+    config.output.run_dir = str(tmp_path / "runs")
+    config.quality.enabled = True
+    config.quality.max_invalid_pct = 1
+    uncached = pipeline.run_pipeline(config).details["quality"]
+
+    config.cache.enabled = True
+    config.cache.dir = str(tmp_path / "cache")
+    cold = pipeline.run_pipeline(config).details["quality"]
+    warm = pipeline.run_pipeline(config).details["quality"]
+    pooled = pipeline.run_pipeline(config, sources=SourcePool()).details["quality"]
+
+    assert uncached["product"]["invalid"]["amount"] == 1
+    assert uncached["product"]["null"]["amount"] == 1
+    assert cold == warm == pooled == uncached
+
+
+def test_key_follows_content_and_settings(tmp_path):
+    """Test that the key changes with file contents and settings only."""
+    cache = PreparedCache(tmp_path / "cache")
+    path = tmp_path / "data.csv"
+    path.write_text("reference,amount\nA,1\n", encoding="utf-8")
+
+    key = cache.key(path, {"decimal_precision": 2})
+    assert cache.key(path, {"decimal_precision": 2}) == key
+    assert cache.key(path, {"decimal_precision": 3}) != key
+
+    path.write_text("reference,amount\nA,2\n", encoding="utf-8")
+    assert cache.key(path, {"decimal_precision": 2}) != key
+
+
+def test_pool_shares_cache_keys(tmp_path):
+    """Test that the in-memory pool keys entries like the on-disk cache."""
+    path = tmp_path / "data.csv"
+    path.write_text("reference,amount\nA,1\n", encoding="utf-8")
+    pool = SourcePool()
+
+    assert pool.key(path, {"decimal_precision": 2}) == PreparedCache(tmp_path).key(
+        path, {"decimal_precision": 2}
+    )
+    assert not isinstance(pool, PreparedCache)
+    assert pool.get("missing") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test that entries beyond the size limit are evicted oldest first."""
+    cache = PreparedCache(tmp_path, max_size_mb=1)
+    frame = pd.DataFrame({"amount": np.random.default_rng(0).random(50_000)})
+
+    cache.put("old", frame)
+    cache.put("used", frame)
+    os.utime(tmp_path / "old.parquet", (0, 0))
+    os.utime(tmp_path / "used.parquet", (1, 1))
+    assert cache.get("used") is not None
+
+    cache.put("new", frame)
+
+    assert cache.get("old") is None
+    assert cache.get("used") is not None
+    assert cache.get("new") is not None
+
+
+def test_entries_are_not_pickles(tmp_path):
+    """Test that entries are Parquet files keeping dtypes and attrs, and bad files miss."""
+    cache = PreparedCache(tmp_path)
+    frame = pd.DataFrame(
+        {"reference": pd.Series(["A", None], dtype="str"), "_std_minor": pd.array([1, None])}
+    )
+    frame.attrs["reconflow_unparsed"] = {"amount": 1}
+
+    cache.put("entry", frame)
+    pd.testing.assert_frame_equal(cache.get("entry"), frame)
+    assert cache.get("entry").attrs == frame.attrs
+
+    (tmp_path / "bad.parquet").write_bytes(pd.DataFrame({"a": [1]}).to_json().encode())
+    assert cache.get("bad") is None
+    assert not (tmp_path / "bad.parquet").exists()
+
+
+def test_pool_copies_are_independent():
+    """Test that changing a frame taken from the pool leaves the pooled frame intact."""
+    pool = SourcePool()
+    pool.put("entry", pd.DataFrame({"amount": [1.0, 2.0]}))
+
+    frame = pool.get("entry")
+    frame.loc[0, "amount"] = 99.0
+    frame["amount"] *= 2
+
+    assert pool.get("entry")["amount"].tolist() == [1.0, 2.0]
@@ -5,7 +5,7 @@ import tempfile
 import pytest
 from pydantic import ValidationError
 
-from reconflow.config import load_config
+from reconflow.config import CSVSource, ParquetSource, load_config
 
 
 def test_load_minimal_config():
@@ -69,3 +69,41 @@ def test_file_not_found():
     """Test that missing config file raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError):
         load_config("/nonexistent/path/config.yaml")
+
+
+def test_source_type_discriminator():
+    """Test that sources default to CSV and select a model by type."""
+    config_yaml = """
+product:
+  path: "product.csv"
+cba:
+  type: "parquet"
+  path: "cba.parquet"
+  date_from: "2026-01-01"
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(config_yaml)
+        f.flush()
+
+        config = load_config(f.name)
+
+        assert isinstance(config.product, CSVSource)
+        assert isinstance(config.cba, ParquetSource)
+        assert config.cba.date_from == "2026-01-01"
+
+
+def test_unknown_source_type():
+    """Test that an unknown source type is rejected."""
+    config_yaml = """
+product:
+  type: "xlsx"
+  path: "product.xlsx"
+cba:
+  path: "cba.csv"
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(config_yaml)
+        f.flush()
+
+        with pytest.raises(ValidationError):
+            load_config(f.name)
@@ -0,0 +1,113 @@
+"""Tests for incremental reconciliation."""
+
+import pandas as pd
+import pytest
+
+from reconflow.config import ReconFlowConfig
+from reconflow.incremental import IncrementalState
+from reconflow.pipeline import run_pipeline
+
+
+def _write(path, rows):
+    pd.DataFrame(rows, columns=["date", "reference", "amount"]).to_csv(path, index=False)
+
+
+def _config(tmp_path) -> ReconFlowConfig:
+    source = {"date_field": "date", "reference_field": "reference", "amount_field": "amount"}
+    return ReconFlowConfig.model_validate(
+        {
+            "pipeline_name": "rolling",
+            "product": {**source, "path": str(tmp_path / "product.csv")},
+            "cba": {**source, "path": str(tmp_path / "cba.csv")},
+            "matching": {"incremental": True},
+            "output": {"run_dir": str(tmp_path / "runs")},
+        }
+    )
+
+
+def test_incremental_carries_open_items_forward(tmp_path):
+    """Test that a run matches only new records plus the open items of the last run."""
+    config = _config(tmp_path)
+    day1 = [("2026-01-01", "A", "10.00"), ("2026-01-01", "B", "20.00")]
+    day2 = [("2026-01-02", "C", "30.00")]
+
+    _write(tmp_path / "product.csv", day1)
+    _write(tmp_path / "cba.csv", day1[:1])
+    first = run_pipeline(config)
+    assert first.totals["matched"] == 1
+    assert first.totals["missing_in_target"] == 1
+
+    # Rolling window: day 1 again, plus day 2 and the late CBA record for B
+    _write(tmp_path / "product.csv", day1 + day2)
+    _write(tmp_path / "cba.csv", day1 + day2)
+    second = run_pipeline(config)
+
+    assert second.details["incremental"] == {
+        "new_source": 1,
+        "carried_source": 1,
+        "new_target": 2,
+        "carried_target": 0,
+        "open_source": 0,
+        "open_target": 0,
+    }
+    assert second.totals["matched"] == 2
+    assert second.totals["missing_in_target"] == 0
+    assert second.totals["missing_in_source"] == 0
+
+    state = IncrementalState.for_pipeline(config.output.run_dir, config.pipeline_name)
+    assert state.open_items("source").empty
+    assert len(state.seen("source")) == 3
+
+
+def test_full_refresh_discards_state(tmp_path):
+    """Test that a full refresh reconciles every record again."""
+    config = _config(tmp_path)
+    rows = [("2026-01-01", "A", "10.00"), ("2026-01-01", "B", "20.00")]
+    _write(tmp_path / "product.csv", rows)
+    _write(tmp_path / "cba.csv", rows)
+
+    run_pipeline(config)
+    assert run_pipeline(config).totals["total_source"] == 0
+    assert run_pipeline(config, full_refresh=True).totals["matched"] == 2
+
+
+def test_delta_skips_seen_records(tmp_path):
+    """Test that records already reconciled are not selected again."""
+    state = IncrementalState(tmp_path / "state")
+    frame = pd.DataFrame({"reference": ["A", "B"], "amount": ["1", "2"]})
+
+    delta, new, carried = state.delta("source", frame)
+    assert (new, carried) == (2, 0)
+    state.save({"source": frame.iloc[[1]], "target": frame.iloc[[]]})
+
+    frame = pd.DataFrame({"reference": ["A", "B", "C"], "amount": ["1", "2", "3"]})
+    delta, new, carried = state.delta("source", frame)
+    assert (new, carried) == (1, 1)
+    assert delta["reference"].tolist() == ["B", "C"]
+    assert len(state.seen("source")) == 2
+
+
+def test_open_items_keep_dtypes_and_saves_are_atomic(tmp_path):
+    """Test that open items read back with their dtypes and a failed save changes nothing."""
+    state = IncrementalState(tmp_path / "state")
+    frame = pd.DataFrame(
+        {
+            "reference": pd.Series(["A", None], dtype="str"),
+            "amount": [1.5, 2.25],
+            "count": pd.Series([1, 2], dtype="int64"),
+        }
+    )
+    state.delta("source", frame)
+    state.save({"source": frame, "target": frame.iloc[:0]})
+
+    pd.testing.assert_frame_equal(state.open_items("source"), frame)
+
+    state.delta("source", frame.assign(count=[3, 4]))
+    with pytest.raises(KeyError):
+        state.save({"source": frame.iloc[:1]})
+
+    pd.testing.assert_frame_equal(state.open_items("source"), frame)
+    assert len(state.seen("source")) == 2
+    assert [path.name for path in (tmp_path / "state").iterdir() if path.is_dir()] == [
+        (tmp_path / "state" / "CURRENT").read_text()
+    ]
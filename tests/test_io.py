@@ -0,0 +1,113 @@
+"""Tests for input loading."""
+
+import pandas as pd
+import pytest
+
+from reconflow.config import CSVSource
+from reconflow.io import read_arrow, read_csv, read_csv_chunks, read_parquet
+
+CSV = """date,reference,amount,status,note
+2026-01-14,007,1000.50,POSTED,NA
+,TRF|ABC|1,2500,,second
+"""
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = tmp_path / "ledger.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return path
+
+
+def test_read_csv_projects_columns(ledger):
+    """Test that only the requested columns are loaded, in file order."""
+    df = read_csv(ledger, columns=["amount", "reference"])
+
+    assert list(df.columns) == ["reference", "amount"]
+    assert df["reference"].tolist() == ["007", "TRF|ABC|1"]
+
+
+def test_pyarrow_engine_matches_c_engine(ledger):
+    """Test that the pyarrow engine reads the same strings and missing values."""
+    pytest.importorskip("pyarrow")
+
+    for columns in (None, ["reference", "amount", "note"]):
+        expected = read_csv(ledger, columns=columns)
+        actual = read_csv(ledger, columns=columns, engine="pyarrow")
+        pd.testing.assert_frame_equal(actual.astype(object), expected.astype(object))
+
+
+def test_pyarrow_engine_missing_column(ledger):
+    """Test that projecting a missing column fails clearly."""
+    pytest.importorskip("pyarrow")
+
+    with pytest.raises(ValueError, match="missing_col"):
+        read_csv(ledger, columns=["missing_col"], engine="pyarrow")
+
+
+def test_read_csv_chunks_concatenate_to_full_read(ledger):
+    """Test that chunked reads add up to a single read."""
+    chunks = list(read_csv_chunks(ledger, chunksize=1, columns=["reference", "amount"]))
+
+    assert len(chunks) == 2
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), read_csv(ledger, columns=["reference", "amount"])
+    )
+
+
+def test_source_selected_columns():
+    """Test that projection keeps mapped fields plus payload columns."""
+    source = CSVSource(path="x.csv", reference_field="ref", columns=["status", "ref"])
+
+    assert source.selected_columns() == ["date", "ref", "amount", "status"]
+    assert CSVSource(path="x.csv").selected_columns() is None
+
+
+@pytest.fixture
+def ledger_table():
+    pa = pytest.importorskip("pyarrow")
+    import datetime as dt
+
+    return pa.table(
+        {
+            "date": [dt.date(2026, 1, day) for day in range(1, 11)],
+            "reference": [f"TRF|ABC|{day}" for day in range(1, 11)],
+            "amount": [day * 100.5 for day in range(1, 11)],
+            "status": ["POSTED"] * 10,
+        }
+    )
+
+
+def test_read_parquet_projection_and_date_filter(tmp_path, ledger_table):
+    """Test that date predicates are cast to the column type and pushed down."""
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "ledger.parquet"
+    pq.write_table(ledger_table, path, row_group_size=3)
+
+    df = read_parquet(
+        path,
+        columns=["amount", "reference"],
+        filters=[("date", ">=", "2026-01-04"), ("date", "<=", "2026-01-06")],
+    )
+
+    assert list(df.columns) == ["reference", "amount"]
+    assert df["reference"].tolist() == ["TRF|ABC|4", "TRF|ABC|5", "TRF|ABC|6"]
+
+
+def test_read_arrow_file_and_stream(tmp_path, ledger_table):
+    """Test reading Arrow IPC in both the file and the stream format."""
+    import pyarrow as pa
+
+    file_path = tmp_path / "ledger.arrow"
+    with pa.ipc.new_file(file_path, ledger_table.schema) as writer:
+        writer.write_table(ledger_table)
+
+    stream_path = tmp_path / "ledger.arrows"
+    with pa.ipc.new_stream(stream_path, ledger_table.schema) as writer:
+        writer.write_table(ledger_table)
+
+    for path in (file_path, stream_path):
+        df = read_arrow(path, columns=["reference", "amount"])
+        assert len(df) == 10
+        assert list(df.columns) == ["reference", "amount"]
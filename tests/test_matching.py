@@ -1,8 +1,17 @@
 """Tests for matching engine."""
 
+import time
+
+import numpy as np
 import pandas as pd
+import pytest
 
-from reconflow.matching import match_records
+from reconflow.io import coerce_amount, read_csv
+from reconflow.matching import match_out_of_core, match_records
+from reconflow.matching.fuzzy import edit_distance, match_fuzzy_references
+from reconflow.matching.hashing import partition_ids
+from reconflow.matching.subset_sum import find_subset, match_subset_sums
+from reconflow.report import RunArtifactWriter, write_run_artifacts
 
 
 def test_exact_match():
@@ -91,6 +100,17 @@ def test_amount_within_tolerance():
     assert len(result.amount_mismatches) == 0
 
 
+def test_tolerance_has_no_float_drift():
+    """Test that a difference of exactly the tolerance is matched."""
+    source = pd.DataFrame({"reference": ["REF001"], "amount": [1.10]})
+    target = pd.DataFrame({"reference": ["REF001"], "amount": [1.09]})
+
+    result = match_records(source, target, tolerance=0.01)
+
+    assert len(result.matched) == 1
+    assert result.matched["_amt_diff"].iloc[0] == 0.01
+
+
 def test_case_insensitive_reference():
     """Test that reference matching is case-insensitive."""
     source = pd.DataFrame(
@@ -111,6 +131,47 @@ def test_case_insensitive_reference():
     assert len(result.matched) == 1
 
 
+def test_repeated_references_pair_in_order():
+    """Test that repeated references pair one-to-one instead of cross-joining."""
+    source = pd.DataFrame(
+        {
+            "reference": ["REF001"] * 3 + ["REF002"] * 1000,
+            "amount": ["10.00", "20.00", "30.00"] + ["1.00"] * 1000,
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "reference": ["REF001"] * 2 + ["REF002"] * 1000,
+            "amount": ["10.00", "25.00"] + ["1.00"] * 1000,
+        }
+    )
+
+    result = match_records(source, target)
+
+    assert len(result.matched) == 1001
+    assert result.amount_mismatches["_amt_diff"].tolist() == [5.0]
+    assert result.missing_in_target["amount_source"].tolist() == ["30.00"]
+    assert len(result.missing_in_source) == 0
+    assert result.total_source == len(source)
+    assert result.stats["duplicate_source"] == 1001
+    assert result.stats["duplicate_target"] == 1000
+
+
+def test_empty_references_are_quarantined():
+    """Test that empty references never match each other."""
+    source = pd.DataFrame({"reference": ["", None, "REF001"], "amount": ["1.00", "1.00", "2.00"]})
+    target = pd.DataFrame({"reference": ["  ", "", "REF001"], "amount": ["1.00", "1.00", "2.00"]})
+
+    for strategy in ("exact_reference", "group_sum"):
+        result = match_records(source, target, strategy=strategy)
+
+        assert len(result.matched) == 1
+        assert len(result.missing_in_target) == 2
+        assert len(result.missing_in_source) == 2
+        assert result.stats["quarantined_source"] == 2
+        assert result.stats["quarantined_target"] == 2
+
+
 def test_pool_match_percentage():
     """Test pool match percentage calculation."""
     source = pd.DataFrame(
@@ -129,3 +190,418 @@ def test_pool_match_percentage():
     result = match_records(source, target)
 
     assert result.pool_match_pct == 50.0
+
+
+def _ledger_csvs(tmp_path, n=20_000):
+    """Write a product/CBA pair with matches, breaks, duplicates and blank refs."""
+    refs = [f"TRF|BANK|{i:06d}|NGN" for i in range(n)]
+    product = pd.DataFrame(
+        {
+            "reference": [ref.lower() if i % 3 == 0 else ref for i, ref in enumerate(refs)],
+            "amount": [f"{(i % 997) + 0.5:.3f}" for i in range(n)],
+            "description": [f"Payment {i}" for i in range(n)],
+        }
+    )
+    cba = pd.DataFrame(
+        {
+            "reference": refs[: n // 2] + [f"TRF|OTHER|{i:06d}" for i in range(n // 4)],
+            "amount": [f"{(i % 997) + (0.5 if i % 11 else 9):.2f}" for i in range(n * 3 // 4)],
+        }
+    )
+    product.loc[::500, "reference"] = None
+    cba.loc[::700, "reference"] = product.loc[1, "reference"]
+
+    product_path = tmp_path / "product.csv"
+    cba_path = tmp_path / "cba.csv"
+    product.to_csv(product_path, index=False)
+    cba.to_csv(cba_path, index=False)
+    return product_path, cba_path
+
+
+def _sorted_artifact(path):
+    frame = pd.read_csv(path, dtype=str)
+    return frame.sort_values(list(frame.columns)).reset_index(drop=True)
+
+
+def test_group_sum_matches_many_to_one():
+    """Test that several legs match one entry when their sum is within tolerance."""
+    source = pd.DataFrame(
+        {
+            "reference": ["BATCH1", "batch1", "BATCH1", "BATCH2", "BATCH2", "BATCH3"],
+            "amount": ["10.00", "20.00", "30.005", "5.00", "5.00", "7.00"],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "reference": ["BATCH1", "BATCH2", "BATCH4", "BATCH4"],
+            "amount": ["60.01", "11.00", "1.00", "2.00"],
+        }
+    )
+
+    result = match_records(source, target, strategy="group_sum")
+
+    assert len(result.matched) == 3
+    assert result.matched["_group_minor_source"].tolist() == [6001] * 3
+    assert result.matched["_group_size_target"].tolist() == [1] * 3
+    assert len(result.amount_mismatches) == 2
+    assert result.amount_mismatches["_amt_diff"].tolist() == [1.0, 1.0]
+    assert result.missing_in_target["reference_source"].tolist() == ["BATCH3"]
+    assert result.missing_in_source["reference_target"].tolist() == ["BATCH4", "BATCH4"]
+    assert result.total_source == len(source)
+
+
+def test_group_sum_reports_every_group_member(tmp_path):
+    """Test that every record of both sides is in a bucket, each source record once."""
+    source = pd.DataFrame(
+        {
+            "id": ["s0", "s1", "s2"],
+            "reference": ["G1", "G1", "G2"],
+            "amount": ["10.00", "20.00", "5.00"],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "id": [f"t{i}" for i in range(6)],
+            "reference": ["G1", "G2", "G1", "G3", "G1", "G2"],
+            "amount": ["10.00", "2.00", "10.00", "1.00", "10.00", "2.00"],
+        }
+    )
+
+    result = match_records(source, target, strategy="group_sum")
+    buckets = pd.concat(
+        [
+            result.matched,
+            result.missing_in_target,
+            result.missing_in_source,
+            result.amount_mismatches,
+        ]
+    )
+
+    assert sorted(buckets["id_source"].dropna()) == source["id"].tolist()
+    assert set(buckets["id_target"].dropna()) == set(target["id"])
+    assert result.matched["reference_target"].tolist() == ["G1"] * 4
+    assert result.amount_mismatches["_amt_diff"].tolist() == [1.0, 1.0]
+    assert result.total_source == len(source)
+
+    summary = write_run_artifacts(
+        run_dir=str(tmp_path),
+        pipeline_name="test",
+        matched=result.matched,
+        missing_in_target=result.missing_in_target,
+        missing_in_source=result.missing_in_source,
+        amount_mismatches=result.amount_mismatches,
+    )
+    assert summary.totals["total_source"] == len(source)
+    assert summary.totals["matched"] == 4
+
+
+def test_subset_sum_matches_bulk_settlements():
+    """Test that a bulk CBA entry is matched to the product records it settles."""
+    source = pd.DataFrame(
+        {
+            "date": ["2026-01-10", "2026-01-11", "2026-01-11", "2026-01-20", "2026-01-11"],
+            "reference": ["P1", "P2", "P3", "P4", "OK"],
+            "amount": ["100.00", "250.50", "49.50", "100.00", "5.00"],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "date": ["2026-01-11", "2026-01-11"],
+            "reference": ["BULK-1", "OK"],
+            "amount": ["400.00", "5.00"],
+        }
+    )
+
+    result = match_subset_sums(match_records(source, target), "date", "date")
+
+    assert sorted(result.subset_matched["reference_source"]) == ["P1", "P2", "P3"]
+    assert set(result.subset_matched["reference_target"]) == {"BULK-1"}
+    assert set(result.subset_matched["_subset_size"]) == {3}
+    assert result.missing_in_target["reference_source"].tolist() == ["P4"]
+    assert result.missing_in_source.empty
+    assert result.total_source == len(source)
+
+
+def test_subset_sum_respects_window_and_counterparty():
+    """Test that records outside the date window or counterparty are not used."""
+    source = pd.DataFrame(
+        {
+            "date": ["2026-01-01", "2026-01-10", "2026-01-10"],
+            "reference": ["P1", "P2", "P3"],
+            "amount": ["100.00", "300.00", "100.00"],
+            "bank": ["X", "X", "Y"],
+        }
+    )
+    target = pd.DataFrame(
+        {"date": ["2026-01-10"], "reference": ["BULK"], "amount": ["400.00"], "bank": ["X"]}
+    )
+
+    result = match_records(source, target)
+    assert match_subset_sums(result, "date", "date").subset_matched.empty is False
+    assert match_subset_sums(result, "date", "date", counterparty_col="bank").subset_matched.empty
+
+    result = match_records(source.iloc[:2], target)
+    assert match_subset_sums(result, "date", "date", date_window_days=2).subset_matched.empty
+
+
+def test_find_subset_prefers_smaller_subsets():
+    """Test the meet-in-the-middle search."""
+    values = np.array([5, 1, 7, 3, 2, 9, 4, 6])
+
+    assert sorted(values[find_subset(values, 16, 0, 3)]) == [7, 9]
+    subset = find_subset(values, 17, 0, 3)
+    assert len(subset) == 3 and values[subset].sum() == 17
+    assert find_subset(values, 17, 0, 2) is None
+    assert find_subset(values, 1000, 0, 4) is None
+
+
+def test_fuzzy_references_proposed_within_blocks():
+    """Test that near-identical references are proposed only for equal amount and date."""
+    source = pd.DataFrame(
+        {
+            "date": ["2026-01-10", "2026-01-10", "2026-01-10", "2026-01-10"],
+            "reference": ["TRF|BANK|123456", "TRF|BANK|777001", "XYZ", "ACC00000000001"],
+            "amount": ["100.00", "250.00", "10.00", "7.00"],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "date": ["2026-01-10", "2026-01-10", "2026-01-10", "2026-01-10"],
+            "reference": ["TRF|BANK|12345", "TRF|BANK|777002", "XYW", "ACC0000000001"],
+            "amount": ["100.00", "250.01", "10.00", "7.00"],
+        }
+    )
+    result = match_records(source, target)
+
+    fuzzy = match_fuzzy_references(result, "reference", "reference", "date", "date")
+
+    pairs = fuzzy.fuzzy_candidates[["_source_key", "_target_key", "_edit_distance"]]
+    assert sorted(pairs.itertuples(index=False, name=None)) == [
+        ("ACC00000000001", "ACC0000000001", 1),
+        ("TRF|BANK|123456", "TRF|BANK|12345", 1),
+    ]
+    assert len(fuzzy.missing_in_target) == len(result.missing_in_target)
+
+    loose = match_fuzzy_references(
+        result, "reference", "reference", "date", "date", min_similarity=0.3, q=2
+    )
+    assert sorted(loose.fuzzy_candidates["_source_key"]) == [
+        "ACC00000000001",
+        "TRF|BANK|123456",
+        "XYZ",
+    ]
+
+
+def test_edit_distance_matches_full_computation():
+    """Test the banded edit distance against a full dynamic program."""
+
+    def full(a, b):
+        row = list(range(len(b) + 1))
+        for i, char in enumerate(a, start=1):
+            prev, row[0] = row[0], i
+            for j in range(1, len(b) + 1):
+                prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (char != b[j - 1]))
+        return row[-1]
+
+    words = ["", "a", "abc", "abd", "acb", "kitten", "sitting", "TRF|1234", "TRF|12345", "xyz"]
+    for a in words:
+        for b in words:
+            for cap in range(4):
+                assert edit_distance(a, b, cap) == min(full(a, b), cap + 1)
+
+
+def test_date_amount_window_pairs_one_to_one():
+    """Test pairing on equal amounts within a date window, each record used once."""
+    source = pd.DataFrame(
+        {
+            "date": ["2026-01-10", "2026-01-10", "2026-01-10", "2026-01-12", "2026-01-20", None],
+            "reference": [None, None, "", "X", None, None],
+            "amount": ["50.00", "50.00", "50.00", "75.00", "75.00", "10.00"],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "date": ["2026-01-10", "2026-01-11", "2026-01-14", "2026-01-10"],
+            "reference": ["A", "B", "C", "D"],
+            "amount": ["50.00", "50.00", "75.00", "10.00"],
+        }
+    )
+
+    result = match_records(source, target, strategy="date_amount_window", date_window_days=2)
+
+    pairs = result.matched[["date_source", "date_target", "_std_amt_source"]]
+    assert sorted(pairs.itertuples(index=False, name=None)) == [
+        ("2026-01-10", "2026-01-10", 50.0),
+        ("2026-01-10", "2026-01-11", 50.0),
+        ("2026-01-12", "2026-01-14", 75.0),
+    ]
+    assert len(result.missing_in_target) == 3
+    assert result.missing_in_source["reference_target"].tolist() == ["D"]
+
+    same_day = match_records(source, target, strategy="date_amount_window")
+    assert len(same_day.matched) == 1
+
+
+def test_date_amount_window_pairs_as_many_records_as_possible():
+    """Test that a same-day pair does not block two pairs within the window."""
+    source = pd.DataFrame(
+        {"date": ["2026-01-01", "2026-01-02"], "reference": "", "amount": ["50.00"] * 2}
+    )
+    target = pd.DataFrame(
+        {"date": ["2026-01-02", "2026-01-03"], "reference": "", "amount": ["50.00"] * 2}
+    )
+
+    result = match_records(source, target, strategy="date_amount_window", date_window_days=1)
+
+    pairs = result.matched[["date_source", "date_target"]]
+    assert sorted(pairs.itertuples(index=False, name=None)) == [
+        ("2026-01-01", "2026-01-02"),
+        ("2026-01-02", "2026-01-03"),
+    ]
+    assert result.missing_in_target.empty and result.missing_in_source.empty
+
+
+def test_partition_ids_are_stable_across_frames():
+    """Test that equal keys hash to the same partition on both sides."""
+    left = partition_ids(pd.Series(["A", "B", "C", "A"]), 8)
+    right = partition_ids(pd.Series(["C", "A"], dtype=object), 8)
+
+    assert left[0] == left[3] == right[1]
+    assert left[2] == right[0]
+    assert ((left >= 0) & (left < 8)).all()
+
+
+def test_out_of_core_matches_in_memory(tmp_path):
+    """Test that partitioned matching produces the same records as in-memory matching."""
+    product_path, cba_path = _ledger_csvs(tmp_path)
+
+    product = read_csv(product_path)
+    cba = read_csv(cba_path)
+    product["amount"] = coerce_amount(product["amount"])
+    cba["amount"] = coerce_amount(cba["amount"])
+    result = match_records(product, cba)
+    expected = write_run_artifacts(
+        run_dir=str(tmp_path / "memory"),
+        pipeline_name="test",
+        matched=result.matched,
+        missing_in_target=result.missing_in_target,
+        missing_in_source=result.missing_in_source,
+        amount_mismatches=result.amount_mismatches,
+    )
+
+    writer = RunArtifactWriter(str(tmp_path / "ooc"), "test")
+    n_partitions = match_out_of_core(
+        str(product_path), str(cba_path), writer, memory_budget_mb=1, spill_dir=str(tmp_path)
+    )
+    actual = writer.close()
+
+    assert n_partitions > 1
+    assert actual.totals == expected.totals
+    for bucket in ("matched", "missing_in_target", "missing_in_source", "amount_mismatches"):
+        pd.testing.assert_frame_equal(
+            _sorted_artifact(actual.paths[bucket]), _sorted_artifact(expected.paths[bucket])
+        )
+
+
+@pytest.mark.parametrize("strategy", ["exact_reference", "group_sum"])
+def test_parallel_matches_serial(strategy):
+    """Test that matching across worker processes gives the serial result."""
+    refs = [f"TRF|BANK|{i % 150:04d}" for i in range(600)]
+    source = pd.DataFrame(
+        {
+            "reference": [ref.lower() if i % 2 else ref for i, ref in enumerate(refs)],
+            "amount": [f"{i % 40}.005" for i in range(600)],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "reference": refs[100:500] + ["", None],
+            "amount": [f"{i % 40}.01" for i in range(402)],
+        }
+    )
+    source.loc[::50, "reference"] = None
+
+    serial = match_records(source, target, strategy=strategy)
+    parallel = match_records(source, target, strategy=strategy, workers=2)
+
+    for bucket in ("matched", "missing_in_target", "missing_in_source", "amount_mismatches"):
+        pd.testing.assert_frame_equal(getattr(parallel, bucket), getattr(serial, bucket))
+
+
+@pytest.mark.parametrize("strategy", ["exact_reference", "group_sum"])
+def test_lazy_buckets_match_full_join(strategy, monkeypatch):
+    """Test that buckets built from row positions equal those of joining the full frames."""
+    from reconflow.matching.engine import get_strategy
+    from reconflow.matching.strategies import PairIndex
+
+    built = []
+    take = PairIndex.take
+    monkeypatch.setattr(
+        PairIndex, "take", lambda self, rows: built.append(rows) or take(self, rows)
+    )
+
+    matcher = get_strategy(strategy)
+    source = pd.DataFrame(
+        {
+            "reference": ["A", "A", "B", "C", None, "E"],
+            "amount": ["1.00", "1.00", "2.00", "3.50", "4.00", "5.00"],
+            "count": [1, 2, 3, 4, 5, 6],
+        }
+    )
+    target = pd.DataFrame(
+        {
+            "reference": ["a", "b", "c", "D", " "],
+            "amount": ["1.00", "2.00", "3.00", "9.00", "4.00"],
+            "count": [10, 20, 30, 40, 50],
+            "flag": [True, False, True, False, True],
+        }
+    )
+    src = matcher.prepare(source, "reference", "amount")
+    tgt = matcher.prepare(target, "reference", "amount")
+
+    result = matcher.match_prepared(src, tgt, "reference", "reference")
+    full = matcher.classify(matcher.join(src, tgt, "_norm_ref", "_norm_ref"))
+
+    assert result.total_source == full.total_source
+    assert result.pool_match_pct == full.pool_match_pct
+    assert built == []
+    for bucket in ("matched", "missing_in_target", "missing_in_source", "amount_mismatches"):
+        assert result.count(bucket) == len(getattr(full, bucket))
+        pd.testing.assert_frame_equal(getattr(result, bucket), getattr(full, bucket))
+    assert result.matched["count_target"].dtype == "float64"
+
+
+def test_replaced_buckets_keep_others_lazy(monkeypatch):
+    """Test that replacing residual buckets leaves the other buckets unbuilt."""
+    from reconflow.matching.strategies import PairIndex
+
+    built = []
+    frame = PairIndex.frame
+    monkeypatch.setattr(
+        PairIndex, "frame", lambda self, name: built.append(name) or frame(self, name)
+    )
+    source = pd.DataFrame({"reference": ["A", "B"], "amount": ["1.00", "2.00"]})
+    target = pd.DataFrame({"reference": ["A", "C"], "amount": ["1.00", "3.00"]})
+    result = match_records(source, target)
+
+    replaced = result.replace(missing_in_target=result.missing_in_target.iloc[:0])
+
+    assert built == ["missing_in_target"]
+    assert replaced.total_source == 1
+    assert replaced.pool_match_pct == 100.0
+    assert len(replaced.matched) == 1
+    with pytest.raises(ValueError, match="Unknown buckets"):
+        result.replace(matches=pd.DataFrame())
+
+
+def test_date_amount_window_scales_with_repeated_amounts():
+    """Test that many records with one amount pair in a single pass, not one per round."""
+    n = 20000
+    source = pd.DataFrame({"date": ["2026-01-10"] * n, "reference": "", "amount": ["50.00"] * n})
+    target = pd.DataFrame({"date": ["2026-01-11"] * n, "reference": "", "amount": ["50.00"] * n})
+
+    start = time.perf_counter()
+    result = match_records(source, target, strategy="date_amount_window", date_window_days=1)
+
+    assert time.perf_counter() - start < 5
+    assert len(result.matched) == n
@@ -1,6 +1,17 @@
 """Tests for normalization utilities."""
 
-from reconflow.normalize import normalize_reference, standardize_decimal
+from decimal import Decimal
+
+import pandas as pd
+
+from reconflow.normalize import (
+    normalize_reference,
+    normalize_reference_series,
+    standardize_decimal,
+    standardize_decimal_series,
+    to_minor_units,
+    tolerance_to_minor_units,
+)
 from reconflow.normalize.decimal import amounts_match
 
 
@@ -41,6 +52,63 @@ class TestDecimalStandardization:
         assert amounts_match(10.00, 10.01, tolerance=0.01) is True
         assert amounts_match(10.00, 10.02, tolerance=0.01) is False
 
+    def test_amounts_match_without_float_drift(self):
+        """Test that a difference of exactly the tolerance matches."""
+        assert amounts_match(1.10, 1.09, tolerance=0.01) is True
+
+
+class TestDecimalSeriesStandardization:
+    """Tests for columnar decimal standardization against the scalar function."""
+
+    FLOATS = [10.007, 10.004, 10.005, 1.005, -10.005, 2.5, 0.0, 1e-05, 123456.785, float("nan")]
+    STRINGS = [
+        "10.007",
+        " 100.994 ",
+        "10.005",
+        "-0.125",
+        "+3",
+        "1e3",
+        "1.2345E-2",
+        ".5",
+        "7.",
+        None,
+    ]
+
+    @staticmethod
+    def _as_list(series: pd.Series) -> list:
+        return [None if value is pd.NA else int(value) for value in series]
+
+    def test_minor_units_match_scalar(self):
+        """Test that minor units equal the scaled standardize_decimal result."""
+        for value in ["10.007", 10.005, 100, "-2.345"]:
+            expected = Decimal(str(standardize_decimal(value, 2))).scaleb(2)
+            assert to_minor_units(value, 2) == expected
+
+    def test_float_series_matches_scalar(self):
+        """Test float columns, including values on a rounding boundary."""
+        for precision in (0, 2, 3):
+            result = standardize_decimal_series(pd.Series(self.FLOATS), precision)
+            expected = [to_minor_units(value, precision) for value in self.FLOATS]
+            assert self._as_list(result) == expected
+
+    def test_string_series_matches_scalar(self):
+        """Test string columns, including signs, exponents and padding."""
+        for precision in (0, 2, 4):
+            result = standardize_decimal_series(pd.Series(self.STRINGS, dtype=object), precision)
+            expected = [to_minor_units(value, precision) for value in self.STRINGS]
+            assert self._as_list(result) == expected
+
+    def test_integer_series(self):
+        """Test integer columns scale directly."""
+        result = standardize_decimal_series(pd.Series([1, -2, 300]), 2)
+        assert self._as_list(result) == [100, -200, 30000]
+
+    def test_tolerance_to_minor_units(self):
+        """Test tolerance conversion floors to whole minor units."""
+        assert tolerance_to_minor_units(0.01, 2) == 1
+        assert tolerance_to_minor_units(0.015, 2) == 1
+        assert tolerance_to_minor_units(0.0, 2) == 0
+
 
 class TestReferenceNormalization:
     """Tests for reference normalization."""
@@ -73,3 +141,51 @@ class TestReferenceNormalization:
         """Test that extraction can be disabled."""
         result = normalize_reference("Payment: TRF|ABC|123", extract_trf=False)
         assert result == "PAYMENT: TRF|ABC|123"
+
+
+class TestReferenceSeriesNormalization:
+    """Tests for columnar reference normalization against the scalar function."""
+
+    REFS = [
+        "TRF|MONIEPOINT|123456|NGN",
+        "  trf|abc|123  ",
+        "Payment ref: TRF|ABC|123 confirmed",
+        "Payment completed TRF|abc|10006 via app",
+        "TRF | ABC | 123",
+        "tab\tand  double  spaces",
+        "line\nbreak",
+        "",
+        "   ",
+        None,
+        float("nan"),
+        12345,
+        "straße trf|x|1",
+        "non\u00a0breaking",
+    ]
+
+    def test_matches_scalar(self):
+        """Test that every row matches normalize_reference."""
+        result = normalize_reference_series(pd.Series(self.REFS, dtype=object))
+        assert result.tolist() == [normalize_reference(ref) for ref in self.REFS]
+
+    def test_matches_scalar_without_extraction(self):
+        """Test that extract_trf=False matches the scalar function."""
+        result = normalize_reference_series(pd.Series(self.REFS, dtype=object), extract_trf=False)
+        assert result.tolist() == [normalize_reference(ref, extract_trf=False) for ref in self.REFS]
+
+    def test_preserves_index(self):
+        """Test that the result is aligned with the input index."""
+        refs = pd.Series(["trf|a|1", "trf|b|2"], index=[10, 20])
+        result = normalize_reference_series(refs)
+        assert result.index.tolist() == [10, 20]
+        assert result.tolist() == ["TRF|A|1", "TRF|B|2"]
+
+    def test_empty_series(self):
+        """Test handling an empty series."""
+        assert normalize_reference_series(pd.Series([], dtype=str)).tolist() == []
+
+    def test_single_non_portable_reference(self):
+        """Test that one-row columns with non-ASCII or control characters match the scalar."""
+        for ref in ["é", "\x0b", "straße trf|x|1"]:
+            refs = pd.Series([ref], index=[7])
+            assert normalize_reference_series(refs).tolist() == [normalize_reference(ref)]
@@ -0,0 +1,77 @@
+"""Tests for the pricing engine."""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from reconflow.config import PricingConfig, PricingTier, load_config
+from reconflow.pipeline import run_pipeline
+from reconflow.pricing import expected_fees, fees_from_minor_units
+
+
+def test_percentage_fees_round_half_up_exactly():
+    """Test that percentage fees match Decimal arithmetic on the minor units."""
+    config = PricingConfig(strategy="percentage", rate=0.015)
+    rng = np.random.default_rng(7)
+    amounts = rng.integers(-(10**9), 10**9, 10_000)
+
+    fees = fees_from_minor_units(amounts, config)
+
+    expected = [
+        int((abs(Decimal(int(a))) * Decimal("0.015")).quantize(Decimal(1), ROUND_HALF_UP))
+        for a in amounts
+    ]
+    assert fees.tolist() == expected
+    assert fees_from_minor_units(np.array([1001, 100]), config).tolist() == [15, 2]
+
+
+def test_flat_fees_and_cap():
+    """Test flat fees, the cap and missing amounts."""
+    flat = PricingConfig(strategy="flat", flat_fee=2.5)
+    capped = PricingConfig(strategy="percentage", rate=0.1, cap=5)
+    amounts = pd.Series(["10.00", None, "100.00"])
+
+    assert expected_fees(amounts, flat).tolist() == [250, pd.NA, 250]
+    assert expected_fees(amounts, capped).tolist() == [100, pd.NA, 500]
+
+
+def test_tiered_fees_use_the_amounts_band():
+    """Test that each amount is priced by the band its bound falls in."""
+    config = PricingConfig(
+        strategy="tiered",
+        tiers=[
+            PricingTier(up_to=100, rate=0.02),
+            PricingTier(up_to=1000, rate=0.01, flat_fee=0.5),
+            PricingTier(rate=0.005, flat_fee=1),
+        ],
+        cap=20,
+    )
+    amounts = pd.Series(["50.00", "100.00", "100.01", "-1000.00", "2000.00", "9000.00"])
+
+    assert expected_fees(amounts, config).tolist() == [100, 200, 150, 1050, 1100, 2000]
+
+
+def test_tiers_must_be_ordered():
+    """Test that tiers are validated."""
+    with pytest.raises(ValidationError):
+        PricingConfig(strategy="tiered")
+    with pytest.raises(ValidationError):
+        PricingConfig(strategy="tiered", tiers=[{"up_to": 10}, {"up_to": 5}])
+    with pytest.raises(ValidationError):
+        PricingConfig(strategy="tiered", tiers=[{"rate": 0.1}, {"up_to": 5}])
+
+
+def test_run_adds_expected_fees(tmp_path):
+    """Test that the pipeline stage adds expected fees to product records."""
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path)
+    config.pricing = PricingConfig(enabled=True, strategy="flat", flat_fee=1)
+
+    summary = run_pipeline(config)
+    matched = pd.read_csv(summary.paths["matched"])
+
+    assert (matched["_expected_fee"] == 1.0).all()
+    assert summary.details["pricing"]["priced"] == summary.totals["total_source"]
@@ -0,0 +1,66 @@
+"""Tests for run profiling."""
+
+import pstats
+import time
+
+import yaml
+from typer.testing import CliRunner
+
+from reconflow.cli import app
+from reconflow.config import load_config
+from reconflow.pipeline import run_pipeline
+from reconflow.profiling import StageTimer
+
+
+def test_stage_timer_records_time_rows_and_memory():
+    """Test that each stage records wall time, CPU time, rows and throughput."""
+    timer = StageTimer()
+
+    with timer.stage("sleep", rows=10):
+        time.sleep(0.02)
+    with timer.stage("count") as stage:
+        stage.rows = sum(range(100_000))
+
+    sleep, count = timer.to_list()
+    assert sleep["name"] == "sleep"
+    assert sleep["wall_s"] >= 0.02
+    assert sleep["cpu_s"] < sleep["wall_s"]
+    assert 0 < sleep["rows_per_s"] <= 500
+    assert count["rows"] == sum(range(100_000))
+
+
+def test_run_summary_lists_stages(tmp_path):
+    """Test that runs record their stages in order in summary.json."""
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path)
+    config.quality.enabled = True
+
+    summary = run_pipeline(config)
+
+    names = [stage["name"] for stage in summary.stages]
+    assert names == [
+        "load_product",
+        "quality_product",
+        "load_cba",
+        "quality_cba",
+        "coerce_amount",
+        "normalize",
+        "match",
+        "write",
+    ]
+    assert summary.stages[0]["rows"] == 5
+
+
+def test_profile_flag_writes_pstats(tmp_path):
+    """Test that --profile dumps a readable cProfile file next to the artifacts."""
+    with open("examples/quickstart/reconflow.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    config["output"]["run_dir"] = str(tmp_path / "runs")
+    path = tmp_path / "reconflow.yaml"
+    path.write_text(yaml.safe_dump(config), encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["run", str(path), "--profile"])
+    assert result.exit_code == 0, result.output
+
+    (profile,) = (tmp_path / "runs").rglob("profile.pstats")
+    assert pstats.Stats(str(profile)).total_calls > 0
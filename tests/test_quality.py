@@ -0,0 +1,82 @@
+"""Tests for the data quality stage."""
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from reconflow.config import CSVSource, QualityConfig, load_config
+from reconflow.pipeline import run_pipeline
+from reconflow.quality import QualityCheck, QualityError
+
+SOURCE = CSVSource(path="product.csv", reference_field="ref", amount_field="amt")
+
+
+def test_counts_nulls_invalid_values_and_duplicates():
+    """Test that one pass counts missing, unparseable and repeated values."""
+    frame = pd.DataFrame(
+        {
+            "date": ["2026-01-01", "not a date", "2026-01-03", None],
+            "ref": ["A1", "a1", " ", "B2"],
+            "amt": ["1.00", "x", "", "4.00"],
+        }
+    )
+    check = QualityCheck("product", SOURCE, QualityConfig(max_invalid_pct=1, max_duplicate_pct=1))
+
+    check.update(frame)
+    report = check.finish()
+
+    assert report["rows"] == 4
+    assert report["null"] == {"date": 1, "ref": 1, "amt": 1}
+    assert report["invalid"] == {"date": 1, "ref": 0, "amt": 1}
+    assert report["duplicates"] == 1
+
+
+def test_streamed_source_fails_at_first_bad_chunk():
+    """Test that thresholds are checked cumulatively after every chunk."""
+    check = QualityCheck("product", SOURCE, QualityConfig(max_duplicate_pct=0.25))
+    chunk = pd.DataFrame({"date": ["2026-01-01"] * 2, "ref": ["A", "B"], "amt": ["1", "2"]})
+
+    check.update(chunk)
+    check.update(chunk.assign(ref=["C", "D"]))
+    with pytest.raises(QualityError, match="duplicate references"):
+        check.update(chunk)
+
+
+def test_missing_columns_and_record_count():
+    """Test that missing required columns and too few records fail."""
+    frame = pd.DataFrame({"ref": ["A"], "amt": ["1"]})
+
+    with pytest.raises(QualityError, match="missing required column 'date'"):
+        QualityCheck("product", SOURCE, QualityConfig()).update(frame)
+
+    check = QualityCheck("product", SOURCE, QualityConfig(required_fields=[], min_record_count=2))
+    check.update(frame)
+    with pytest.raises(QualityError, match="1 records"):
+        check.finish()
+
+
+@pytest.mark.parametrize("memory_budget_mb", [None, 64])
+def test_run_records_quality_and_stops_on_bad_feeds(tmp_path, memory_budget_mb):
+    """Test that runs record the checks and fail before matching a bad feed."""
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path / "runs")
+    config.matching.memory_budget_mb = memory_budget_mb
+    config.quality.enabled = True
+
+    summary = run_pipeline(config)
+    assert summary.details["quality"]["product"]["rows"] == summary.totals["total_source"]
+
+    config.quality.required_fields = ["date", "reference", "amount", "settlement_id"]
+    with pytest.raises(QualityError, match="product failed quality checks"):
+        run_pipeline(config)
+
+
+def test_quality_checks_are_opt_in(tmp_path):
+    """Test that runs skip the checks unless enabled and thresholds are fractions."""
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path / "runs")
+    config.quality.required_fields = ["settlement_id"]
+
+    assert "quality" not in run_pipeline(config).details
+    with pytest.raises(ValidationError, match="0.05 = 5%"):
+        QualityConfig(max_duplicate_pct=5)
@@ -1,8 +1,11 @@
 """Integration tests using quickstart example."""
 
+import pytest
+
 from reconflow.config import load_config
 from reconflow.io import coerce_amount, read_csv
 from reconflow.matching import match_records
+from reconflow.pipeline import run_pipeline
 
 
 def test_quickstart_config_loads():
@@ -47,3 +50,44 @@ def test_quickstart_matching():
 
     assert len(result.matched) >= 0
     assert result.total_source > 0
+
+
+def test_quickstart_parquet_and_arrow_sources(tmp_path):
+    """Test that every source type produces the same run totals."""
+    pytest.importorskip("pyarrow")
+
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path / "runs")
+    expected = run_pipeline(config).totals
+
+    product = read_csv(config.product.path)
+    cba = read_csv(config.cba.path)
+    product.to_parquet(tmp_path / "product.parquet")
+    cba.to_feather(tmp_path / "cba.arrow")
+
+    data = config.model_dump()
+    data["product"] = {"type": "parquet", "path": str(tmp_path / "product.parquet")}
+    data["cba"] = {"type": "arrow", "path": str(tmp_path / "cba.arrow")}
+    config = type(config).model_validate(data)
+
+    assert run_pipeline(config).totals == expected
+
+
+def test_quickstart_artifacts_are_the_result_buckets(tmp_path):
+    """Test that a run without subset-sum or fuzzy stages writes and totals only the buckets."""
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path / "runs")
+
+    summary = run_pipeline(config)
+
+    buckets = ["matched", "missing_in_target", "missing_in_source", "amount_mismatches"]
+    assert list(summary.paths) == ["dir", *buckets]
+    assert list(summary.totals) == [*buckets, "total_source"]
+    written = sorted(path.name for path in (tmp_path / "runs" / "quickstart").glob("*/*.csv"))
+    assert written == sorted(f"{bucket}.csv" for bucket in buckets)
+
+    config.matching.subset_sum.enabled = True
+    summary = run_pipeline(config)
+
+    assert "subset_matched" in summary.paths
+    assert "fuzzy_candidates" not in summary.totals
@@ -0,0 +1,296 @@
+"""Tests for run artifacts."""
+
+import datetime as dt
+import json
+import sys
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from reconflow.cli import app
+from reconflow.report import RunArtifactWriter, RunCatalog, read_artifact, write_run_artifacts
+from reconflow.report.index import INDEX_DIR, STRIDE, hash_references, read_page
+
+BUCKETS = ("matched", "missing_in_target", "missing_in_source", "amount_mismatches")
+
+
+def _results() -> dict[str, pd.DataFrame]:
+    return {
+        "matched": pd.DataFrame({"reference": ["A", "B"], "_std_amt": [1.5, 2.25]}),
+        "missing_in_target": pd.DataFrame({"reference": ["C"], "_std_amt": [3.0]}),
+        "missing_in_source": pd.DataFrame({"reference": ["D", "E", "F"], "_std_amt": [4.0] * 3}),
+        "amount_mismatches": pd.DataFrame({"reference": pd.Series([], dtype=str)}),
+    }
+
+
+@pytest.mark.parametrize("format", ["csv", "json", "parquet"])
+def test_artifacts_round_trip(tmp_path, format):
+    """Test that every format reads back with the recorded row counts."""
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+
+    results = _results()
+    summary = write_run_artifacts(str(tmp_path), "test", **results, format=format)
+
+    assert summary.format == format
+    assert summary.totals["total_source"] == 3
+    for bucket in BUCKETS:
+        assert summary.paths[bucket].endswith(
+            {"csv": ".csv", "json": ".jsonl"}.get(format, ".parquet")
+        )
+        assert summary.files[bucket]["rows"] == len(results[bucket])
+        assert summary.files[bucket]["bytes"] > 0 or format == "json"
+
+        frame = read_artifact(summary.paths[bucket])
+        assert len(frame) == len(results[bucket])
+        if len(frame):
+            assert list(frame["reference"]) == list(results[bucket]["reference"])
+
+
+def test_parquet_writer_appends_batches(tmp_path):
+    """Test that appended batches land in one Parquet file, cast to the first schema."""
+    pytest.importorskip("pyarrow")
+
+    writer = RunArtifactWriter(str(tmp_path), "test", format="parquet", compression="zstd")
+    writer.append("matched", pd.DataFrame({"reference": pd.Series([], dtype=str)}))
+    writer.append("matched", pd.DataFrame({"reference": ["A"], "amount": [1.0]}))
+    writer.append("matched", pd.DataFrame({"reference": [None], "amount": [2]}))
+    summary = writer.close()
+
+    frame = read_artifact(summary.paths["matched"])
+    assert summary.totals["matched"] == 2
+    assert frame["amount"].tolist() == [1.0, 2.0]
+    assert frame["reference"].isna().tolist() == [False, True]
+
+
+def test_explain_reads_parquet_and_older_summaries(tmp_path):
+    """Test that explain handles Parquet runs and summaries without file stats."""
+    pytest.importorskip("pyarrow")
+
+    summary = write_run_artifacts(str(tmp_path), "test", **_results(), format="parquet")
+    args = ["explain", "--pipeline-name", "test", "--run-dir", str(tmp_path)]
+
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "matched.parquet" in result.output
+
+    summary_path = tmp_path / "test" / summary.run_id / "summary.json"
+    data = json.loads(summary_path.read_text(encoding="utf-8"))
+    del data["format"], data["files"]
+    summary_path.write_text(json.dumps(data), encoding="utf-8")
+    RunCatalog(tmp_path).rebuild()
+
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+
+
+def _summary(run_id: str, executed_at: str, missing: int, match_pct: float) -> dict:
+    return {
+        "run_id": run_id,
+        "pipeline_name": "daily",
+        "executed_at": executed_at,
+        "totals": {"total_source": 100, "matched": 100 - missing, "missing_in_target": missing},
+        "metrics": {"pool_match_pct": match_pct},
+        "paths": {"dir": f"runs/daily/{run_id}"},
+        "details": {"inputs": {"product": {"blake2b": f"hash-{run_id}"}}},
+        "stages": [{"name": "match", "rows": 200, "wall_s": 0.5}],
+    }
+
+
+def test_catalog_records_runs_and_backfills(tmp_path):
+    """Test that written runs are cataloged and a rebuilt catalog indexes existing runs."""
+    summary = write_run_artifacts(str(tmp_path), "test", **_results())
+    catalog = RunCatalog(tmp_path)
+
+    assert catalog.get("test")["run_id"] == summary.run_id
+    assert catalog.get("test", summary.run_id)["totals"] == summary.totals
+    assert catalog.get("test", "missing") is None
+
+    catalog.path.unlink()
+    assert catalog.rebuild() == 1
+    (run,) = catalog.query("test")
+    assert run["missing_in_source"] == 3
+
+
+def test_explain_shows_records_from_another_directory(tmp_path, monkeypatch):
+    """Test that --show finds artifacts of a relative run directory from any cwd."""
+    (tmp_path / "launch").mkdir()
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "launch")
+    write_run_artifacts("runs", "test", **_results())
+    monkeypatch.chdir(tmp_path / "elsewhere")
+
+    run_dir = str(tmp_path / "launch" / "runs")
+    args = ["explain", "--pipeline-name", "test", "--run-dir", run_dir]
+    result = CliRunner().invoke(app, [*args, "--show", "missing_in_source"])
+
+    assert result.exit_code == 0, result.output
+    assert "Records 1-3 of 3" in result.output
+
+
+def test_runs_without_a_catalog_are_read_from_summaries(tmp_path):
+    """Test that runs written before the catalog existed can be explained and listed."""
+    summary = write_run_artifacts(str(tmp_path), "test", **_results())
+    (tmp_path / "catalog.sqlite").unlink()
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app, ["explain", "--latest", "--pipeline-name", "test", "--run-dir", str(tmp_path)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "What happened?" in result.output
+
+    result = runner.invoke(app, ["runs", "list", "--run-dir", str(tmp_path)])
+    assert "Runs (1)" in result.output
+    assert RunCatalog(tmp_path).get("test")["run_id"] == summary.run_id
+    assert not (tmp_path / "catalog.sqlite").exists()
+
+
+def test_catalog_reads_do_not_create_it(tmp_path):
+    """Test that querying a run directory without a catalog creates nothing."""
+    run_dir = tmp_path / "runs"
+
+    assert RunCatalog(run_dir).get("test") is None
+    assert RunCatalog(run_dir).query() == []
+    result = CliRunner().invoke(app, ["explain", "--latest", "--run-dir", str(run_dir)])
+
+    assert result.exit_code == 1
+    assert "No runs found" in result.output
+    assert "reconflow runs rebuild" in result.output
+    assert not run_dir.exists()
+
+
+def test_catalog_queries_and_trends(tmp_path):
+    """Test filtering and ordering runs by totals and aggregating a metric per day."""
+    catalog = RunCatalog(tmp_path)
+    now = dt.datetime.now(dt.UTC)
+    for day, missing in enumerate([2, 40, 5]):
+        executed_at = (now - dt.timedelta(days=3 - day)).isoformat()
+        catalog.record(_summary(f"run{day}", executed_at, missing, 100.0 - missing))
+    catalog.record(_summary("old", (now - dt.timedelta(days=200)).isoformat(), 90, 10.0))
+
+    since = (now - dt.timedelta(days=30)).date().isoformat()
+    (spike,) = catalog.query("daily", where=["missing_in_target > 10"], since=since)
+    assert spike["run_id"] == "run1"
+    top = catalog.query(order_by="missing_in_target", limit=2)
+    assert [run["run_id"] for run in top] == ["old", "run1"]
+    assert [run["run_id"] for run in catalog.query(input_hash="hash-run2")] == ["run2"]
+
+    trend = catalog.trend("daily", "pool_match_pct", days=90)
+    assert [row["avg"] for row in trend] == [98.0, 60.0, 95.0]
+    assert catalog.trend("daily", "wall_s", stage="match", period="month")[0]["max"] == 0.5
+
+    with pytest.raises(ValueError):
+        catalog.query(where=["summary = 1"])
+    with pytest.raises(ValueError):
+        catalog.trend("daily", "total_source; DROP TABLE runs")
+
+
+def test_runs_commands(tmp_path):
+    """Test that runs list, query and trend answer from the catalog."""
+    write_run_artifacts(str(tmp_path), "test", **_results())
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["runs", "list", "--run-dir", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "Runs (1)" in result.output
+
+    args = ["runs", "query", "--run-dir", str(tmp_path), "--where", "missing_in_source >= 3"]
+    result = runner.invoke(app, [*args, "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)[0]["matched"] == 2
+
+    result = runner.invoke(
+        app, ["runs", "trend", "--pipeline-name", "test", "--run-dir", str(tmp_path)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "66.67" in result.output
+
+
+def test_runs_trend_shows_missing_aggregates_as_dash(tmp_path):
+    """Test that a metric never recorded for a period is printed as '-' rather than failing."""
+    RunCatalog(tmp_path).record(_summary("run1", dt.datetime.now(dt.UTC).isoformat(), 1, 99.0))
+
+    result = CliRunner().invoke(
+        app,
+        ["runs", "trend", "--pipeline-name", "daily", "--run-dir", str(tmp_path)]
+        + ["--stage", "match", "--metric", "cpu_s"],
+    )
+
+    assert result.exit_code == 0, result.output
+    cells = [cell.strip() for cell in result.output.splitlines()[-2].split("│")]
+    assert cells[3:6] == ["-", "-", "-"]
+
+
+def test_reference_hashes_are_stable():
+    """Test that reference hashes are fixed values, so old indexes stay readable."""
+    values = pd.Series(["TRF|ABC|1", None, "", "é"], dtype="str")
+
+    assert hash_references(values).tolist() == [15786518344223718756, 0, 0, 162833274059368006]
+
+
+@pytest.mark.parametrize("pyarrow", [True, False])
+def test_missing_references_hash_as_empty(pyarrow, monkeypatch):
+    """Test that missing references hash to 0 with and without pyarrow, never as 'nan'."""
+    if not pyarrow:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+    values = pd.Series([None, float("nan"), "", "TRF|ABC|1"], dtype=object)
+
+    hashes = hash_references(values).tolist()
+
+    assert hashes == [0, 0, 0, 15786518344223718756]
+    assert hash_references(pd.Series([float("nan")])).tolist() == [0]
+
+
+@pytest.mark.parametrize("format", ["csv", "json", "parquet"])
+def test_read_page_seeks_with_indexes(tmp_path, format):
+    """Test that pages and reference lookups across index blocks match a full read."""
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+
+    n = 2 * STRIDE + 10
+    refs = pd.Series([f"TRF|B|{i % (n - 3)}" for i in range(n)], dtype="str")
+    frame = pd.DataFrame({"reference": refs.str.lower(), "_norm_ref": refs, "row": range(n)})
+    writer = RunArtifactWriter(str(tmp_path), "test", format=format)
+    writer.append("matched", frame.iloc[:70_001])
+    writer.append("matched", frame.iloc[70_001:])
+    summary = writer.close()
+    path = summary.paths["matched"]
+
+    page, total = read_page(path, page=1_311, page_size=100)
+    assert total == n
+    assert page["row"].astype(int).tolist() == list(range(131_000, 131_082))
+
+    found, total = read_page(path, ref="trf|b|2")
+    assert total == 2
+    assert found["row"].astype(int).tolist() == [2, n - 1]
+    assert read_page(path, ref="TRF|B|none")[1] == 0
+
+
+def test_read_page_without_indexes(tmp_path):
+    """Test that artifacts written without indexes are still paged and filtered."""
+    summary = write_run_artifacts(str(tmp_path), "test", **_results(), index=False)
+    path = summary.paths["missing_in_source"]
+
+    assert not (tmp_path / "test" / summary.run_id / INDEX_DIR).exists()
+    page, total = read_page(path, page=2, page_size=2)
+    assert (page["reference"].tolist(), total) == (["F"], 3)
+    assert read_page(path, ref="e")[0]["reference"].tolist() == ["E"]
+
+
+def test_explain_shows_a_page_of_records(tmp_path):
+    """Test that explain --show prints one page of a bucket, filtered by reference."""
+    write_run_artifacts(str(tmp_path), "test", **_results())
+    args = ["explain", "--pipeline-name", "test", "--run-dir", str(tmp_path)]
+
+    result = CliRunner().invoke(app, [*args, "--show", "missing_in_source", "--page-size", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Records 1-2 of 3 (page 1 of 2)" in result.output
+
+    result = CliRunner().invoke(app, [*args, "--show", "matched", "--filter", "ref=b"])
+    assert result.exit_code == 0, result.output
+    assert "Records 1-1 of 1" in result.output
+
+    result = CliRunner().invoke(app, [*args, "--show", "unknown"])
+    assert result.exit_code == 1
@@ -0,0 +1,80 @@
+"""Tests for CLI cold-start time."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from reconflow.config import load_config
+from reconflow.pipeline import run_pipeline
+
+# Wall-clock budget with headroom for slow CI machines; the module check is exact
+STARTUP_BUDGET_S = 1.0
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from reconflow.cli import app
+code = None
+try:
+    app(sys.argv[1:])
+except SystemExit as e:
+    code = e.code
+print(json.dumps({
+    "code": code,
+    "seconds": time.perf_counter() - start,
+    "heavy": [m for m in ("pandas", "numpy", "pyarrow", "pydantic") if m in sys.modules],
+}))
+"""
+
+
+def _cold_start(*args: str) -> dict:
+    process = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    config = load_config("examples/quickstart/reconflow.yaml")
+    config.output.run_dir = str(tmp_path)
+    run_pipeline(config)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--help"],
+        ["version"],
+        ["explain", "--run-dir", "{run_dir}"],
+    ],
+)
+def test_light_commands_start_without_heavy_imports(args, run_dir):
+    """Test that --help, version and explain skip pandas and start within budget."""
+    outcome = _cold_start(*(arg.format(run_dir=run_dir) for arg in args))
+
+    assert outcome["code"] in (0, None)
+    assert outcome["heavy"] == []
+    assert outcome["seconds"] < STARTUP_BUDGET_S
+
+
+def test_package_imports_are_lazy():
+    """Test that importing a package does not import its submodules' dependencies."""
+    outcome = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, reconflow.io, reconflow.matching, reconflow.report; "
+            "print('pandas' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert outcome.stdout.strip() == "False"
@@ -0,0 +1,92 @@
+"""Tests for watch mode."""
+
+import shutil
+
+import yaml
+from typer.testing import CliRunner
+
+import reconflow.pipeline
+from reconflow.cli import app
+from reconflow.config import load_config
+from reconflow.watch import Watcher
+
+PRODUCT = "examples/quickstart/data/broken_product.csv"
+CBA = "examples/quickstart/data/broken_cba.csv"
+
+
+def _config(tmp_path, product):
+    cba = tmp_path / "cba.csv"
+    shutil.copy(CBA, cba)
+    with open("examples/quickstart/reconflow.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    config["product"]["path"] = str(product)
+    config["cba"]["path"] = str(cba)
+    config["output"]["run_dir"] = str(tmp_path / "runs")
+    path = tmp_path / "reconflow.yaml"
+    path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    return str(path)
+
+
+def test_watch_reconciles_arrivals_against_warm_cba(tmp_path, monkeypatch):
+    """Test that each new product file gets a run and the CBA side is prepared once per version."""
+    loads = []
+    load_source = reconflow.pipeline.load_source
+
+    def counting(source):
+        loads.append(source.path)
+        return load_source(source)
+
+    monkeypatch.setattr(reconflow.pipeline, "load_source", counting)
+    drops = tmp_path / "drops"
+    drops.mkdir()
+    shutil.copy(PRODUCT, drops / "old.csv")
+    config = load_config(_config(tmp_path, drops))
+    watcher = Watcher(config, settle_s=0)
+
+    assert watcher.poll_once() == []
+    shutil.copy(PRODUCT, drops / "first.csv")
+    shutil.copy(PRODUCT, drops / "second.csv")
+    summaries = watcher.poll_once()
+
+    assert [s.details["inputs"]["product"]["path"] for s in summaries] == [
+        str(drops / "first.csv"),
+        str(drops / "second.csv"),
+    ]
+    assert len({s.run_id for s in summaries}) == 2
+    assert loads == [config.cba.path, str(drops / "first.csv"), str(drops / "second.csv")]
+    assert watcher.poll_once() == []
+
+    (tmp_path / "cba.csv").write_text(open(CBA, encoding="utf-8").read() + "\n", encoding="utf-8")
+    shutil.copy(PRODUCT, drops / "third.csv")
+    summaries = watcher.poll_once()
+
+    assert len(summaries) == 1
+    assert loads[3:] == [config.cba.path, str(drops / "third.csv")]
+
+
+def test_watch_reruns_single_file_when_either_side_changes(tmp_path):
+    """Test that a watched product file is reconciled again after it or the CBA file changes."""
+    product = tmp_path / "product.csv"
+    shutil.copy(PRODUCT, product)
+    watcher = Watcher(load_config(_config(tmp_path, product)), settle_s=0, backfill=True)
+
+    assert len(watcher.poll_once()) == 1
+    assert watcher.poll_once() == []
+
+    (tmp_path / "cba.csv").write_text(open(CBA, encoding="utf-8").read() + "\n", encoding="utf-8")
+    assert len(watcher.poll_once()) == 1
+    assert watcher.runs == 2
+
+
+def test_watch_command_once(tmp_path):
+    """Test that watch --once --backfill reconciles existing files and exits."""
+    drops = tmp_path / "drops"
+    drops.mkdir()
+    shutil.copy(PRODUCT, drops / "first.csv")
+    config = _config(tmp_path, drops)
+
+    result = CliRunner().invoke(app, ["watch", config, "--once", "--backfill", "--settle", "0"])
+
+    assert result.exit_code == 0, result.output
+    assert "matched, artifacts in" in result.output
+    assert "Stopped after 1 runs" in result.output